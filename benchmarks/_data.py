@@ -0,0 +1,38 @@
+"""Synthetic inputs for the benchmark scripts (offline, seeded)."""
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+
+def synth_returns(n_days: int = 2520, n_tickers: int = 1, seed: int = 42,
+                  start: str = "2015-07-01") -> pd.DataFrame:
+    """Daily simple returns with a mild AR(1) component; columns T0000, T0001, ..."""
+    rng = np.random.default_rng(seed)
+    vol = rng.uniform(0.005, 0.03, n_tickers)
+    eps = rng.normal(0.0, 1.0, (n_days, n_tickers)) * vol
+    r = np.empty_like(eps)
+    r[0] = eps[0]
+    for t in range(1, n_days):
+        r[t] = 0.1 * r[t - 1] + eps[t]
+    r += rng.uniform(0.0, 0.001, n_tickers)
+    idx = pd.bdate_range(start, periods=n_days)
+    cols = [f"T{i:04d}" for i in range(n_tickers)]
+    return pd.DataFrame(r, index=idx, columns=cols)
+
+
+def synth_prices(n_days: int = 2520, n_tickers: int = 1, seed: int = 42,
+                 start: str = "2015-07-01") -> pd.DataFrame:
+    """Adjusted close paths starting at 100, compounded from ``synth_returns``."""
+    return 100.0 * (1.0 + synth_returns(n_days, n_tickers, seed, start)).cumprod()
+
+
+def synth_frames(n_days: int = 2520, n_tickers: int = 3, seed: int = 42,
+                 start: str = "2015-07-01") -> list:
+    """Per-ticker raw OHLCV frames with a Ticker column, as ``DataLoader.load_all_list`` returns."""
+    px = synth_prices(n_days, n_tickers, seed, start)
+    frames = []
+    for t in px.columns:
+        p = px[t].to_numpy()
+        frames.append(pd.DataFrame({"Date": px.index, "Open": p, "High": p, "Low": p, "Close": p,
+                                    "Adj Close": p, "Volume": 1e6, "Ticker": t}))
+    return frames
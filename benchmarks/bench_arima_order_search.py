@@ -0,0 +1,38 @@
+"""Wall-clock scaling of ARIMAModel.select_order with the number of worker processes.
+
+    python -m benchmarks.bench_arima_order_search --days 2520 --max-workers 8
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+import warnings
+
+from src.models.arima_model import ARIMAModel
+from ._data import synth_returns
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=2520)  # ~10 years of trading days
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")
+
+    y = synth_returns(n_days=args.days, n_tickers=1).iloc[:, 0]
+    workers = sorted({1, *[2 ** k for k in range(1, 8) if 2 ** k < args.max_workers], args.max_workers})
+
+    base = None
+    print(f"series length={len(y)}, grid=4x2x4, cpus={os.cpu_count()}")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}  order")
+    for n in workers:
+        m = ARIMAModel(n_jobs=n)
+        t0 = time.perf_counter()
+        order = m.select_order(y)
+        dt = time.perf_counter() - t0
+        base = base or dt
+        print(f"{n:>8} {dt:>9.2f} {base / dt:>8.2f}  {order}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Monte Carlo simulation from a fitted ARIMA: paths x steps throughput and memory.
+
+    python -m benchmarks.bench_arima_simulate --paths 10000 100000 --steps 252
+"""
+from __future__ import annotations
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from src.forecast import ARIMAForecaster, ForecastRequest
+from ._data import synth_returns
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--paths", type=int, nargs="+", default=[10000, 100000])
+    ap.add_argument("--steps", type=int, default=252)
+    ap.add_argument("--chunk", type=int, default=4096)
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")
+
+    s = synth_returns(n_days=1260).iloc[:, 0]
+    req = ForecastRequest(steps=args.steps, grid_p=range(0, 3), grid_d=range(0, 2), grid_q=range(0, 3))
+    fc = ARIMAForecaster(req).fit(s)
+    print(f"order {fc.model.order}")
+    print(f"{'paths':>8} {'dtype':>8} {'simulate s':>11} {'full result s':>14} {'paths MiB':>10}")
+    for n in args.paths:
+        for dtype in (np.float64, np.float32):
+            t0 = time.perf_counter()
+            sims = fc.model.simulate(args.steps, n_paths=n, seed=0, dtype=dtype, chunk=args.chunk)
+            t_sim = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            fc.simulate(s, 100.0, s.index[-1], n_paths=n, seed=0, dtype=dtype, chunk=args.chunk)
+            t_all = time.perf_counter() - t0
+            print(f"{n:>8} {np.dtype(dtype).name:>8} {t_sim:>11.3f} {t_all:>14.3f} {sims.nbytes / 2 ** 20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
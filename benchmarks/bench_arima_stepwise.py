@@ -0,0 +1,37 @@
+"""Exhaustive grid vs stepwise order search in ARIMAModel.select_order.
+
+    python -m benchmarks.bench_arima_stepwise --days 2520 --max-pq 5
+"""
+from __future__ import annotations
+import argparse
+import time
+import warnings
+
+from src.models.arima_model import ARIMAModel
+from ._data import synth_returns
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=2520)
+    ap.add_argument("--max-pq", type=int, default=5)
+    ap.add_argument("--n-jobs", type=int, default=1)
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")
+
+    y = synth_returns(n_days=args.days, n_tickers=1).iloc[:, 0]
+    grid = dict(grid_p=range(0, args.max_pq + 1), grid_d=range(0, 2), grid_q=range(0, args.max_pq + 1))
+
+    print(f"series length={len(y)}, grid=p,q<={args.max_pq}, d<=1")
+    print(f"{'search':>9} {'seconds':>9} {'fitted':>7} {'pruned':>7} {'avoided':>8}  order")
+    for search in ("grid", "stepwise"):
+        m = ARIMAModel(search=search, n_jobs=args.n_jobs, **grid)
+        t0 = time.perf_counter()
+        order = m.select_order(y)
+        dt = time.perf_counter() - t0
+        st = m.search_stats
+        print(f"{search:>9} {dt:>9.2f} {st['fitted']:>7} {st['pruned']:>7} {st['fits_avoided']:>8}  {order}")
+
+
+if __name__ == "__main__":
+    main()
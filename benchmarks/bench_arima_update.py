@@ -0,0 +1,48 @@
+"""Per-day latency of ARIMAModel.update vs a full refit when one new return arrives.
+
+    python -m benchmarks.bench_arima_update --days 2000 --new-days 20
+"""
+from __future__ import annotations
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from src.models.arima_model import ARIMAModel
+from ._data import synth_returns
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=2000)
+    ap.add_argument("--new-days", type=int, default=20)
+    ap.add_argument("--order", type=int, nargs=3, default=(2, 0, 2))
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")
+
+    y = synth_returns(n_days=args.days + args.new_days, n_tickers=1).iloc[:, 0]
+    order = tuple(args.order)
+    train, new = y.iloc[:args.days], y.iloc[args.days:]
+
+    refit_t = []
+    for i in range(len(new)):
+        t0 = time.perf_counter()
+        ARIMAModel(order=order).fit(y.iloc[:args.days + i + 1])
+        refit_t.append(time.perf_counter() - t0)
+
+    m = ARIMAModel(order=order, drift_threshold=None).fit(train)
+    update_t = []
+    for v in new:
+        t0 = time.perf_counter()
+        m.update([v])
+        update_t.append(time.perf_counter() - t0)
+
+    print(f"history={args.days}, new days={args.new_days}, order={order}")
+    print(f"full refit per day : {1e3 * np.median(refit_t):9.2f} ms (median)")
+    print(f"update per day     : {1e3 * np.median(update_t):9.2f} ms (median)")
+    print(f"speedup            : {np.median(refit_t) / np.median(update_t):9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Backtester.run_batch over a weights matrix vs one Backtester.run per strategy.
+
+    python -m benchmarks.bench_backtest_batch --years 5 --assets 100 --strategies 2000
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.backtester import Backtester, BacktestConfig
+from ._data import synth_returns
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--years", type=int, default=5)
+    ap.add_argument("--assets", type=int, default=100)
+    ap.add_argument("--strategies", type=int, default=2000)
+    ap.add_argument("--loop-sample", type=int, default=50)  # per-call timing is extrapolated
+    ap.add_argument("--rebalance", default="monthly")
+    args = ap.parse_args()
+
+    R = synth_returns(n_days=252 * args.years, n_tickers=args.assets)
+    rng = np.random.default_rng(0)
+    W = pd.DataFrame(rng.dirichlet(np.ones(args.assets), args.strategies), columns=R.columns)
+    cfg = BacktestConfig(start=str(R.index[0].date()), end=str(R.index[-1].date()), rebalance=args.rebalance)
+    bt = Backtester(R, cfg)
+    bench = {R.columns[0]: 1.0}
+
+    t0 = time.perf_counter()
+    for i in range(args.loop_sample):
+        bt.run(strategy_weights=W.iloc[i].to_dict(), benchmark_weights=bench)
+    per_call = (time.perf_counter() - t0) / args.loop_sample
+
+    t0 = time.perf_counter()
+    stats = bt.run_batch(W)
+    batch = time.perf_counter() - t0
+
+    print(f"days={len(R)}, assets={args.assets}, strategies={args.strategies}, rebalance={args.rebalance}")
+    print(f"run() loop (extrapolated) : {per_call * args.strategies:9.2f} s")
+    print(f"run_batch()               : {batch:9.2f} s")
+    print(f"speedup                   : {per_call * args.strategies / batch:9.1f}x")
+    print(stats.describe().loc[["mean", "min", "max"]])
+
+
+if __name__ == "__main__":
+    main()
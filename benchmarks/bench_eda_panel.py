@@ -0,0 +1,51 @@
+"""Per-series EDAAnalyzer calls vs the panel methods over a wide returns frame.
+
+    python -m benchmarks.bench_eda_panel --tickers 500 --days 2520 --jobs 4
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+import warnings
+
+import numpy as np
+
+from src.eda import EDAAnalyzer
+from ._data import synth_returns
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tickers", type=int, default=500)
+    ap.add_argument("--days", type=int, default=2520)
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--adf-tickers", type=int, default=100, help="subset for the (slow) serial ADF loop")
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")
+
+    df = synth_returns(n_days=args.days, n_tickers=args.tickers)
+    df.iloc[: args.days // 5, : args.tickers // 10] = np.nan  # late listings
+    sub = df.iloc[:, : args.adf_tickers]
+
+    rows = [
+        ("rolling stats", lambda: [EDAAnalyzer.rolling_stats(df[c]) for c in df.columns],
+         lambda: EDAAnalyzer.rolling_stats_panel(df)),
+        ("risk (sharpe+var)", lambda: [(EDAAnalyzer.sharpe(df[c]), EDAAnalyzer.var_95(df[c])) for c in df.columns],
+         lambda: EDAAnalyzer.risk_panel(df)),
+        (f"adf x{sub.shape[1]}", lambda: [EDAAnalyzer.adf_test(sub[c]) for c in sub.columns],
+         lambda: EDAAnalyzer.adf_panel(sub, n_jobs=args.jobs)),
+    ]
+    print(f"{'case':>18} {'per-series s':>13} {'panel s':>8} {'speedup':>8}")
+    for name, loop, panel in rows:
+        a, b = _time(loop), _time(panel)
+        print(f"{name:>18} {a:>13.3f} {b:>8.3f} {a / b:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""FeatureEngineer.pipeline vs pipeline_chunked: wall time and peak traced memory.
+
+    python -m benchmarks.bench_features_streaming --tickers 500 2000 --days 2520 --chunk 256
+"""
+from __future__ import annotations
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.config import Settings
+from src.features import FeatureEngineer
+from ._data import synth_returns
+
+
+def _measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    out = fn()
+    dt = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, dt, peak / 2 ** 20
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tickers", type=int, nargs="+", default=[500, 2000])
+    ap.add_argument("--days", type=int, default=2520)
+    ap.add_argument("--chunk", type=int, default=256)
+    args = ap.parse_args()
+
+    print(f"{'N':>6} {'mode':>8} {'seconds':>8} {'peak MiB':>9} {'output MiB':>11}")
+    for n in args.tickers:
+        px = 100 * (1 + synth_returns(n_days=args.days, n_tickers=n, seed=n)).cumprod()
+        # one raw frame per ticker, as the loaders return them
+        raw = {t: pd.DataFrame({"Date": px.index, "Adj Close": px[t].to_numpy(), "Ticker": t,
+                                "Open": np.nan, "High": np.nan, "Low": np.nan, "Close": np.nan, "Volume": 0.0})
+               for t in px.columns}
+        del px
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = Settings(data_raw_dir=Path(tmp) / "raw", data_processed_dir=Path(tmp) / "processed",
+                           reports_figures_dir=Path(tmp) / "figs", data_format="parquet")
+            fe = FeatureEngineer(cfg)
+            out, dt, peak = _measure(lambda: fe.add_returns(fe.merge_clean(list(raw.values()))))
+            print(f"{n:>6} {'memory':>8} {dt:>8.2f} {peak:>9.1f} {out.to_numpy().nbytes / 2 ** 20:>11.1f}")
+            del out
+            store, dt, peak = _measure(lambda: fe.pipeline_chunked(raw.__getitem__, list(raw), chunk_size=args.chunk))
+            print(f"{n:>6} {'chunked':>8} {dt:>8.2f} {peak:>9.1f} {store.values.nbytes / 2 ** 20:>11.1f}")
+            del store
+
+
+if __name__ == "__main__":
+    main()
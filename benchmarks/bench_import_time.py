@@ -0,0 +1,91 @@
+"""Cold import time of each public module, measured with ``python -X importtime``.
+
+    python -m benchmarks.bench_import_time                      # report
+    python -m benchmarks.bench_import_time --save base.json     # record a baseline
+    python -m benchmarks.bench_import_time --baseline base.json # exit 1 on regressions
+
+A module regresses when it is slower than ``--threshold`` x its baseline (and
+by at least ``--min-ms``) or when it newly imports one of the heavy packages.
+"""
+from __future__ import annotations
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+MODULES = [
+    "src.config", "src.data_loader", "src.storage", "src.features", "src.shared", "src.eda",
+    "src.splits", "src.forecast", "src.batch_forecast", "src.evaluation",
+    "src.models.arima_model", "src.models.arima_cache", "src.models.lstm_model", "src.models.windows",
+    "src.portfolio.optimizer", "src.portfolio.frontier", "src.portfolio.covariance", "src.portfolio.rolling",
+    "src.backtest.backtester", "src.utils.metrics", "src.utils.plotting", "src.utils.instrument",
+    "src.utils.online", "src.pipeline",
+]
+HEAVY = ["tensorflow", "cvxpy", "pypfopt", "statsmodels", "matplotlib", "yfinance", "scipy"]
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def measure(module: str, repeat: int = 3) -> Dict[str, object]:
+    """Best-of-``repeat`` cumulative import time (ms) and the heavy packages it loaded."""
+    best, heavy = float("inf"), []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=ROOT, capture_output=True, text=True, check=True)
+        total, loaded = 0, set()
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            parts = [p.strip() for p in line[len("import time:"):].split("|")]
+            if not parts[1].isdigit():
+                continue  # header row
+            name = parts[2].strip()
+            if name == module:
+                total = int(parts[1])
+            loaded.add(name.split(".")[0])
+        best = min(best, total / 1000.0)
+        heavy = sorted(loaded & set(HEAVY))
+    return {"ms": round(best, 1), "heavy": heavy}
+
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], threshold: float, min_ms: float) -> List[str]:
+    problems = []
+    for mod, cur in current.items():
+        base = baseline.get(mod)
+        if base is None:
+            continue
+        if cur["ms"] > base["ms"] * threshold and cur["ms"] - base["ms"] > min_ms:
+            problems.append(f"{mod}: {base['ms']:.1f} -> {cur['ms']:.1f} ms")
+        new_heavy = sorted(set(cur["heavy"]) - set(base["heavy"]))
+        if new_heavy:
+            problems.append(f"{mod}: now imports {', '.join(new_heavy)}")
+    return problems
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--modules", nargs="+", default=MODULES)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--save", type=Path)
+    ap.add_argument("--baseline", type=Path)
+    ap.add_argument("--threshold", type=float, default=1.5)
+    ap.add_argument("--min-ms", type=float, default=50.0)
+    args = ap.parse_args()
+
+    current = {}
+    print(f"{'module':>26} {'ms':>8}  heavy")
+    for mod in args.modules:
+        current[mod] = measure(mod, args.repeat)
+        print(f"{mod:>26} {current[mod]['ms']:>8.1f}  {', '.join(current[mod]['heavy']) or '-'}")
+    if args.save:
+        args.save.write_text(json.dumps(current, indent=2))
+    if args.baseline:
+        problems = compare(current, json.loads(args.baseline.read_text()), args.threshold, args.min_ms)
+        for p in problems:
+            print("REGRESSION", p)
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Per-call overhead of the instrumentation hooks, disabled vs enabled.
+
+    python -m benchmarks.bench_instrument --calls 1000000
+"""
+from __future__ import annotations
+import argparse
+import time
+
+from src.utils import instrument
+
+
+def _plain(x):
+    return x
+
+
+@instrument.timed("bench.timed")
+def _timed(x):
+    return x
+
+
+def _stage(x):
+    with instrument.stage("bench.stage"):
+        return x
+
+
+def _count(x):
+    instrument.count("bench.count")
+    return x
+
+
+def _ns_per_call(fn, calls: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - t0) / calls * 1e9
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    base = _ns_per_call(_plain, args.calls)
+    print(f"plain call: {base:.0f} ns")
+    print(f"{'hook':>8} {'disabled +ns':>13} {'enabled +ns':>12}")
+    for name, fn in (("count", _count), ("stage", _stage), ("timed", _timed)):
+        off = _ns_per_call(fn, args.calls) - base
+        with instrument.session():
+            on = _ns_per_call(fn, args.calls) - base
+        print(f"{name:>8} {off:>13.0f} {on:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""LSTM recursive forecast latency: per-step predict() loop vs forecast_batch.
+
+    python -m benchmarks.bench_lstm_forecast --steps 126 --series 1 32 --mc 100
+
+Requires TensorFlow; the model is trained for one epoch only, since latency
+does not depend on the weights.
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import numpy as np
+
+from src.models.lstm_model import LSTMModel, TENSORFLOW_AVAILABLE
+from ._data import synth_returns
+
+
+def _predict_loop(m: LSTMModel, history: np.ndarray, steps: int) -> np.ndarray:
+    # the original LSTMModel.forecast
+    preds = []
+    window = history[-m.lookback:].reshape(1, m.lookback, 1)
+    for _ in range(steps):
+        yhat = float(m.model.predict(window, verbose=0)[0, 0])
+        preds.append(yhat)
+        new_seq = np.concatenate([window.reshape(-1, 1)[1:], np.array([[yhat]])], axis=0)
+        window = new_seq.reshape(1, m.lookback, 1)
+    return np.array(preds, dtype=float)
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--steps", type=int, default=126)
+    ap.add_argument("--series", type=int, nargs="+", default=[1, 32])
+    ap.add_argument("--mc", type=int, default=100)
+    ap.add_argument("--lookback", type=int, default=60)
+    args = ap.parse_args()
+    if not TENSORFLOW_AVAILABLE:
+        print("TensorFlow not available; nothing to benchmark.")
+        return
+
+    r = synth_returns(n_days=1260, n_tickers=max(args.series)).to_numpy().T
+    m = LSTMModel(lookback=args.lookback, units=32).fit(r[0], epochs=1)
+    m.forecast_batch(r[:1], 2)  # trace once, outside the timings
+
+    print(f"{'series':>7} {'mode':>14} {'seconds':>8}")
+    for b in args.series:
+        t_loop = _time(lambda: [_predict_loop(m, h, args.steps) for h in r[:b]])
+        t_fast = _time(lambda: m.forecast_batch(r[:b], args.steps))
+        print(f"{b:>7} {'predict loop':>14} {t_loop:>8.3f}")
+        print(f"{b:>7} {'batched':>14} {t_fast:>8.3f}   ({t_loop / t_fast:.0f}x)")
+    t_mc = _time(lambda: m.forecast_batch(r[:1], args.steps, mc_samples=args.mc))
+    print(f"{1:>7} {f'mc x{args.mc}':>14} {t_mc:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
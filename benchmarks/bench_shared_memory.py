@@ -0,0 +1,90 @@
+"""Worker memory: pickled returns DataFrame vs memory-mapped SharedReturns.
+
+Each worker of a spawned process pool receives the full returns matrix and
+scans every column (as a per-ticker job would over its slice). Reports the
+growth in anonymous (private, non-reclaimable) memory and RSS of each worker
+from /proc/self/smaps_rollup, summed over workers. Mapped pages show up in RSS
+but are page cache shared by all workers.
+
+    python -m benchmarks.bench_shared_memory --workers 8 --tickers 500 --days 2520
+"""
+from __future__ import annotations
+import argparse
+import pickle
+import multiprocessing as mp
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.shared import SharedReturns
+from ._data import synth_returns
+
+
+def _mem_kib() -> dict:
+    out = {}
+    with open("/proc/self/smaps_rollup") as fh:
+        for line in fh:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Anonymous"):
+                out[key] = int(rest.split()[0])
+    return out
+
+
+_BASE: dict = {}
+
+
+def _scan(data) -> float:
+    frame = data.to_frame() if isinstance(data, SharedReturns) else data
+    return sum(float(frame[c].to_numpy().sum()) for c in frame.columns)
+
+
+def _warm(data) -> None:
+    # run the same code on a tiny input so lazy imports/caches are not counted
+    _scan(data)
+    time.sleep(0.2)  # hold the worker so each one takes exactly one warm-up task
+    _BASE.update(_mem_kib())
+
+
+def _job(data) -> dict:
+    _scan(data)
+    time.sleep(0.2)
+    now = _mem_kib()
+    return {k: now[k] - _BASE[k] for k in now}
+
+
+def _run(data, tiny, workers: int) -> tuple:
+    ctx = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        list(pool.map(_warm, [tiny] * workers))
+        t0 = time.perf_counter()
+        stats = list(pool.map(_job, [data] * workers))
+        dt = time.perf_counter() - t0
+    anon = sum(s["Anonymous"] for s in stats) / 1024
+    rss = sum(s["Rss"] for s in stats) / 1024
+    return anon, rss, dt
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--tickers", type=int, default=500)
+    ap.add_argument("--days", type=int, default=2520)
+    args = ap.parse_args()
+
+    df = synth_returns(n_days=args.days, n_tickers=args.tickers)
+    print(f"matrix {df.shape}: {df.to_numpy().nbytes / 2 ** 20:.1f} MiB, "
+          f"pickled frame {len(pickle.dumps(df)) / 2 ** 20:.1f} MiB")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SharedReturns.create(df, Path(tmp) / "returns")
+        print(f"pickled store: {len(pickle.dumps(store))} bytes")
+        print(f"{'mode':>10} {'+anon MiB (sum)':>16} {'+rss MiB (sum)':>15} {'wall s':>7}")
+        tiny_df = df.iloc[:5, :5]
+        tiny_store = SharedReturns.create(tiny_df, Path(tmp) / "tiny")
+        for name, data, tiny in (("dataframe", df, tiny_df), ("shared", store, tiny_store)):
+            anon, rss, dt = _run(data, tiny, args.workers)
+            print(f"{name:>10} {anon:>16.1f} {rss:>15.1f} {dt:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
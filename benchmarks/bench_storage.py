@@ -0,0 +1,75 @@
+"""CSV vs Parquet price cache: full load, column projection and date-range reads.
+
+    python -m benchmarks.bench_storage --tickers 50 --days 2520
+"""
+from __future__ import annotations
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.config import Settings
+from src.data_loader import DataLoader
+from src.features import FeatureEngineer
+from ._data import synth_returns
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tickers", type=int, default=50)
+    ap.add_argument("--days", type=int, default=2520)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    r = synth_returns(n_days=args.days, n_tickers=args.tickers)
+    px = 100 * (1 + r).cumprod()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        kw = dict(data_raw_dir=root / "raw", data_processed_dir=root / "processed",
+                  reports_figures_dir=root / "figs", tickers=list(px.columns))
+        csv_cfg, pq_cfg = Settings(**kw), Settings(**kw, data_format="parquet")
+        csv_cfg.data_raw_dir.mkdir(parents=True)
+        csv_cfg.data_processed_dir.mkdir(parents=True)
+        for t in px.columns:
+            p = px[t].to_numpy()
+            pd.DataFrame({"Date": px.index, "Open": p, "High": p, "Low": p, "Close": p,
+                          "Adj Close": p, "Volume": 1e6}).to_csv(csv_cfg.data_raw_dir / f"{t}.csv", index=False)
+        csv_dl, pq_dl = DataLoader(csv_cfg), DataLoader(pq_cfg)
+        t0 = time.perf_counter()
+        pq_dl.migrate_to_parquet()
+        print(f"migrate {args.tickers} tickers: {time.perf_counter() - t0:.3f}s")
+
+        mid = str(px.index[len(px) * 3 // 4].date())
+        cases = {
+            "load_all": lambda dl: dl.load_all(),
+            "adj_close_only": lambda dl: [dl.load(t, columns=["Adj Close"]) for t in px.columns],
+            "last_quarter": lambda dl: [dl.load(t, columns=["Adj Close"], start=mid) for t in px.columns],
+        }
+        print(f"{'case':>16} {'csv s':>8} {'parquet s':>10} {'speedup':>8}")
+        for name, fn in cases.items():
+            a = _best_of(lambda: fn(csv_dl), args.repeat)
+            b = _best_of(lambda: fn(pq_dl), args.repeat)
+            print(f"{name:>16} {a:>8.3f} {b:>10.3f} {a / b:>7.1f}x")
+
+        feats = FeatureEngineer(csv_cfg).add_returns(px)
+        for cfg in (csv_cfg, pq_cfg):
+            fe = FeatureEngineer(cfg)
+            fe.save(feats)
+            dt = _best_of(lambda: fe.load(), args.repeat)
+            print(f"features reload ({cfg.data_format}): {dt:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
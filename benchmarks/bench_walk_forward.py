@@ -0,0 +1,39 @@
+"""Walk-forward ARIMA evaluation: wall clock vs number of worker processes.
+
+    python -m benchmarks.bench_walk_forward --days 2520 --origins 250 --max-workers 8
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+import warnings
+
+from src.evaluation import WalkForwardEvaluator
+from src.splits import RollingOriginSplitter
+from ._data import synth_returns
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=2520)
+    ap.add_argument("--origins", type=int, default=250)
+    ap.add_argument("--horizon", type=int, default=21)
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")
+
+    y = synth_returns(n_days=args.days, n_tickers=1).iloc[:, 0]
+    initial = args.days - args.origins - args.horizon + 1
+    sp = RollingOriginSplitter(initial=initial, horizon=args.horizon, step=1)
+    kw = dict(grid_p=range(0, 3), grid_d=range(0, 1), grid_q=range(0, 3))
+
+    print(f"series length={len(y)}, folds={len(sp.fold_bounds(len(y)))}, horizon={args.horizon}")
+    print(f"{'workers':>8} {'seconds':>9} {'mean rmse':>10}")
+    for n in sorted({1, args.max_workers}):
+        t0 = time.perf_counter()
+        res = WalkForwardEvaluator(sp, model="arima", n_jobs=n, model_kwargs=kw).run(y)
+        print(f"{n:>8} {time.perf_counter() - t0:>9.2f} {res.folds['rmse'].mean():>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
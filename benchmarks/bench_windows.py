@@ -0,0 +1,48 @@
+"""LSTM window construction: Python loop (old _make_windows) vs strided views.
+
+    python -m benchmarks.bench_windows --days 2520 25200 --lookback 5 60
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import numpy as np
+
+from src.models.windows import WindowBatches, make_windows
+from ._data import synth_returns
+
+
+def _loop(arr: np.ndarray, lookback: int, horizon: int):
+    X, y = [], []
+    for i in range(len(arr) - lookback - horizon + 1):
+        X.append(arr[i:i + lookback, 0])
+        y.append(arr[i + lookback:i + lookback + horizon, 0])
+    return np.array(X).reshape(-1, lookback, 1), np.array(y).reshape(-1, horizon)
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, nargs="+", default=[2520, 25200])
+    ap.add_argument("--lookback", type=int, nargs="+", default=[5, 60])
+    ap.add_argument("--horizon", type=int, default=1)
+    args = ap.parse_args()
+
+    print(f"{'T':>7} {'L':>4} {'loop s':>8} {'view s':>8} {'batched s':>10} {'loop MiB':>9}")
+    for n in args.days:
+        arr = synth_returns(n_days=n).to_numpy()
+        for lb in args.lookback:
+            t_loop = _time(lambda: _loop(arr, lb, args.horizon))
+            t_view = _time(lambda: make_windows(arr, lb, args.horizon))
+            t_batch = _time(lambda: sum(1 for _ in WindowBatches(arr, lb, args.horizon, batch_size=256)))
+            mib = (n - lb) * lb * 8 / 2 ** 20
+            print(f"{n:>7} {lb:>4} {t_loop:>8.4f} {t_view:>8.5f} {t_batch:>10.4f} {mib:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Reproducible benchmark suite for the package hot paths (offline, CPU only).
+
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run --out base.json            # full parameter grid
+    python -m benchmarks.suite run --quick --filter backtest  # small sizes, subset
+    python -m benchmarks.suite run --baseline base.json --out new.json
+    python -m benchmarks.suite compare base.json new.json --threshold 0.2
+
+Each case is registered with ``@case`` and a grid of parameters (days,
+tickers, horizon, ...). ``setup(**params)`` builds synthetic inputs untimed and
+returns the callable to time, or a ``(callable, cleanup)`` pair when it
+holds resources such as a temporary directory; every parameter set is warmed up once and then
+timed ``repeat`` times. Results are JSON keyed by ``name[k=v,...]`` with the
+min and median seconds plus environment metadata. ``compare`` flags a
+regression when the new median exceeds the baseline median by more than
+``threshold`` (relative) and exits 1, so it can gate CI.
+"""
+from __future__ import annotations
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ._data import synth_frames, synth_returns
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[..., Callable[[], object]]
+    params: List[Dict[str, int]]
+    quick: List[Dict[str, int]]
+    repeat: int = 5
+    requires: Optional[str] = None  # importable module needed (e.g. "tensorflow")
+
+
+REGISTRY: Dict[str, Case] = {}
+
+
+def case(name: str, params: List[Dict[str, int]], quick: Optional[List[Dict[str, int]]] = None,
+         repeat: int = 5, requires: Optional[str] = None):
+    def register(setup):
+        REGISTRY[name] = Case(name, setup, params, quick or params[:1], repeat, requires)
+        return setup
+    return register
+
+
+def key(name: str, params: Dict[str, int]) -> str:
+    return f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+
+# ---- cases -------------------------------------------------------------------
+
+@case("arima.select_order",
+      params=[{"days": 500, "max_pq": 3}, {"days": 2520, "max_pq": 3}],
+      quick=[{"days": 300, "max_pq": 1}], repeat=3)
+def _arima_select_order(days: int, max_pq: int):
+    from src.models.arima_model import ARIMAModel
+    y = synth_returns(n_days=days).iloc[:, 0]
+    grid = range(0, max_pq + 1)
+    return lambda: ARIMAModel(grid_p=grid, grid_d=range(0, 2), grid_q=grid).select_order(y)
+
+
+@case("arima.simulate",
+      params=[{"paths": 10000, "horizon": 252}, {"paths": 100000, "horizon": 252}],
+      quick=[{"paths": 1000, "horizon": 63}])
+def _arima_simulate(paths: int, horizon: int):
+    from src.models.arima_model import ARIMAModel
+    m = ARIMAModel(order=(1, 0, 1)).fit(synth_returns(n_days=1260).iloc[:, 0])
+    return lambda: m.simulate(horizon, n_paths=paths, seed=0)
+
+
+@case("backtest.simulate_path",
+      params=[{"days": 2520, "tickers": 3}, {"days": 5040, "tickers": 500}],
+      quick=[{"days": 504, "tickers": 3}])
+def _backtest_simulate_path(days: int, tickers: int):
+    from src.backtest.backtester import Backtester
+    R = synth_returns(n_days=days, n_tickers=tickers)
+    w = dict(zip(R.columns, np.full(tickers, 1.0 / tickers)))
+    bt = Backtester(R)
+    return lambda: bt._simulate_path(R, w, "monthly")
+
+
+@case("portfolio.efficient_frontier",
+      params=[{"tickers": 20, "points": 50}, {"tickers": 200, "points": 500}],
+      quick=[{"tickers": 10, "points": 20}])
+def _efficient_frontier(tickers: int, points: int):
+    from src.portfolio.optimizer import PortfolioInputs, PortfolioOptimizer
+    R = synth_returns(n_days=1260, n_tickers=tickers)
+    inputs = PortfolioInputs(list(R.columns), R.mean() * 252, R.cov() * 252, 0.02)
+    opt = PortfolioOptimizer(rf_rate=0.02)
+    return lambda: opt.efficient_frontier(inputs, n_points=points)
+
+
+@case("features.pipeline",
+      params=[{"days": 2520, "tickers": 3}, {"days": 2520, "tickers": 200}],
+      quick=[{"days": 504, "tickers": 3}], repeat=3)
+def _features_pipeline(days: int, tickers: int):
+    from src.config import Settings
+    from src.features import FeatureEngineer
+    frames = synth_frames(n_days=days, n_tickers=tickers)
+    tmp = tempfile.TemporaryDirectory(prefix="bench_features_")
+    root = Path(tmp.name)
+    fe = FeatureEngineer(Settings(data_raw_dir=root / "raw", data_processed_dir=root / "processed",
+                                  reports_figures_dir=root / "figs"))
+    return (lambda: fe.pipeline(frames)), tmp.cleanup
+
+
+@case("lstm.forecast",
+      params=[{"lookback": 60, "horizon": 126}], quick=[{"lookback": 20, "horizon": 21}],
+      repeat=3, requires="tensorflow")
+def _lstm_forecast(lookback: int, horizon: int):
+    from src.models.lstm_model import LSTMModel
+    s = synth_returns(n_days=756).iloc[:, 0]
+    m = LSTMModel(lookback=lookback, units=32).fit(s, epochs=1)
+    return lambda: m.forecast(s, steps=horizon)
+
+
+# ---- runner ------------------------------------------------------------------
+
+def _meta() -> Dict[str, object]:
+    import pandas as pd
+    return {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+            "platform": platform.platform(), "cpus": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def run(names: Optional[List[str]] = None, quick: bool = False, log=print) -> Dict[str, object]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # statsmodels convergence noise
+        results = _run_cases(names, quick, log)
+    return {"meta": _meta(), "quick": quick, "results": results}
+
+
+def _run_cases(names: Optional[List[str]], quick: bool, log) -> Dict[str, Dict[str, object]]:
+    results: Dict[str, Dict[str, object]] = {}
+    for name, c in REGISTRY.items():
+        if names and not any(n in name for n in names):
+            continue
+        for params in (c.quick if quick else c.params):
+            k = key(name, params)
+            if c.requires and importlib.util.find_spec(c.requires) is None:
+                results[k] = {"skipped": f"{c.requires} not installed"}
+                log(f"{k:<58} skipped ({c.requires} not installed)")
+                continue
+            fn = c.setup(**params)
+            cleanup = None
+            if isinstance(fn, tuple):
+                fn, cleanup = fn
+            try:
+                fn()  # warm-up: lazy imports, caches, JIT/tracing
+                times = []
+                for _ in range(c.repeat):
+                    t0 = time.perf_counter()
+                    fn()
+                    times.append(time.perf_counter() - t0)
+            finally:
+                if cleanup is not None:
+                    cleanup()
+            results[k] = {"min": min(times), "median": statistics.median(times), "repeat": c.repeat}
+            log(f"{k:<58} median {results[k]['median']:.4f}s  min {results[k]['min']:.4f}s")
+    return results
+
+
+def compare(base: Dict[str, object], new: Dict[str, object], threshold: float = 0.2) -> List[Dict[str, object]]:
+    """Rows of (key, base, new, ratio, status) for cases timed in both runs."""
+    rows = []
+    for k, b in base["results"].items():
+        n = new["results"].get(k)
+        if n is None or "median" not in b or "median" not in n:
+            continue
+        ratio = n["median"] / b["median"] if b["median"] > 0 else float("inf")
+        status = "REGRESSION" if ratio > 1 + threshold else ("faster" if ratio < 1 / (1 + threshold) else "ok")
+        rows.append({"key": k, "base": b["median"], "new": n["median"], "ratio": ratio, "status": status})
+    return rows
+
+
+def report(rows: List[Dict[str, object]], threshold: float) -> int:
+    print(f"\n{'case':<58} {'base s':>9} {'new s':>9} {'ratio':>7}  status (threshold +{threshold:.0%})")
+    for r in rows:
+        print(f"{r['key']:<58} {r['base']:>9.4f} {r['new']:>9.4f} {r['ratio']:>7.2f}  {r['status']}")
+    bad = [r for r in rows if r["status"] == "REGRESSION"]
+    print(f"\n{len(bad)} regression(s) in {len(rows)} comparable case(s)")
+    return 1 if bad else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("list")
+    p_run = sub.add_parser("run")
+    p_run.add_argument("--quick", action="store_true")
+    p_run.add_argument("--filter", nargs="+")
+    p_run.add_argument("--out", type=Path)
+    p_run.add_argument("--baseline", type=Path)
+    p_run.add_argument("--threshold", type=float, default=0.2)
+    p_cmp = sub.add_parser("compare")
+    p_cmp.add_argument("base", type=Path)
+    p_cmp.add_argument("new", type=Path)
+    p_cmp.add_argument("--threshold", type=float, default=0.2)
+    args = ap.parse_args(argv)
+
+    if args.cmd == "list":
+        for name, c in REGISTRY.items():
+            extra = f"  (requires {c.requires})" if c.requires else ""
+            print(f"{name:<32} {len(c.params)} params, {len(c.quick)} quick{extra}")
+        return 0
+    if args.cmd == "compare":
+        base, new = json.loads(args.base.read_text()), json.loads(args.new.read_text())
+        return report(compare(base, new, args.threshold), args.threshold)
+
+    res = run(args.filter, args.quick)
+    if args.out:
+        args.out.write_text(json.dumps(res, indent=2))
+    if args.baseline:
+        return report(compare(json.loads(args.baseline.read_text()), res, args.threshold), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,61 +1,184 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Optional, Literal
+from typing import Dict, Optional, Literal, Tuple, Union
 import numpy as np
 import pandas as pd
 
+from ..shared import SharedReturns
+
+_CALENDAR_FREQ = {"weekly": "W", "monthly": "M", "quarterly": "Q"}
+
 @dataclass(frozen=True)
 class BacktestConfig:
     start: str = "2024-08-01"
     end: str = "2025-07-31"
-    rebalance: Literal["none", "monthly"] = "none"  # hold or monthly reset to target weights
+    # hold, calendar reset to target weights, or reset once any weight drifts more than `band`
+    rebalance: Literal["none", "weekly", "monthly", "quarterly", "band"] = "none"
     rf_annual: float = 0.045  # annual risk-free for Sharpe
+    band: float = 0.05        # max |weight - target| before a "band" rebalance
+    costs: Union[float, Dict[str, float]] = 0.0  # proportional cost per $ traded (one rate or per asset)
 
 @dataclass(frozen=True)
 class BacktestResult:
     cumrets: pd.DataFrame   # columns: ["strategy","benchmark"]
     daily: pd.DataFrame     # columns: ["strategy","benchmark"]
-    stats: pd.DataFrame     # index: ["strategy","benchmark"], cols: ["annual_ret","annual_vol","sharpe"]
+    stats: pd.DataFrame     # index: ["strategy","benchmark"], cols: ["annual_ret","annual_vol","sharpe","turnover","cost_drag"]
+    turnover: Optional[pd.DataFrame] = None  # one-way turnover per day (0 off rebalance days)
 
 class Backtester:
    
 
-    def __init__(self, returns_df: pd.DataFrame, cfg: Optional[BacktestConfig] = None) -> None:
-       
-        self.returns = returns_df.astype(float).sort_index()
+    def __init__(self, returns_df: Union[pd.DataFrame, SharedReturns],
+                 cfg: Optional[BacktestConfig] = None) -> None:
+        if isinstance(returns_df, SharedReturns):
+            # already sorted float64; a frame over the mapped pages, no copy
+            self.returns = returns_df.to_frame()
+        else:
+            self.returns = returns_df.astype(float).sort_index()
         self.cfg = cfg or BacktestConfig()
 
     @staticmethod
     def _to_period(df: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
         return df.loc[pd.to_datetime(start): pd.to_datetime(end)]
 
-    def _simulate_path(self, ret: pd.DataFrame, weights: Dict[str,float], rebalance: str) -> pd.Series:
-       
-        tickers = list(weights.keys())
-        R = ret[tickers].copy()
-        w = np.array([weights[t] for t in tickers], dtype=float)
-        w = w / w.sum()
+    @staticmethod
+    def _rebalance_mask(index: pd.DatetimeIndex, rebalance: str) -> np.ndarray:
+        """True on days after whose return the sleeves are reset (first day of a new week/month/quarter)."""
+        mask = np.zeros(len(index), dtype=bool)
+        freq = _CALENDAR_FREQ.get(rebalance)
+        if freq is not None and len(index) > 1:
+            key = np.asarray(pd.DatetimeIndex(index).to_period(freq).asi8)
+            mask[1:] = key[1:] != key[:-1]
+        return mask
 
-        # start with $1 split by target weights
+    def _cost_vector(self, tickers) -> Optional[np.ndarray]:
+        c = self.cfg.costs
+        if isinstance(c, dict):
+            vec = np.array([float(c.get(t, 0.0)) for t in tickers], dtype=float)
+        else:
+            vec = np.full(len(tickers), float(c or 0.0))
+        return vec if np.any(vec) else None
+
+    @staticmethod
+    def _run_events(R: np.ndarray, w: np.ndarray, mask: np.ndarray,
+                    costs: Optional[np.ndarray] = None, band: Optional[float] = None,
+                    chunk: int = 63, targets: Optional[Dict[int, np.ndarray]] = None
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Event-driven simulation of $1 held as buy-and-hold segments.
+
+        Each segment is one cumulative product over [alloc_0; 1 + r_t], i.e. the
+        same multiplications as a daily sleeve update, so Python-level work scales
+        with the number of rebalance events, not days. Calendar events come from
+        ``mask``; with ``band`` the segment is scanned ``chunk`` days at a time and
+        ends on the first day any weight drifts past the band. On an event day the
+        recorded PV is net of costs. ``targets`` maps an event row to new target
+        weights (a weights schedule). Returns (pv, one-way turnover, cost/PV) per day.
+        """
+        n = len(R)
+        pv = np.empty(n, dtype=float)
+        turnover = np.zeros(n, dtype=float)
+        paid = np.zeros(n, dtype=float)
+        events = np.flatnonzero(mask)
         alloc = w.copy()  # dollar alloc since PV=1 initially
-        pv_path = []
-        last_month = R.index[0].month
+        a, ei = 0, 0
+        while a < n:
+            while ei < len(events) and events[ei] < a:
+                ei += 1
+            calendar = ei < len(events)
+            stop = events[ei] + 1 if calendar else n
+            step = stop - a if band is None else chunk
+            breach = False
+            while a < stop and not breach:
+                b = min(a + step, stop)
+                seg = 1.0 + R[a:b]
+                seg[0] *= alloc
+                np.cumprod(seg, axis=0, out=seg)
+                tot = seg.sum(axis=1)
+                if band is not None:
+                    drift = np.abs(seg / tot[:, None] - w).max(axis=1)
+                    hit = np.flatnonzero(drift > band)
+                    if hit.size:
+                        b = a + hit[0] + 1
+                        seg, tot = seg[:hit[0] + 1], tot[:hit[0] + 1]
+                        breach = True
+                pv[a:b] = tot
+                alloc = seg[-1]
+                a = b
+            if not (breach or calendar):
+                break
+            # rebalance after day a-1: trade back to target weights, pay costs
+            if targets is not None:
+                w = targets.get(a - 1, w)
+            p = pv[a - 1]
+            trades = np.abs(p * w - alloc)
+            turnover[a - 1] = 0.5 * trades.sum() / p
+            if costs is not None:
+                cost = float(trades @ costs)
+                paid[a - 1] = cost / p
+                p -= cost
+                pv[a - 1] = p
+            alloc = p * w  # reset sleeves to target weights
+        return pv, turnover, paid
 
-        for dt, row in R.iterrows():
-            # update each sleeve by (1 + r_it)
-            alloc = alloc * (1.0 + row.values)
-            pv = float(alloc.sum())
-            pv_path.append(pv)
+    @staticmethod
+    def _pv_path(R: np.ndarray, w: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """PV of $1 held as buy-and-hold segments between calendar rebalance days."""
+        return Backtester._run_events(R, w, mask)[0]
+
+    @staticmethod
+    def _pv_matrix(R: np.ndarray, W: np.ndarray, mask: np.ndarray,
+                   costs: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(pv, turnover, cost/PV), each days x strategies, for W (strategies x assets).
 
-            # rebalance at month change if configured
-            if rebalance == "monthly" and dt.month != last_month:
-                alloc = pv * w  # reset sleeves to target weights
-            last_month = dt.month
+        Same segment scheme as ``_run_events`` with calendar events only: within a
+        segment every strategy holds P_0 * w * cumprod(1 + r), so the whole batch
+        is one matmul per segment.
+        """
+        n, S = len(R), W.shape[0]
+        pv = np.empty((n, S), dtype=float)
+        turnover = np.zeros((n, S), dtype=float)
+        paid = np.zeros((n, S), dtype=float)
+        ends = np.flatnonzero(mask)
+        starts = np.r_[0, ends + 1]
+        stops = np.r_[ends + 1, n]
+        p0 = np.ones(S, dtype=float)
+        for i, (a, b) in enumerate(zip(starts, stops)):
+            if a >= b:
+                continue
+            growth = np.cumprod(1.0 + R[a:b], axis=0)
+            pv[a:b] = (growth @ W.T) * p0
+            if i < len(ends):
+                p = pv[b - 1]
+                trades = np.abs(p[:, None] * W - p0[:, None] * W * growth[-1])
+                turnover[b - 1] = 0.5 * trades.sum(axis=1) / p
+                if costs is not None:
+                    cost = trades @ costs
+                    paid[b - 1] = cost / p
+                    pv[b - 1] = p - cost
+            p0 = pv[b - 1].copy()
+        return pv, turnover, paid
 
-        pv_series = pd.Series(pv_path, index=R.index, name="pv")
+    def _simulate(self, ret: pd.DataFrame, weights: Dict[str,float],
+                  rebalance: Optional[str] = None) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """(daily returns, turnover, cost/PV) for one weight vector under ``self.cfg``."""
+        rebalance = rebalance or self.cfg.rebalance
+        tickers = list(weights.keys())
+        R = ret[tickers]
+        w = np.array([weights[t] for t in tickers], dtype=float)
+        w = w / w.sum()
+
+        mask = self._rebalance_mask(R.index, rebalance)
+        band = self.cfg.band if rebalance == "band" else None
+        pv, turnover, paid = self._run_events(R.to_numpy(dtype=float), w, mask,
+                                              self._cost_vector(tickers), band)
+
+        pv_series = pd.Series(pv, index=R.index, name="pv")
         # convert to daily simple returns from PV path
         daily = pv_series.pct_change().fillna(0.0)
-        return daily
+        return daily, pd.Series(turnover, index=R.index), pd.Series(paid, index=R.index)
+
+    def _simulate_path(self, ret: pd.DataFrame, weights: Dict[str,float], rebalance: str) -> pd.Series:
+        return self._simulate(ret, weights, rebalance)[0]
 
     @staticmethod
     def _annualize(daily_ret: pd.Series, rf_annual: float) -> Dict[str, float]:
@@ -66,6 +189,101 @@ class Backtester:
         sharpe = (ann_ret - rf_annual) / ann_vol if ann_vol > 0 else np.nan
         return {"annual_ret": ann_ret, "annual_vol": ann_vol, "sharpe": sharpe}
 
+    @staticmethod
+    def _annualize_matrix(daily: np.ndarray, rf_annual: float) -> Dict[str, np.ndarray]:
+        # column-wise twin of _annualize (sample std, ddof=1)
+        mu_d = daily.mean(axis=0)
+        sd_d = daily.std(axis=0, ddof=1)
+        ann_ret = (1.0 + mu_d) ** 252 - 1.0
+        ann_vol = sd_d * (252.0 ** 0.5)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(ann_vol > 0, (ann_ret - rf_annual) / ann_vol, np.nan)
+        return {"annual_ret": ann_ret, "annual_vol": ann_vol, "sharpe": sharpe}
+
+    @staticmethod
+    def _trading_stats(turnover, paid, n_days: int) -> Dict[str, float]:
+        # annualized one-way turnover and cost drag (fraction of PV per year)
+        scale = 252.0 / max(n_days, 1)
+        return {"turnover": np.asarray(turnover).sum(axis=0) * scale,
+                "cost_drag": np.asarray(paid).sum(axis=0) * scale}
+
+    def run_batch(self, weights: pd.DataFrame) -> pd.DataFrame:
+        """Simulate every row of ``weights`` (strategies x assets) in one pass.
+
+        Rows are normalized to sum to 1; missing assets count as 0. Returns the
+        stats table (index = strategy, cols: annual_ret, annual_vol, sharpe,
+        turnover, cost_drag). Band rebalancing is path dependent per strategy,
+        so it falls back to one event-driven run per row.
+        """
+        W = pd.DataFrame(weights).astype(float).fillna(0.0)
+        missing = [t for t in W.columns if t not in self.returns.columns]
+        if missing:
+            raise ValueError(f"Weights reference assets missing in returns_df: {missing}")
+        W = W.div(W.sum(axis=1), axis=0)
+
+        R = self._to_period(self.returns, self.cfg.start, self.cfg.end)[list(W.columns)]
+        Rv = R.to_numpy(dtype=float)
+        mask = self._rebalance_mask(R.index, self.cfg.rebalance)
+        costs = self._cost_vector(list(W.columns))
+        if self.cfg.rebalance == "band":
+            runs = [self._run_events(Rv, w, mask, costs, self.cfg.band) for w in W.to_numpy()]
+            pv, turnover, paid = (np.column_stack(x) for x in zip(*runs))
+        else:
+            pv, turnover, paid = self._pv_matrix(Rv, W.to_numpy(), mask, costs)
+
+        daily = np.zeros_like(pv)
+        daily[1:] = pv[1:] / pv[:-1] - 1.0
+        stats = {**self._annualize_matrix(daily, self.cfg.rf_annual),
+                 **self._trading_stats(turnover, paid, len(R))}
+        return pd.DataFrame(stats, index=W.index)
+
+    def run_schedule(
+        self,
+        weights: pd.DataFrame,
+        benchmark_weights: Optional[Dict[str,float]] = None
+    ) -> BacktestResult:
+        """Backtest a weights time series (index = decision dates, columns = assets).
+
+        Weights decided at the close of date d are held from the next trading day,
+        so the simulation starts the day after the first row and rebalances to each
+        later row after that day's return. Costs apply; ``cfg.rebalance`` is used
+        for the benchmark only.
+        """
+        W = pd.DataFrame(weights).sort_index().astype(float).fillna(0.0)
+        missing = [t for t in W.columns if t not in self.returns.columns]
+        if missing:
+            raise ValueError(f"Weights reference assets missing in returns_df: {missing}")
+        W = W.div(W.sum(axis=1), axis=0)
+        tickers = list(W.columns)
+
+        R = self._to_period(self.returns, self.cfg.start, self.cfg.end)
+        R = R.loc[R.index > W.index[0]]
+        pos = np.searchsorted(R.index, W.index[1:], side="right") - 1
+        targets = {int(p): w for p, w in zip(pos, W.to_numpy()[1:]) if 0 <= p < len(R)}
+        mask = np.zeros(len(R), dtype=bool)
+        mask[list(targets)] = True
+        pv, s_to, s_paid = self._run_events(R[tickers].to_numpy(dtype=float), W.to_numpy()[0], mask,
+                                            self._cost_vector(tickers), targets=targets)
+        strat_daily = pd.Series(pv, index=R.index).pct_change().fillna(0.0)
+        strat_to = pd.Series(s_to, index=R.index)
+
+        if benchmark_weights is None:
+            benchmark_weights = {"SPY": 0.60, "BND": 0.40}
+        missing = [t for t in benchmark_weights.keys() if t not in R.columns]
+        if missing:
+            raise ValueError(f"Benchmark missing assets in returns_df: {missing}")
+        bench_daily, bench_to, bench_paid = self._simulate(R, benchmark_weights)
+
+        daily = pd.concat([strat_daily.rename("strategy"), bench_daily.rename("benchmark")], axis=1)
+        cum = (1.0 + daily).cumprod()
+        turnover = pd.concat([strat_to.rename("strategy"), bench_to.rename("benchmark")], axis=1)
+        s_stats = {**self._annualize(daily["strategy"], self.cfg.rf_annual),
+                   **self._trading_stats(s_to, s_paid, len(R))}
+        b_stats = {**self._annualize(daily["benchmark"], self.cfg.rf_annual),
+                   **self._trading_stats(bench_to, bench_paid, len(R))}
+        stats = pd.DataFrame([s_stats, b_stats], index=["strategy","benchmark"])
+        return BacktestResult(cumrets=cum, daily=daily, stats=stats, turnover=turnover)
+
     def run(
         self,
         strategy_weights: Dict[str,float],
@@ -76,7 +294,7 @@ class Backtester:
         R = self._to_period(self.returns, self.cfg.start, self.cfg.end)
 
         # Strategy daily returns
-        strat_daily = self._simulate_path(R, strategy_weights, self.cfg.rebalance)
+        strat_daily, strat_to, strat_paid = self._simulate(R, strategy_weights)
 
         # Benchmark daily returns (default 60/40 SPY/BND)
         if benchmark_weights is None:
@@ -86,15 +304,18 @@ class Backtester:
         if missing:
             raise ValueError(f"Benchmark missing assets in returns_df: {missing}")
 
-        bench_daily = self._simulate_path(R, benchmark_weights, self.cfg.rebalance)
+        bench_daily, bench_to, bench_paid = self._simulate(R, benchmark_weights)
 
         # Assemble frames
         daily = pd.concat([strat_daily.rename("strategy"), bench_daily.rename("benchmark")], axis=1)
         cum = (1.0 + daily).cumprod()
+        turnover = pd.concat([strat_to.rename("strategy"), bench_to.rename("benchmark")], axis=1)
 
         # Stats
-        s_stats = self._annualize(daily["strategy"], self.cfg.rf_annual)
-        b_stats = self._annualize(daily["benchmark"], self.cfg.rf_annual)
+        s_stats = {**self._annualize(daily["strategy"], self.cfg.rf_annual),
+                   **self._trading_stats(strat_to, strat_paid, len(R))}
+        b_stats = {**self._annualize(daily["benchmark"], self.cfg.rf_annual),
+                   **self._trading_stats(bench_to, bench_paid, len(R))}
         stats = pd.DataFrame([s_stats, b_stats], index=["strategy","benchmark"])
 
-        return BacktestResult(cumrets=cum, daily=daily, stats=stats)
+        return BacktestResult(cumrets=cum, daily=daily, stats=stats, turnover=turnover)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from .forecast import ARIMAForecaster, ForecastRequest
+from .models.arima_cache import ARIMACache
+from .shared import SharedReturns
+
+_FORECAST_COLS = ["ret_mean", "ret_lower", "ret_upper", "px_mean", "px_lower", "px_upper"]
+
+@dataclass(frozen=True)
+class BatchForecastResult:
+    # long/columnar: one row per (ticker, date); cols: ticker, date, step + _FORECAST_COLS
+    forecasts: pd.DataFrame
+    # one row per ticker: status, error, order, n_obs, fit_seconds, forecast_seconds, total_seconds
+    summary: pd.DataFrame
+
+    def wide(self, col: str = "px_mean") -> pd.DataFrame:
+        """Pivot one forecast column to dates x tickers."""
+        return self.forecasts.pivot(index="date", columns="ticker", values=col)
+
+
+def _forecast_one(req: ForecastRequest, cache: Optional[ARIMACache], min_obs: int, ticker: str,
+                  ret_train: Union[np.ndarray, Tuple[SharedReturns, str]],
+                  last_price: float, last_date: pd.Timestamp) -> Dict[str, object]:
+    """Fit + forecast a single ticker; never raises so one bad name cannot sink the batch.
+
+    ``ret_train`` is either the return array or a (store, column) pair, in which
+    case the worker reads the column from the shared mapping itself.
+    """
+    warnings.simplefilter("ignore")
+    if isinstance(ret_train, tuple):
+        store, col = ret_train
+        ret_train = store.column(col).to_numpy()
+    out: Dict[str, object] = {"ticker": ticker, "status": "ok", "error": None, "order": None,
+                              "n_obs": int(np.isfinite(ret_train).sum()),
+                              "fit_seconds": np.nan, "forecast_seconds": np.nan}
+    t0 = time.perf_counter()
+    try:
+        if out["n_obs"] < min_obs:
+            raise ValueError(f"only {out['n_obs']} observations, need {min_obs}")
+        if not np.isfinite(last_price):
+            raise ValueError("no valid last price")
+        fc = ARIMAForecaster(req, cache=cache).fit(pd.Series(ret_train))
+        t1 = time.perf_counter()
+        out["fit_seconds"] = t1 - t0
+        res = fc.forecast(pd.Series(ret_train), price_train_last=last_price, last_train_date=last_date)
+        out["forecast_seconds"] = time.perf_counter() - t1
+        out["order"] = res.order
+        out["columns"] = {"date": res.index.to_numpy(),
+                          **{c: getattr(res, c).to_numpy() for c in _FORECAST_COLS}}
+    except Exception as exc:
+        out["status"] = "failed"
+        out["error"] = f"{type(exc).__name__}: {exc}"
+    out["total_seconds"] = time.perf_counter() - t0
+    return out
+
+
+class BatchForecaster:
+    """Fits one ARIMAForecaster per ticker across a process pool.
+
+    Input is the wide frame from ``FeatureEngineer.add_returns`` (price columns
+    ``TSLA`` plus return columns ``TSLA_ret`` / ``TSLA_logret``).
+    """
+
+    def __init__(self, req: ForecastRequest, n_jobs: int = 1, ret_suffix: str = "_logret",
+                 cache: Optional[ARIMACache] = None, min_obs: int = 60) -> None:
+        # parallelism lives at the ticker level; keep each order search serial
+        self.req = replace(req, n_jobs=1)
+        self.n_jobs = n_jobs
+        self.ret_suffix = ret_suffix
+        self.cache = cache
+        self.min_obs = min_obs
+
+    def tickers_in(self, features: pd.DataFrame) -> List[str]:
+        n = len(self.ret_suffix)
+        return [c[:-n] for c in features.columns
+                if isinstance(c, str) and c.endswith(self.ret_suffix) and c[:-n] in features.columns]
+
+    def _jobs(self, features: Union[pd.DataFrame, SharedReturns], tickers: List[str]) -> List[tuple]:
+        shared = isinstance(features, SharedReturns)
+        jobs = []
+        for t in tickers:
+            col = f"{t}{self.ret_suffix}"
+            # a shared store travels by path; workers read their own column
+            ret = (features, col) if shared else features[col].astype(float).to_numpy()
+            px = features[t].astype(float).dropna()
+            last_price = float(px.iloc[-1]) if len(px) else np.nan
+            last_date = px.index[-1] if len(px) else features.index[-1]
+            jobs.append((self.req, self.cache, self.min_obs, t, ret, last_price, last_date))
+        return jobs
+
+    def run(self, features: Union[pd.DataFrame, SharedReturns],
+            tickers: Optional[List[str]] = None) -> BatchForecastResult:
+        tickers = tickers or self.tickers_in(features)
+        if not isinstance(features, SharedReturns):
+            features = features.sort_index()
+        jobs = self._jobs(features, tickers)
+        if self.n_jobs == 1 or len(jobs) <= 1:
+            outs = [_forecast_one(*j) for j in jobs]
+        else:
+            workers = None if self.n_jobs < 0 else self.n_jobs
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outs = list(pool.map(_forecast_one, *zip(*jobs)))
+
+        parts = []
+        for o in outs:
+            cols = o.pop("columns", None)
+            if cols is None:
+                continue
+            part = pd.DataFrame(cols)
+            part.insert(0, "ticker", o["ticker"])
+            part.insert(2, "step", np.arange(1, len(part) + 1))
+            parts.append(part)
+        if parts:
+            forecasts = pd.concat(parts, ignore_index=True)
+        else:
+            forecasts = pd.DataFrame(columns=["ticker", "date", "step", *_FORECAST_COLS])
+        summary = pd.DataFrame(outs).set_index("ticker")
+        return BatchForecastResult(forecasts=forecasts, summary=summary)
@@ -10,7 +10,9 @@ class Settings:
     tickers: List[str] = field(default_factory=lambda: ["TSLA", "BND", "SPY"])
     risk_free_rate: float = 0.02  # annualized
     seed: int = 42
+    data_format: str = "csv"  # "csv" | "parquet" cache backend
 
     data_raw_dir: Path = Path("../data/raw")
     data_processed_dir: Path = Path("../data/processed")
     reports_figures_dir: Path = Path("../reports/figures")
+    cache_dir: Path = Path("../data/cache")  # memoized pipeline stage outputs
@@ -1,46 +1,185 @@
 
 from __future__ import annotations
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from .config import Settings
+from .storage import ParquetStore, normalize_prices
+from .utils import instrument
+
+# (ticker, start, end) -> OHLCV frame; end is exclusive, as in yf.download
+Downloader = Callable[[str, str, str], pd.DataFrame]
+
+
+def yf_downloader(ticker: str, start: str, end: str) -> pd.DataFrame:
+    import yfinance as yf  # network client; only needed when downloading
+
+    df = yf.download(ticker, start=start, end=end, auto_adjust=False, progress=False)
+    return df.reset_index()  # keep Date as a column
+
+
+@dataclass
+class RefreshResult:
+    path: Path
+    mode: str  # "full" | "append" | "backfill" | "current"
+    new_rows: int
+    requested_start: Optional[str] = None
+
 
 class DataLoader:
     """Fetches and caches historical price data from yfinance."""
 
-    def __init__(self, cfg: Settings) -> None:
+    def __init__(self, cfg: Settings, downloader: Optional[Downloader] = None,
+                 max_workers: int = 4, retries: int = 3, backoff: float = 1.0) -> None:
         self.cfg = cfg
         self.cfg.data_raw_dir.mkdir(parents=True, exist_ok=True)
+        self._store: ParquetStore | None = None
+        self.downloader = downloader or yf_downloader
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
 
+    @property
+    def store(self) -> ParquetStore:
+        if self._store is None:
+            self._store = ParquetStore(self.cfg.data_raw_dir / "parquet")
+        return self._store
+
+    @instrument.timed("data.fetch_and_cache")
     def fetch_and_cache(self, tickers: List[str] | None = None) -> Dict[str, Path]:
-        
+        """Download the full [start, end) history for each ticker and overwrite the cache."""
         tickers = tickers or self.cfg.tickers
-        out: Dict[str, Path] = {}
-        for t in tickers:
-            df = yf.download(t, start=self.cfg.start, end=self.cfg.end, auto_adjust=False)
-            df.reset_index(inplace=True)  # keep Date as a column
-            path = self.cfg.data_raw_dir / f"{t}.csv"
-            df.to_csv(path, index=False)
-            out[t] = path
-        return out
+
+        def one(t: str) -> Path:
+            return self._write_cache(t, self._download(t, self.cfg.start, self.cfg.end))
+
+        return dict(zip(tickers, self._map(one, tickers)))
+
+    @instrument.timed("data.refresh")
+    def refresh(self, tickers: List[str] | None = None, overlap: int = 5,
+                rtol: float = 1e-6) -> Dict[str, RefreshResult]:
+        """Incremental update: fetch only the tail after the last cached date.
+
+        The request starts ``overlap`` cached rows back; if ``Adj Close`` on those
+        overlapping dates moved by more than ``rtol`` (split/dividend restatement),
+        the ticker's whole history is re-downloaded instead of appended.
+        """
+        tickers = tickers or self.cfg.tickers
+        return dict(zip(tickers, self._map(lambda t: self._refresh_one(t, overlap, rtol), tickers)))
+
+    def _refresh_one(self, t: str, overlap: int, rtol: float) -> RefreshResult:
+        cached = self._read_cache(t)
+        if cached is None or cached.empty:
+            df = self._download(t, self.cfg.start, self.cfg.end)
+            return RefreshResult(self._write_cache(t, df), "full", len(normalize_prices(df)), self.cfg.start)
+
+        last = cached["Date"].iloc[-1]
+        if last + pd.Timedelta(days=1) >= pd.Timestamp(self.cfg.end):
+            return RefreshResult(self.cache_path(t), "current", 0)
+
+        start = str(cached["Date"].iloc[-min(overlap, len(cached))].date())
+        new = normalize_prices(self._download(t, start, self.cfg.end))
+        if self._restated(cached, new, rtol):
+            df = normalize_prices(self._download(t, self.cfg.start, self.cfg.end))
+            added = int((df["Date"] > last).sum())
+            return RefreshResult(self._write_cache(t, df), "backfill", added, self.cfg.start)
+
+        tail = new[new["Date"] > last]
+        if tail.empty:
+            return RefreshResult(self.cache_path(t), "current", 0, start)
+        merged = pd.concat([cached, tail], ignore_index=True)
+        return RefreshResult(self._write_cache(t, merged), "append", len(tail), start)
+
+    @staticmethod
+    def _restated(cached: pd.DataFrame, new: pd.DataFrame, rtol: float) -> bool:
+        both = cached[["Date", "Adj Close"]].merge(new[["Date", "Adj Close"]], on="Date", suffixes=("_old", "_new"))
+        if both.empty:
+            return False
+        old, cur = both["Adj Close_old"].to_numpy(), both["Adj Close_new"].to_numpy()
+        return not np.allclose(old, cur, rtol=rtol, atol=0.0, equal_nan=True)
+
+    def _download(self, t: str, start: str, end: str) -> pd.DataFrame:
+        """Call the downloader with exponential backoff; re-raises after the last attempt."""
+        for attempt in range(self.retries):
+            instrument.count("data.download.attempted")
+            try:
+                return self.downloader(t, start, end)
+            except Exception:
+                if attempt == self.retries - 1:
+                    instrument.count("data.download.failed")
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def _map(self, fn, tickers: List[str]) -> list:
+        if self.max_workers <= 1 or len(tickers) <= 1:
+            return [fn(t) for t in tickers]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tickers))) as pool:
+            return list(pool.map(fn, tickers))
+
+    def cache_path(self, t: str) -> Path:
+        """Where ``t``'s raw prices are cached (CSV or parquet, per ``data_format``)."""
+        if self.cfg.data_format == "parquet":
+            return self.store.path(t)
+        return self.cfg.data_raw_dir / f"{t}.csv"
+
+    def _read_cache(self, t: str) -> Optional[pd.DataFrame]:
+        path = self.cache_path(t)
+        if not path.exists():
+            return None
+        if self.cfg.data_format == "parquet":
+            return self.store.read(t)
+        return normalize_prices(pd.read_csv(path))
+
+    def _write_cache(self, t: str, df: pd.DataFrame) -> Path:
+        if self.cfg.data_format == "parquet":
+            return self.store.write(t, df)
+        path = self.cache_path(t)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        normalize_prices(df).to_csv(tmp, index=False)
+        os.replace(tmp, path)  # readers never see a half-written file
+        return path
 
     def load_csv(self, ticker: str) -> pd.DataFrame:
         """Load a single ticker CSV from cache."""
         path = self.cfg.data_raw_dir / f"{ticker}.csv"
         return pd.read_csv(path, parse_dates=["Date"])
 
+    def load(self, ticker: str, columns: List[str] | None = None,
+             start: str | None = None, end: str | None = None) -> pd.DataFrame:
+        """Load one ticker from the configured cache; parquet pushes down columns/date range."""
+        if self.cfg.data_format == "parquet":
+            return self.store.read(ticker, columns=columns, start=start, end=end)
+        df = self.load_csv(ticker)
+        if start is not None:
+            df = df[df["Date"] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df["Date"] <= pd.Timestamp(end)]
+        if columns is not None:
+            df = df[["Date", *[c for c in columns if c != "Date"]]]
+        return df
+
+    def migrate_to_parquet(self, tickers: List[str] | None = None) -> Dict[str, Path]:
+        """Convert the existing per-ticker CSV cache into the parquet store."""
+        return self.store.migrate_csv(self.cfg.data_raw_dir, tickers)
+
+    @instrument.timed("data.load_all")
     def load_all(self, tickers: List[str] | None = None) -> Dict[str, pd.DataFrame]:
         """Return dict[ticker -> DataFrame] without Ticker column."""
         tickers = tickers or self.cfg.tickers
-        return {t: self.load_csv(t) for t in tickers}
+        return {t: self.load(t) for t in tickers}
 
+    @instrument.timed("data.load_all_list")
     def load_all_list(self, tickers: List[str] | None = None) -> List[pd.DataFrame]:
         """Return list of DataFrames with a Ticker column added."""
         tickers = tickers or self.cfg.tickers
         frames: List[pd.DataFrame] = []
         for t in tickers:
-            df = self.load_csv(t).copy()
+            df = self.load(t).copy()
             df["Ticker"] = t
             frames.append(df)
         return frames
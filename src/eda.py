@@ -1,8 +1,27 @@
 from __future__ import annotations
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+import numpy as np
 import pandas as pd
-from statsmodels.tsa.stattools import adfuller
 from .utils.metrics import Metrics
 
+
+def _adf_one(values: np.ndarray) -> tuple:
+    """(adf_stat, p_value, n_obs) for one column; NaNs when the test cannot run."""
+    from statsmodels.tsa.stattools import adfuller
+
+    x = values[np.isfinite(values)]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            stat, pval, *_ = adfuller(x, autolag="AIC")
+        return float(stat), float(pval), len(x)
+    except Exception:
+        return np.nan, np.nan, len(x)
+
+
 class EDAAnalyzer:
    
     @staticmethod
@@ -11,6 +30,8 @@ class EDAAnalyzer:
 
     @staticmethod
     def adf_test(series: pd.Series) -> dict:
+        from statsmodels.tsa.stattools import adfuller  # heavy; import on first use
+
         series = series.dropna()
         stat, pval, *_ = adfuller(series, autolag="AIC")
         return {"adf_stat": float(stat), "p_value": float(pval)}
@@ -30,3 +51,85 @@ class EDAAnalyzer:
     @staticmethod
     def sharpe(daily_returns: pd.Series, rf_annual=0.02) -> float:
         return Metrics.sharpe_ratio(daily_returns, rf_annual)
+
+    # ---- panel (dates x tickers) versions -------------------------------
+
+    @staticmethod
+    def rolling_stats_panel(df: pd.DataFrame, windows: Sequence[int] = (21, 63, 252)) -> pd.DataFrame:
+        """``rolling_stats`` for every column at once.
+
+        One cumulative-sum pass over the 2-D array gives all windows; a window
+        containing a NaN is NaN, as with ``rolling(w)``. Columns are centered
+        first to keep the sum-of-squares variance accurate. Returns columns
+        (ticker, "mean_w" / "std_w"), so ``out[t]`` matches ``rolling_stats(df[t])``.
+        """
+        X = df.to_numpy(dtype=float)
+        n, k = X.shape
+        nan = np.isnan(X)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+            mu = np.nan_to_num(np.nanmean(X, axis=0))
+        Xc = np.where(nan, 0.0, X - mu)
+        zeros = np.zeros((1, k))
+        S1 = np.vstack([zeros, np.cumsum(Xc, axis=0)])
+        S2 = np.vstack([zeros, np.cumsum(Xc * Xc, axis=0)])
+        C = np.vstack([zeros, np.cumsum(nan, axis=0)])
+
+        stats = {}
+        for w in windows:
+            mean = np.full((n, k), np.nan)
+            std = np.full((n, k), np.nan)
+            if w <= n:
+                s1 = S1[w:] - S1[:-w]
+                s2 = S2[w:] - S2[:-w]
+                ok = (C[w:] - C[:-w]) == 0
+                m = s1 / w
+                mean[w - 1:] = np.where(ok, m + mu, np.nan)
+                if w > 1:
+                    var = np.maximum(s2 - s1 * m, 0.0) / (w - 1)
+                    std[w - 1:] = np.where(ok, np.sqrt(var), np.nan)
+            stats[f"mean_{w}"] = mean
+            stats[f"std_{w}"] = std
+
+        names = list(stats)
+        block = np.stack([stats[s] for s in names], axis=2).reshape(n, k * len(names))
+        cols = pd.MultiIndex.from_product([df.columns, names], names=["ticker", "stat"])
+        return pd.DataFrame(block, index=df.index, columns=cols)
+
+    @staticmethod
+    def adf_panel(df: pd.DataFrame, n_jobs: int = 1) -> pd.DataFrame:
+        """ADF test per column, fanned out over ``n_jobs`` processes (-1 = all cores).
+
+        Returns one row per ticker: adf_stat, p_value, n_obs.
+        """
+        cols = [df[c].to_numpy(dtype=float) for c in df.columns]
+        workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+        if workers <= 1 or len(cols) <= 1:
+            rows = [_adf_one(v) for v in cols]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(cols))) as pool:
+                rows = list(pool.map(_adf_one, cols, chunksize=max(1, len(cols) // (4 * workers))))
+        out = pd.DataFrame(rows, index=df.columns, columns=["adf_stat", "p_value", "n_obs"])
+        out.index.name = "ticker"
+        return out
+
+    @staticmethod
+    def risk_panel(df: pd.DataFrame, rf_annual: float = 0.02, alpha: float = 0.95) -> pd.DataFrame:
+        """Per-ticker annual mean/vol, Sharpe and historical VaR, NaN-aware and vectorized.
+
+        Same definitions as ``Metrics.sharpe_ratio`` / ``historical_var``.
+        """
+        X = df.to_numpy(dtype=float)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mu = np.nanmean(X, axis=0)
+            sd = np.nanstd(X, axis=0, ddof=1)
+            var = np.nanpercentile(X, (1 - alpha) * 100, axis=0)
+        ann_mean, ann_vol = mu * 252, sd * np.sqrt(252)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(sd > 0, (ann_mean - rf_annual) / ann_vol, np.nan)
+        out = pd.DataFrame({"ann_mean": ann_mean, "ann_vol": ann_vol, "sharpe": sharpe,
+                            f"var_{round(alpha * 100)}": var,
+                            "n_obs": np.isfinite(X).sum(axis=0)}, index=df.columns)
+        out.index.name = "ticker"
+        return out
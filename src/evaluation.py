@@ -0,0 +1,134 @@
+from __future__ import annotations
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from .models.arima_model import ARIMAModel
+from .splits import RollingOriginSplitter
+from .utils.metrics import Metrics
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    folds: pd.DataFrame        # one row per fold: origin, n_train, mae, rmse, mape, seconds, status, error
+    by_horizon: pd.DataFrame   # index: step h (1..horizon), cols: mae, rmse, mape, n
+    predictions: pd.DataFrame  # long: fold, step, date, y_true, y_pred
+
+
+def _run_block(model_name: str, model_kwargs: Dict, fit_kwargs: Dict, values: np.ndarray,
+               bounds: List[Tuple[int, int, int, int]], seed_params: Optional[np.ndarray]) -> List[Dict]:
+    """Fit/forecast consecutive folds in one worker, warm-starting each from the previous one."""
+    warnings.simplefilter("ignore")
+    out: List[Dict] = []
+    params = seed_params
+    lstm = None
+    for fold, a, o, b in bounds:
+        train, test = values[a:o], values[o:b]
+        rec: Dict[str, object] = {"fold": fold, "status": "ok", "error": None}
+        t0 = time.perf_counter()
+        try:
+            if model_name == "arima":
+                m = ARIMAModel(**model_kwargs).fit(pd.Series(train), start_params=params)
+                params = np.asarray(m._fit_res.params)
+                pred = m.forecast(len(test))
+            else:
+                from .models.lstm_model import LSTMModel
+                lstm = lstm or LSTMModel(**model_kwargs)
+                lstm.fit(pd.Series(train), warm_start=True, **fit_kwargs)
+                pred = lstm.forecast(pd.Series(train), steps=len(test))
+            rec["y_pred"] = np.asarray(pred, dtype=float)
+        except Exception as exc:
+            rec["status"] = "failed"
+            rec["error"] = f"{type(exc).__name__}: {exc}"
+        rec["seconds"] = time.perf_counter() - t0
+        out.append(rec)
+    return out
+
+
+class WalkForwardEvaluator:
+    """Rolling-origin evaluation of ARIMAModel / LSTMModel with folds run in parallel.
+
+    Folds are cut into ``n_jobs`` contiguous blocks; each worker walks its block in
+    time order and warm-starts every fit from the previous fold's parameters (ARIMA)
+    or weights (LSTM). For ARIMA without a fixed ``order`` the order is selected
+    once on the first fold and reused, and that fit seeds every block.
+    """
+
+    def __init__(self, splitter: RollingOriginSplitter, model: str = "arima", n_jobs: int = 1,
+                 model_kwargs: Optional[Dict] = None, fit_kwargs: Optional[Dict] = None) -> None:
+        if model not in ("arima", "lstm"):
+            raise ValueError(f"model must be 'arima' or 'lstm', got {model!r}")
+        self.splitter = splitter
+        self.model = model
+        self.n_jobs = n_jobs
+        self.model_kwargs = dict(model_kwargs or {})
+        self.fit_kwargs = dict(fit_kwargs or {})
+
+    def _blocks(self, bounds: List[Tuple[int, int, int, int]]) -> List[List[Tuple[int, int, int, int]]]:
+        workers = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        k = max(1, min(workers, len(bounds)))
+        return [list(b) for b in np.array_split(np.asarray(bounds, dtype=int), k) if len(b)]
+
+    def run(self, series: pd.Series) -> WalkForwardResult:
+        s = pd.Series(series).sort_index().astype(float).dropna()
+        values = s.to_numpy()
+        bounds = [(i, a, o, b) for i, (a, o, b) in enumerate(self.splitter.fold_bounds(len(s)))]
+        if not bounds:
+            raise ValueError("Series too short for the splitter settings.")
+
+        model_kwargs = dict(self.model_kwargs)
+        seed_params = None
+        if self.model == "arima":
+            model_kwargs.setdefault("n_jobs", 1)
+            _, a, o, _ = bounds[0]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                first = ARIMAModel(**model_kwargs).fit(pd.Series(values[a:o]))
+            model_kwargs["order"] = first.order
+            seed_params = np.asarray(first._fit_res.params)
+
+        blocks = [[tuple(int(x) for x in row) for row in blk] for blk in self._blocks(bounds)]
+        args = (self.model, model_kwargs, self.fit_kwargs, values)
+        if len(blocks) == 1:
+            recs = _run_block(*args, blocks[0], seed_params)
+        else:
+            with ProcessPoolExecutor(max_workers=len(blocks)) as pool:
+                futs = [pool.submit(_run_block, *args, blk, seed_params) for blk in blocks]
+                recs = [r for f in futs for r in f.result()]
+        return self._collect(s, bounds, recs)
+
+    @staticmethod
+    def _collect(s: pd.Series, bounds: List[Tuple[int, int, int, int]], recs: List[Dict]) -> WalkForwardResult:
+        by_fold = {fold: (a, o, b) for fold, a, o, b in bounds}
+        fold_rows, pred_parts = [], []
+        for rec in sorted(recs, key=lambda r: r["fold"]):
+            a, o, b = by_fold[rec["fold"]]
+            y_true = s.iloc[o:b]
+            row = {"fold": rec["fold"], "origin": s.index[o], "train_start": s.index[a],
+                   "n_train": o - a, "status": rec["status"], "error": rec["error"],
+                   "seconds": rec["seconds"], "mae": np.nan, "rmse": np.nan, "mape": np.nan}
+            y_pred = rec.get("y_pred")
+            if y_pred is not None:
+                row.update(mae=Metrics.mae(y_true, y_pred), rmse=Metrics.rmse(y_true, y_pred),
+                           mape=Metrics.mape(y_true, y_pred))
+                pred_parts.append(pd.DataFrame({
+                    "fold": rec["fold"], "step": np.arange(1, len(y_true) + 1),
+                    "date": y_true.index, "y_true": y_true.to_numpy(), "y_pred": y_pred,
+                }))
+            fold_rows.append(row)
+
+        folds = pd.DataFrame(fold_rows).set_index("fold")
+        cols = ["fold", "step", "date", "y_true", "y_pred"]
+        preds = pd.concat(pred_parts, ignore_index=True) if pred_parts else pd.DataFrame(columns=cols)
+        by_h = {}
+        for h, g in preds.groupby("step"):
+            by_h[h] = {"mae": Metrics.mae(g["y_true"], g["y_pred"]),
+                       "rmse": Metrics.rmse(g["y_true"], g["y_pred"]),
+                       "mape": Metrics.mape(g["y_true"], g["y_pred"]), "n": len(g)}
+        by_horizon = pd.DataFrame.from_dict(by_h, orient="index", columns=["mae", "rmse", "mape", "n"])
+        by_horizon.index.name = "step"
+        return WalkForwardResult(folds=folds, by_horizon=by_horizon, predictions=preds)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 import numpy as np
 import pandas as pd
+import shutil
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional
 from .config import Settings
+from .shared import SharedReturns
+from .utils import instrument
 
 class FeatureEngineer:
     """Cleans, merges, and derives features (returns) for all tickers."""
@@ -20,6 +23,7 @@ class FeatureEngineer:
                 df[c] = pd.to_numeric(df[c], errors="coerce")
         return df
 
+    @instrument.timed("features.merge_clean")
     def merge_clean(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
         """Merge per-ticker frames, pivot to wide Adj Close, clean missing."""
         df_all = []
@@ -42,22 +46,106 @@ class FeatureEngineer:
         wide = wide.ffill().bfill()
         return wide
 
-    def add_returns(self, adj_close: pd.DataFrame) -> pd.DataFrame:
-        """Add simple & log returns; drop initial NA."""
+    @staticmethod
+    def _return_parts(adj_close: pd.DataFrame):
         # safety: ensure numeric again if something slipped through
         adj_close = adj_close.apply(pd.to_numeric, errors="coerce").replace([np.inf, -np.inf], np.nan)
         adj_close = adj_close.ffill().bfill()
 
         pct = adj_close.pct_change().add_suffix("_ret")
         logret = np.log(adj_close / adj_close.shift(1)).add_suffix("_logret")
-        out = pd.concat([adj_close, pct, logret], axis=1).dropna()
+        return adj_close, pct, logret
+
+    def add_returns(self, adj_close: pd.DataFrame) -> pd.DataFrame:
+        """Add simple & log returns; drop initial NA."""
+        out = pd.concat(self._return_parts(adj_close), axis=1).dropna()
         return out
 
-    def save(self, df: pd.DataFrame, name: str = "merged_features.csv") -> Path:
-        path = self.cfg.data_processed_dir / name
+    @staticmethod
+    def _dates(col: pd.Series) -> pd.Series:
+        # to_datetime on an already-parsed column is a no-op but scans it element-wise
+        if pd.api.types.is_datetime64_any_dtype(col):
+            return col
+        return pd.to_datetime(col, errors="coerce")
+
+    def _price_column(self, df: pd.DataFrame, dates: pd.DatetimeIndex) -> np.ndarray:
+        # one ticker's Adj Close aligned on the union dates (NaN where absent), as pivot does
+        px = pd.to_numeric(df["Adj Close"], errors="coerce").to_numpy(dtype=float)
+        d = self._dates(df["Date"])
+        ok = d.notna().to_numpy()
+        d = pd.DatetimeIndex(d[ok])
+        if d.has_duplicates:
+            raise ValueError("Index contains duplicate entries, cannot reshape")
+        col = np.full(len(dates), np.nan)
+        col[dates.searchsorted(d)] = px[ok]
+        return col
+
+    def pipeline_chunked(self, load: Callable[[str], pd.DataFrame], tickers: List[str],
+                         chunk_size: int = 256, name: str = "merged_features") -> SharedReturns:
+        """Streaming twin of ``pipeline`` with memory bounded by ``chunk_size`` tickers.
+
+        ``load(ticker)`` returns that ticker's raw frame (Date, Adj Close, ...);
+        it is called twice per ticker. Pass 1 builds the union of dates; pass 2
+        cleans and derives returns one chunk of tickers at a time, writing the
+        prices / ``_ret`` / ``_logret`` panels straight into a memory-mapped
+        scratch matrix while tracking which rows are complete. The complete rows
+        are then compacted into a ``SharedReturns`` store at
+        ``data_processed_dir / name``. ``store.to_frame()`` equals
+        ``pipeline(frames)`` for the same data.
+        """
+        dates = pd.DatetimeIndex([])
+        present = []
+        for t in tickers:
+            d = self._dates(load(t)["Date"]).dropna()
+            if len(d):
+                dates = dates.union(pd.DatetimeIndex(d))
+                present.append(t)
+        tickers = sorted(present)  # pivot orders columns by ticker
+        n = len(tickers)
+        cols = tickers + [f"{t}_ret" for t in tickers] + [f"{t}_logret" for t in tickers]
+
+        out_dir = self.cfg.data_processed_dir / name
+        scratch_dir = self.cfg.data_processed_dir / f"{name}.partial"
+        scratch = SharedReturns.allocate(scratch_dir, dates, cols)
+        complete = np.ones(len(dates), dtype=bool)
+        for lo in range(0, n, chunk_size):
+            chunk = tickers[lo:lo + chunk_size]
+            prices = pd.DataFrame({t: self._price_column(load(t), dates) for t in chunk}, index=dates)
+            for k, part in enumerate(self._return_parts(prices)):
+                block = part.to_numpy()
+                scratch[:, k * n + lo:k * n + lo + len(chunk)] = block
+                complete &= ~np.isnan(block).any(axis=1)
+        scratch.flush()
+
+        keep = np.flatnonzero(complete)
+        values = SharedReturns.allocate(out_dir, dates[keep], cols)
+        rows = max(1, (chunk_size * len(dates)) // max(len(cols), 1))  # same bound as one column chunk
+        for a in range(0, len(keep), rows):
+            values[a:a + rows] = scratch[keep[a:a + rows]]
+        values.flush()
+        del scratch, values
+        shutil.rmtree(scratch_dir)
+        return SharedReturns(out_dir)
+
+    def save(self, df: pd.DataFrame, name: str | None = None) -> Path:
+        if self.cfg.data_format == "parquet":
+            path = self.cfg.data_processed_dir / (name or "merged_features.parquet")
+            df.to_parquet(path)
+            return path
+        path = self.cfg.data_processed_dir / (name or "merged_features.csv")
         df.to_csv(path)
         return path
 
+    def load(self, name: str | None = None, columns: List[str] | None = None) -> pd.DataFrame:
+        """Read saved features back (Date index); parquet reads only ``columns``."""
+        if self.cfg.data_format == "parquet":
+            return pd.read_parquet(self.cfg.data_processed_dir / (name or "merged_features.parquet"),
+                                   columns=columns)
+        df = pd.read_csv(self.cfg.data_processed_dir / (name or "merged_features.csv"),
+                         index_col=0, parse_dates=True)
+        return df if columns is None else df[columns]
+
+    @instrument.timed("features.pipeline")
     def pipeline(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
         wide = self.merge_clean(frames)
         feats = self.add_returns(wide)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 
 from .models.arima_model import ARIMAModel
+from .models.arima_cache import ARIMACache
+from .shared import SharedReturns
 
 @dataclass(frozen=True)
 class ForecastRequest:
@@ -14,6 +16,8 @@ class ForecastRequest:
     grid_p: range = range(0, 4)
     grid_d: range = range(0, 2)
     grid_q: range = range(0, 4)
+    n_jobs: int = 1                  # worker processes for the order search
+    search: str = "grid"             # "grid" (exhaustive) | "stepwise"
 
 @dataclass(frozen=True)
 class ForecastResult:
@@ -23,16 +27,35 @@ class ForecastResult:
     ret_mean: pd.Series
     ret_lower: pd.Series
     ret_upper: pd.Series
-    # reconstructed prices (mean / CI)
+    # reconstructed prices (mean / compounded CI bounds; not a price interval,
+    # see ARIMAForecaster.simulate for simulated price bands)
     px_mean: pd.Series
     px_lower: pd.Series
     px_upper: pd.Series
     # the (p,d,q) order used
     order: Tuple[int, int, int]
 
+@dataclass(frozen=True)
+class SimulationResult:
+    index: pd.DatetimeIndex
+    # price quantile bands across paths, one column per quantile ("q05", "q50", ...)
+    px_bands: pd.DataFrame
+    px_mean: pd.Series
+    # terminal price of every path
+    terminal: np.ndarray
+    # horizon return (P_T / P_0 - 1) VaR / CVaR at `alpha`, as positive loss fractions
+    var: float
+    cvar: float
+    alpha: float
+    # VaR of the cumulative return at each step
+    var_path: pd.Series
+    order: Tuple[int, int, int]
+    # (n_paths, steps) price paths when requested
+    paths: Optional[np.ndarray] = None
+
 class ARIMAForecaster:
    
-    def __init__(self, req: ForecastRequest) -> None:
+    def __init__(self, req: ForecastRequest, cache: Optional[ARIMACache] = None) -> None:
         self.req = req
         self.model = ARIMAModel(
             order=None,
@@ -40,9 +63,20 @@ class ARIMAForecaster:
             grid_d=req.grid_d,
             grid_q=req.grid_q,
             trend=req.trend,
+            n_jobs=req.n_jobs,
+            search=req.search,
+            cache=cache,
         )
         self.fitted = False
 
+    @staticmethod
+    def _as_series(ret_train: Union[pd.Series, SharedReturns], column: Optional[str]) -> pd.Series:
+        if isinstance(ret_train, SharedReturns):
+            if column is None:
+                raise ValueError("column is required when fitting from a SharedReturns store.")
+            return ret_train.column(column)
+        return ret_train
+
     @staticmethod
     def _range_index(series: pd.Series) -> pd.Series:
         s = pd.Series(series).astype(float).dropna()
@@ -58,18 +92,28 @@ class ARIMAForecaster:
     def _reconstruct_prices(last_price: float, ret_path: np.ndarray) -> np.ndarray:
         return float(last_price) * np.cumprod(1.0 + np.asarray(ret_path, dtype=float))
 
-    def fit(self, ret_train: pd.Series) -> "ARIMAForecaster":
-        y = self._range_index(ret_train)
+    def fit(self, ret_train: Union[pd.Series, SharedReturns],
+            column: Optional[str] = None) -> "ARIMAForecaster":
+        """Fit on a return series, or on ``column`` of a shared returns store."""
+        y = self._range_index(self._as_series(ret_train, column))
         self.model.fit(y)
         self.fitted = True
         return self
 
-    def forecast(self, ret_train: pd.Series, price_train_last: float,
+    def update(self, ret_new: pd.Series) -> "ARIMAForecaster":
+        """Fold newly arrived returns into the fitted model without a full refit."""
+        if not self.fitted:
+            raise RuntimeError("Forecaster not fitted.")
+        self.model.update(ret_new)
+        return self
+
+    def forecast(self, ret_train: Union[pd.Series, SharedReturns], price_train_last: float,
                  last_train_date: pd.Timestamp,
                  steps: Optional[int] = None,
-                 alpha: Optional[float] = None) -> ForecastResult:
+                 alpha: Optional[float] = None,
+                 column: Optional[str] = None) -> ForecastResult:
         if not self.fitted:
-            self.fit(ret_train)
+            self.fit(ret_train, column)
 
         steps = steps or self.req.steps
         alpha = alpha or self.req.alpha
@@ -98,3 +142,51 @@ class ARIMAForecaster:
             px_mean=px_mean, px_lower=px_low, px_upper=px_up,
             order=self.model.order,
         )
+
+    def simulate(self, ret_train: Union[pd.Series, SharedReturns], price_train_last: float,
+                 last_train_date: pd.Timestamp, n_paths: int = 10000,
+                 steps: Optional[int] = None, alpha: Optional[float] = None,
+                 quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95),
+                 log_returns: bool = False, seed: Optional[int] = None,
+                 dtype=np.float64, chunk: int = 4096, keep_paths: bool = False,
+                 column: Optional[str] = None) -> SimulationResult:
+        """Monte Carlo price distribution from simulated return paths.
+
+        Return paths are drawn from the fitted state-space model and compounded
+        path by path (``exp(cumsum)`` when the model was fit on log returns), so
+        the bands are quantiles of prices rather than compounded return bounds.
+        """
+        if not self.fitted:
+            self.fit(ret_train, column)
+        steps = steps or self.req.steps
+        alpha = alpha or self.req.alpha
+
+        paths = self.model.simulate(steps, n_paths=n_paths, seed=seed, dtype=dtype, chunk=chunk)
+        if log_returns:
+            np.cumsum(paths, axis=1, out=paths)
+            np.exp(paths, out=paths)
+        else:
+            paths += 1.0
+            np.cumprod(paths, axis=1, out=paths)
+        growth = paths  # P_t / P_0 per path, in place
+        idx = self._future_bdays(last_train_date, steps)
+
+        # quantiles commute with the monotone map growth -> return, so one pass
+        # over the paths gives the price bands and the per-step VaR
+        q = np.quantile(growth, [*quantiles, alpha], axis=0)
+        bands = pd.DataFrame(float(price_train_last) * q[:-1].T, index=idx,
+                             columns=[f"q{round(100 * x):02d}" for x in quantiles])
+        var_path = 1.0 - q[-1]
+        terminal = growth[:, -1]
+        var = float(var_path[-1])
+        cvar = float(1.0 - terminal[terminal <= q[-1, -1]].mean())
+
+        return SimulationResult(
+            index=idx, px_bands=bands,
+            px_mean=pd.Series(float(price_train_last) * growth.mean(axis=0), index=idx),
+            terminal=float(price_train_last) * terminal,
+            var=var, cvar=cvar, alpha=alpha,
+            var_path=pd.Series(var_path, index=idx),
+            order=self.model.order,
+            paths=float(price_train_last) * growth if keep_paths else None,
+        )
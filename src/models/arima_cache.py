@@ -0,0 +1,104 @@
+# src/models/arima_cache.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+class ARIMACache:
+    """Content-addressed on-disk store of selected ARIMA orders and fitted parameters.
+
+    One JSON file per key; the file mtime doubles as the LRU clock, so the cache
+    survives restarts and is shared by every process pointing at the same folder.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 512) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._last_hit: Optional[str] = None
+        # approximate (other processes may share the folder); resynced by every eviction scan
+        self._count = sum(1 for _ in self.cache_dir.glob("*.json"))
+
+    @staticmethod
+    def make_key(y: np.ndarray, spec: Dict[str, object]) -> str:
+        """sha256 over the raw training values and the fit specification."""
+        h = hashlib.sha256()
+        h.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+        h.update(json.dumps(spec, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, object]]:
+        path = self._path(key)
+        try:
+            with open(path) as fh:
+                entry = json.load(fh)
+            os.utime(path)  # mark as most recently used
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._last_hit = key
+        return entry
+
+    def reject(self, key: str) -> None:
+        """Re-count the last ``get(key)`` as a miss when its entry could not be used."""
+        if key != self._last_hit:
+            raise ValueError(f"reject({key!r}) does not match the last cache hit {self._last_hit!r}")
+        self._last_hit = None
+        self.hits -= 1
+        self.misses += 1
+
+    def put(self, key: str, order: Tuple[int, int, int], params: np.ndarray,
+            param_names: Optional[List[str]] = None) -> Path:
+        entry = {
+            "order": [int(o) for o in order],
+            "params": [float(p) for p in np.asarray(params, dtype=float)],
+            "param_names": list(param_names) if param_names is not None else None,
+        }
+        path = self._path(key)
+        new = not path.exists()
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as fh:
+            json.dump(entry, fh)
+        os.replace(tmp, path)  # atomic, concurrent writers never see half a file
+        self._count += new
+        if self._count > self.max_entries:
+            self._evict()
+        return path
+
+    def _evict(self) -> None:
+        entries = []
+        for p in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((p.stat().st_mtime_ns, p))
+            except OSError:
+                continue
+        excess = len(entries) - self.max_entries
+        self._count = len(entries)
+        if excess <= 0:
+            return
+        for _, p in sorted(entries)[:excess]:
+            try:
+                p.unlink()
+                self._count -= 1
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob("*.json"))
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def clear(self) -> None:
+        for p in self.cache_dir.glob("*.json"):
+            p.unlink()
+        self._count = 0
@@ -1,11 +1,41 @@
 # src/models/arima_model.py
 from __future__ import annotations
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy as np
 import pandas as pd
-from typing import Iterable, Tuple, Optional
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from typing import Dict, Iterable, List, Tuple, Optional
+
+from ..eda import EDAAnalyzer
+from ..utils import instrument
+from .arima_cache import ARIMACache
+
+
+def _score_order(model: "ARIMAModel", y: np.ndarray, order: Tuple[int,int,int],
+                 bound: float = np.inf) -> Tuple[float, bool]:
+    """(AIC, pruned) of one candidate order (module level so it can run in worker processes).
+
+    With a finite ``bound`` and ``model.prune_margin`` set, a short partial fit runs
+    first; if its AIC is already worse than ``bound + prune_margin`` the candidate is
+    abandoned, otherwise the full fit continues from the partial estimates.
+    """
+    y = pd.Series(y)
+    start_params = None
+    if np.isfinite(bound) and model.prune_margin is not None:
+        partial_res = model._fit_try(y, order, max(5, model.fit_maxiter // 10), retry=False)
+        if partial_res is None:
+            return np.inf, False
+        if float(partial_res.aic) > bound + model.prune_margin:
+            return np.inf, True
+        start_params = partial_res.params
+    res = model._fit_try(y, order, model.fit_maxiter, start_params=start_params)
+    if res is None:
+        return np.inf, False
+    aic = float(getattr(res, "aic", np.inf))
+    return (aic if np.isfinite(aic) else np.inf), False
+
 
 class ARIMAModel:
  
@@ -20,6 +50,12 @@ class ARIMAModel:
         fit_maxiter: int = 200,
         enforce_stationarity: bool = False,
         enforce_invertibility: bool = False,
+        n_jobs: int = 1,
+        search: str = "grid",
+        prune_margin: Optional[float] = 10.0,
+        cache: Optional[ARIMACache] = None,
+        refit_every: Optional[int] = None,
+        drift_threshold: Optional[float] = 4.0,
     ) -> None:
         self.order = order
         self.grid_p = list(grid_p)
@@ -29,61 +65,193 @@ class ARIMAModel:
         self.fit_maxiter = fit_maxiter
         self.enforce_stationarity = enforce_stationarity
         self.enforce_invertibility = enforce_invertibility
+        self.n_jobs = n_jobs  # worker processes for order search; -1 = all cores
+        if search not in ("grid", "stepwise"):
+            raise ValueError(f"search must be 'grid' or 'stepwise', got {search!r}")
+        self.search = search
+        self.prune_margin = prune_margin  # AIC slack before a stepwise candidate is abandoned
+        self.search_stats: Dict[str, int] = {}
+        self.cache = cache
+        self.refit_every = refit_every          # appended obs before a full re-estimate; None = never
+        self.drift_threshold = drift_threshold  # z-score on one-step errors that forces a refit
+        self.last_update_refit = False
         self._fit_res = None
+        self._y: Optional[pd.Series] = None
+        self._reset_update_state()
+
+    def _arima(self, y: pd.Series, order: Tuple[int,int,int]):
+        from statsmodels.tsa.arima.model import ARIMA  # statsmodels loads on first fit
 
-    def _fit_try(self, y: pd.Series, order: Tuple[int,int,int], maxiter: int) -> Optional[object]:
+        return ARIMA(
+            y, order=order, trend=self.trend,
+            enforce_stationarity=self.enforce_stationarity,
+            enforce_invertibility=self.enforce_invertibility
+        )
+
+    def _fit_try(self, y: pd.Series, order: Tuple[int,int,int], maxiter: int,
+                 start_params: Optional[np.ndarray] = None, retry: bool = True) -> Optional[object]:
+        instrument.count("arima.fit.attempted")
         try:
             with warnings.catch_warnings():
+                from statsmodels.tools.sm_exceptions import ConvergenceWarning
                 warnings.simplefilter("ignore", ConvergenceWarning)
-                res = ARIMA(
-                    y, order=order, trend=self.trend,
-                    enforce_stationarity=self.enforce_stationarity,
-                    enforce_invertibility=self.enforce_invertibility
-                ).fit(maxiter=maxiter)
+                res = self._arima(y, order).fit(start_params=start_params, method_kwargs={"maxiter": maxiter})
             # Check convergence flag if available
             converged = True
             try:
                 converged = bool(getattr(res, "mle_retvals", {}).get("converged", True))
             except Exception:
                 pass
-            if not converged:
+            if not converged and retry:
                 # one retry with more iterations
-                res = ARIMA(
-                    y, order=order, trend=self.trend,
-                    enforce_stationarity=self.enforce_stationarity,
-                    enforce_invertibility=self.enforce_invertibility
-                ).fit(maxiter=maxiter * 2)
+                instrument.count("arima.fit.retried")
+                res = self._arima(y, order).fit(method_kwargs={"maxiter": maxiter * 2})
             return res
         except Exception:
+            instrument.count("arima.fit.failed")
             return None
 
+    def _n_workers(self) -> int:
+        if self.n_jobs is None or self.n_jobs == 0:
+            return 1
+        if self.n_jobs < 0:
+            return os.cpu_count() or 1
+        return int(self.n_jobs)
+
+    def _score_orders(self, y: pd.Series, orders: List[Tuple[int,int,int]],
+                       bound: float = np.inf) -> List[Tuple[float, bool]]:
+        """(AIC, pruned) for each order, in the same order; inf marks a failed or pruned fit."""
+        values = np.asarray(y, dtype=float)
+        # light copy without fitted results, cheap to ship to workers
+        proto = ARIMAModel(
+            trend=self.trend, fit_maxiter=self.fit_maxiter,
+            enforce_stationarity=self.enforce_stationarity,
+            enforce_invertibility=self.enforce_invertibility,
+            prune_margin=self.prune_margin,
+        )
+        workers = min(self._n_workers(), len(orders))
+        if workers <= 1:
+            return [_score_order(proto, values, o, bound) for o in orders]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(partial(_score_order, proto, values, bound=bound), orders))
+
+    @staticmethod
+    def _best(orders: List[Tuple[int,int,int]], scores: List[Tuple[float, bool]],
+              best: Optional[Tuple[int,int,int]] = None,
+              best_aic: float = np.inf) -> Tuple[Optional[Tuple[int,int,int]], float]:
+        # lowest AIC wins; ties go to the earliest candidate, so the result
+        # does not depend on the number of workers
+        for order, (aic, _) in zip(orders, scores):
+            if aic < best_aic:
+                best_aic = aic
+                best = order
+        return best, best_aic
+
+    def _select_d(self, y: pd.Series) -> int:
+        """Smallest d in grid_d whose differenced series passes the ADF test (5%)."""
+        grid = sorted(set(self.grid_d))
+        for d in grid:
+            z = np.diff(y.to_numpy(), n=d) if d > 0 else y.to_numpy()
+            try:
+                if EDAAnalyzer.adf_test(pd.Series(z))["p_value"] < 0.05:
+                    return d
+            except Exception:
+                continue
+        return grid[-1]
+
+    def _stepwise_search(self, y: pd.Series) -> Tuple[Optional[Tuple[int,int,int]], Dict[str, int]]:
+        """Hyndman-Khandakar style neighbourhood walk over (p, q) at a fixed d."""
+        d = self._select_d(y)
+        P, Q = set(self.grid_p), set(self.grid_q)
+        starts = [(p, d, q) for p, q in ((2, 2), (0, 0), (1, 0), (0, 1)) if p in P and q in Q]
+        if not starts:
+            starts = [(min(P), d, min(Q))]
+
+        visited = set(starts)
+        scores = self._score_orders(y, starts)
+        fitted = sum(not pruned for _, pruned in scores)
+        pruned_n = sum(pruned for _, pruned in scores)
+        best, best_aic = self._best(starts, scores)
+
+        while best is not None:
+            p0, _, q0 = best
+            steps = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1))
+            cands = [(p0 + dp, d, q0 + dq) for dp, dq in steps
+                     if p0 + dp in P and q0 + dq in Q and (p0 + dp, d, q0 + dq) not in visited]
+            if not cands:
+                break
+            visited.update(cands)
+            scores = self._score_orders(y, cands, bound=best_aic)
+            fitted += sum(not pruned for _, pruned in scores)
+            pruned_n += sum(pruned for _, pruned in scores)
+            new_best, new_aic = self._best(cands, scores, best, best_aic)
+            if new_best == best:
+                break
+            best, best_aic = new_best, new_aic
+
+        grid_size = len(self.grid_p) * len(self.grid_d) * len(self.grid_q)
+        stats = {"grid_size": grid_size, "fitted": fitted, "pruned": pruned_n,
+                 "fits_avoided": grid_size - fitted}
+        return best, stats
+
+    @instrument.timed("arima.select_order")
     def select_order(self, y: pd.Series) -> Tuple[int,int,int]:
         y = pd.Series(y).astype(float).dropna()
-        best_aic = np.inf
-        best: Optional[Tuple[int,int,int]] = None
-
-        for p in self.grid_p:
-            for d in self.grid_d:
-                for q in self.grid_q:
-                    res = self._fit_try(y, (p,d,q), self.fit_maxiter)
-                    if res is None or not np.isfinite(getattr(res, "aic", np.inf)):
-                        continue
-                    if res.aic < best_aic:
-                        best_aic = res.aic
-                        best = (p,d,q)
+        y.index = pd.RangeIndex(len(y))
+        if self.search == "stepwise":
+            best, self.search_stats = self._stepwise_search(y)
+        else:
+            orders = [(p,d,q) for p in self.grid_p for d in self.grid_d for q in self.grid_q]
+            best, _ = self._best(orders, self._score_orders(y, orders))
+            self.search_stats = {"grid_size": len(orders), "fitted": len(orders),
+                                 "pruned": 0, "fits_avoided": 0}
 
         if best is None:
             best = (1,0,0)  # conservative fallback for returns
         self.order = best
         return best
 
-    def fit(self, y_train: pd.Series) -> "ARIMAModel":
+    def _cache_key(self, y: pd.Series) -> str:
+        spec = {
+            "order": self.order, "grid_p": self.grid_p, "grid_d": self.grid_d, "grid_q": self.grid_q,
+            "trend": self.trend, "fit_maxiter": self.fit_maxiter,
+            "enforce_stationarity": self.enforce_stationarity,
+            "enforce_invertibility": self.enforce_invertibility,
+            "search": self.search,
+            "prune_margin": self.prune_margin if self.search == "stepwise" else None,
+        }
+        return ARIMACache.make_key(y.to_numpy(), spec)
+
+    def _from_params(self, y: pd.Series, order: Tuple[int,int,int], params) -> Optional[object]:
+        """Rebuild results for known parameters with one Kalman filter pass (no MLE)."""
+        try:
+            return self._arima(y, order).filter(np.asarray(params, dtype=float))
+        except Exception:
+            return None
+
+    def fit(self, y_train: pd.Series, start_params: Optional[np.ndarray] = None) -> "ARIMAModel":
         y = pd.Series(y_train).astype(float).dropna()
         # Work on RangeIndex to avoid freq warnings
         y.index = pd.RangeIndex(len(y))
+        self._y = y
+        self._reset_update_state()
+        key = None
+        if self.cache is not None:
+            key = self._cache_key(y)
+            entry = self.cache.get(key)
+            if entry is not None:
+                order = tuple(entry["order"])
+                res = self._from_params(y, order, entry["params"])
+                if res is not None:
+                    self.order = order
+                    self._fit_res = res
+                    return self
+                self.cache.reject(key)  # unusable entry: refit below and overwrite it
         if self.order is None:
             self.select_order(y)
-        res = self._fit_try(y, self.order, self.fit_maxiter)
+        res = self._fit_try(y, self.order, self.fit_maxiter, start_params=start_params)
+        if res is None and start_params is not None:
+            res = self._fit_try(y, self.order, self.fit_maxiter)
         if res is None:
             # hard fallback
             self.order = (1,0,0)
@@ -91,6 +259,63 @@ class ARIMAModel:
             if res is None:
                 raise RuntimeError("ARIMA fit failed for all attempts.")
         self._fit_res = res
+        if key is not None:
+            self.cache.put(key, self.order, res.params, list(getattr(res, "param_names", []) or []))
+        return self
+
+    def _reset_update_state(self) -> None:
+        self._n_since_fit = 0
+        self._err_n = 0
+        self._err_sum = 0.0
+        self._err_sumsq = 0.0
+
+    def _drifted(self) -> bool:
+        """CUSUM-style check on standardized one-step errors since the last fit.
+
+        Under the fitted model the errors are ~N(0,1): the mean test catches a level
+        shift, the sum-of-squares test a change in volatility.
+        """
+        if self.drift_threshold is None or self._err_n == 0:
+            return False
+        n = self._err_n
+        z_mean = abs(self._err_sum) / np.sqrt(n)
+        z_var = abs(self._err_sumsq - n) / np.sqrt(2.0 * n)
+        return bool(max(z_mean, z_var) > self.drift_threshold)
+
+    def update(self, y_new) -> "ARIMAModel":
+        """Append new observations by extending the Kalman filter with the current params.
+
+        A full re-estimate (same order, warm-started from the current params) only runs
+        once ``refit_every`` observations have arrived or the drift check fires;
+        ``last_update_refit`` tells which path the call took.
+        """
+        if self._fit_res is None:
+            raise RuntimeError("Model not fitted.")
+        new = pd.Series(y_new).astype(float).dropna()
+        self.last_update_refit = False
+        if new.empty:
+            return self
+        n0 = len(self._y)
+        new = pd.Series(new.to_numpy(), index=pd.RangeIndex(n0, n0 + len(new)))
+        self._y = pd.concat([self._y, new])
+
+        res = self._fit_res.extend(new)
+        err = np.asarray(res.standardized_forecasts_error, dtype=float).ravel()
+        err = err[np.isfinite(err)]
+        self._n_since_fit += len(new)
+        self._err_n += len(err)
+        self._err_sum += float(err.sum())
+        self._err_sumsq += float((err ** 2).sum())
+
+        due = self.refit_every is not None and self._n_since_fit >= self.refit_every
+        if due or self._drifted():
+            refit = self._fit_try(self._y, self.order, self.fit_maxiter,
+                                  start_params=self._fit_res.params)
+            if refit is not None:
+                res = refit
+                self.last_update_refit = True
+                self._reset_update_state()
+        self._fit_res = res
         return self
 
     def forecast(self, steps: int) -> np.ndarray:
@@ -106,3 +331,51 @@ class ARIMAModel:
         mean = np.asarray(f.predicted_mean)
         conf = f.conf_int(alpha=alpha).to_numpy()
         return mean, conf
+
+    @staticmethod
+    def _psd_sqrt(P: np.ndarray) -> np.ndarray:
+        # L with L @ L.T == P for a possibly singular PSD matrix (diffuse/integrated states)
+        w, V = np.linalg.eigh(0.5 * (P + P.T))
+        return V * np.sqrt(np.clip(w, 0.0, None))
+
+    def simulate(self, steps: int, n_paths: int = 1000, seed: Optional[int] = None,
+                 dtype=np.float64, chunk: int = 4096) -> np.ndarray:
+        """Draw ``n_paths`` future paths of y from the fitted state-space model.
+
+        Starts from the one-step-ahead predicted state distribution N(a, P) at
+        the end of the sample and iterates y = Z a + d + e, a' = T a + c + R n,
+        with every path of a chunk advanced together, so Python work is one
+        small matrix step per horizon per chunk. Returns (n_paths, steps);
+        ``dtype=np.float32`` halves memory, ``chunk`` bounds the temporaries.
+        """
+        if self._fit_res is None:
+            raise RuntimeError("Model not fitted.")
+        res = self._fit_res
+        fr = res.filter_results
+        mats = [fr.design, fr.obs_intercept, fr.obs_cov, fr.transition,
+                fr.state_intercept, fr.selection, fr.state_cov]
+        if any(m.shape[-1] > 1 for m in mats):
+            # time-varying system (e.g. a time trend): use the statsmodels simulator
+            sim = res.simulate(nsimulations=steps, repetitions=n_paths, anchor="end",
+                               random_state=np.random.default_rng(seed))
+            return np.asarray(sim, dtype=dtype).reshape(steps, n_paths).T
+        Z, d, H, T, c, R, Q = (np.asarray(m[..., 0], dtype=dtype) for m in mats)
+        Z, d, H = Z[0], d[0], float(H[0, 0])
+        a0 = np.asarray(res.predicted_state[:, -1], dtype=dtype)
+        P0 = self._psd_sqrt(res.predicted_state_cov[:, :, -1]).astype(dtype)
+        RL = (R @ self._psd_sqrt(Q)).astype(dtype)
+        h_sd = np.sqrt(max(H, 0.0))
+
+        rng = np.random.default_rng(seed)
+        out = np.empty((n_paths, steps), dtype=dtype)
+        k, kq = len(a0), RL.shape[1]
+        for lo in range(0, n_paths, chunk):
+            m = min(chunk, n_paths - lo)
+            a = a0 + rng.standard_normal((m, k), dtype=dtype) @ P0.T
+            for t in range(steps):
+                y = a @ Z + d
+                if h_sd > 0:
+                    y += h_sd * rng.standard_normal(m, dtype=dtype)
+                out[lo:lo + m, t] = y
+                a = a @ T.T + c + rng.standard_normal((m, kq), dtype=dtype) @ RL.T
+        return out
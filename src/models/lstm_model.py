@@ -1,16 +1,42 @@
 from __future__ import annotations
 import numpy as np
 import pandas as pd
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Union
 
-try:
-    # Only import if available (Windows+Py3.13 may lack wheels)
+from .windows import WindowBatches, make_windows, n_windows
+
+if TYPE_CHECKING:
     from tensorflow.keras.models import Sequential
-    from tensorflow.keras.layers import LSTM, Dense, Dropout
-    from tensorflow.keras.callbacks import EarlyStopping
-    TENSORFLOW_AVAILABLE = True
-except Exception:  # ImportError or runtime issues
-    TENSORFLOW_AVAILABLE = False
+
+_tf_module = None  # tensorflow once imported, False if the import failed
+
+
+def _tf():
+    """Import TensorFlow on first use (it costs seconds); None if unavailable."""
+    global _tf_module
+    if _tf_module is None:
+        try:
+            # Only import if available (Windows+Py3.13 may lack wheels)
+            import tensorflow
+            _tf_module = tensorflow
+        except Exception:  # ImportError or runtime issues
+            _tf_module = False
+    return _tf_module or None
+
+
+def _require_tf():
+    tf = _tf()
+    if tf is None:
+        raise ImportError("TensorFlow is not available. Install TF (prefer Python 3.11) to use LSTMModel.")
+    return tf
+
+
+def __getattr__(name: str):
+    # TENSORFLOW_AVAILABLE is resolved when first asked for, not at import
+    if name == "TENSORFLOW_AVAILABLE":
+        return _tf() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class LSTMModel:
     """Univariate LSTM forecaster for returns. Requires TensorFlow/Keras."""
@@ -21,44 +47,104 @@ class LSTMModel:
         self.dropout = dropout
         self.seed = seed
         self.model: Optional[Sequential] = None
+        self._calls: Dict[bool, object] = {}  # compiled model calls keyed by `training`
 
     def _make_windows(self, arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        X, y = [], []
-        for i in range(len(arr) - self.lookback - self.horizon + 1):
-            X.append(arr[i:i+self.lookback, 0])
-            y.append(arr[i+self.lookback:i+self.lookback+self.horizon, 0])
-        X = np.array(X).reshape(-1, self.lookback, 1)
-        y = np.array(y).reshape(-1, self.horizon)
-        return X, y
-
-    def fit(self, train: pd.Series, epochs: int = 30, batch_size: int = 32, verbose: int = 0) -> "LSTMModel":
-        if not TENSORFLOW_AVAILABLE:
-            raise ImportError("TensorFlow is not available. Install TF (prefer Python 3.11) to use LSTMModel.")
+        # strided views over column 0: X (n, lookback, 1), y (n, horizon)
+        return make_windows(arr[:, :1], self.lookback, self.horizon, target=0)
+
+    def _streams(self, tr: np.ndarray, batch_size: int, validation_split: float = 0.1):
+        # tf.data pipelines over window batches; the last `validation_split` of
+        # the windows are held out, like Keras' validation_split on arrays
+        n = n_windows(len(tr), self.lookback, self.horizon)
+        n_train = n - int(n * validation_split)
+        tf = _require_tf()
+        spec = (tf.TensorSpec((None, self.lookback, 1), tf.float32),
+                tf.TensorSpec((None, self.horizon), tf.float32))
+
+        def ds(start, stop, shuffle):
+            batches = WindowBatches(tr[:, :1], self.lookback, self.horizon, batch_size, start=start, stop=stop,
+                                    shuffle=shuffle, seed=self.seed)
+            return tf.data.Dataset.from_generator(lambda: iter(batches), output_signature=spec)
+
+        # training windows reshuffled every epoch, as Keras' fit(shuffle=True) does on arrays
+        return ds(0, n_train, True), (ds(n_train, n, False) if n_train < n else None)
+
+    def fit(self, train: pd.Series, epochs: int = 30, batch_size: int = 32, verbose: int = 0,
+            warm_start: bool = False, stream: bool = False) -> "LSTMModel":
+        """Train on windows of ``train``.
+
+        With ``stream=True`` windows are fed batch by batch from strided views
+        instead of materializing the (n, lookback, 1) training tensor, which is
+        ``lookback`` times the size of the series.
+        """
+        tf = _require_tf()
         np.random.seed(self.seed)
         tr = pd.Series(train).astype(float).dropna().values.reshape(-1,1)
+        # warm_start keeps the trained weights and continues training on the new data
+        if self.model is None or not warm_start:
+            layers = tf.keras.layers
+            self.model = tf.keras.models.Sequential([
+                layers.LSTM(self.units, input_shape=(self.lookback,1), return_sequences=False),
+                layers.Dropout(self.dropout),
+                layers.Dense(self.horizon)
+            ])
+            self.model.compile(loss="mse", optimizer="adam")
+            self._calls = {}
+        es = tf.keras.callbacks.EarlyStopping(patience=5, restore_best_weights=True)
+        if stream:
+            train_ds, val_ds = self._streams(tr, batch_size)
+            self.model.fit(train_ds, validation_data=val_ds, epochs=epochs, callbacks=[es], verbose=verbose)
+            return self
         Xtr, ytr = self._make_windows(tr)
-        self.model = Sequential([
-            LSTM(self.units, input_shape=(self.lookback,1), return_sequences=False),
-            Dropout(self.dropout),
-            Dense(self.horizon)
-        ])
-        self.model.compile(loss="mse", optimizer="adam")
-        es = EarlyStopping(patience=5, restore_best_weights=True)
         self.model.fit(Xtr, ytr, validation_split=0.1, epochs=epochs, batch_size=batch_size, callbacks=[es], verbose=verbose)
         return self
 
+    def _call(self, training: bool = False):
+        # one traced graph per model; skips predict()'s per-call setup and batching
+        fn = self._calls.get(training)
+        if fn is None:
+            model, tf = self.model, _require_tf()
+            fn = tf.function(lambda x: model(x, training=training), reduce_retracing=True)
+            self._calls[training] = fn
+        return fn
+
     def forecast(self, train: pd.Series, steps: int) -> np.ndarray:
-        if not TENSORFLOW_AVAILABLE:
-            raise ImportError("TensorFlow is not available. Install TF (prefer Python 3.11) to use LSTMModel.")
+        return self.forecast_batch([train], steps)[0]
+
+    def forecast_batch(self, histories: Union[np.ndarray, List[pd.Series]], steps: int,
+                       mc_samples: int = 0) -> np.ndarray:
+        """Recursive multi-step forecasts for many series in one batch.
+
+        histories: (B, T) array or list of series (NaNs dropped, last
+        ``lookback`` values used). Each step is one compiled model call on the
+        whole batch; predictions are written into a preallocated
+        (B, lookback + steps) buffer whose sliding slice is the next input.
+        With ``mc_samples > 0`` every series is replicated that many times and
+        run with dropout active (MC dropout): returns (B, mc_samples, steps),
+        otherwise (B, steps).
+        """
+        _require_tf()
         if self.model is None:
             raise RuntimeError("Model not fitted.")
-        history = pd.Series(train).astype(float).dropna().values.reshape(-1,1)
-        preds = []
-        window = history[-self.lookback:].reshape(1, self.lookback, 1)
-        for _ in range(steps):
-            yhat = float(self.model.predict(window, verbose=0)[0, 0])
-            preds.append(yhat)
-            # roll window
-            new_seq = np.concatenate([window.reshape(-1,1)[1:], np.array([[yhat]])], axis=0)
-            window = new_seq.reshape(1, self.lookback, 1)
-        return np.array(preds, dtype=float)
+        L = self.lookback
+        windows = []
+        for h in histories:
+            h = pd.Series(h).astype(float).dropna().to_numpy()
+            if len(h) < L:
+                raise ValueError(f"Need at least lookback={L} observations, got {len(h)}.")
+            windows.append(h[-L:])
+        start = np.asarray(windows, dtype=np.float32)
+        n_series = len(start)
+        reps = max(int(mc_samples), 1)
+        if mc_samples:
+            start = np.repeat(start, reps, axis=0)
+
+        buf = np.empty((len(start), L + steps, 1), dtype=np.float32)
+        buf[:, :L, 0] = start
+        call = self._call(training=bool(mc_samples))
+        for k in range(steps):
+            yhat = call(buf[:, k:k + L])
+            buf[:, L + k, 0] = np.asarray(yhat)[:, 0]
+        out = buf[:, L:, 0].astype(float)
+        return out.reshape(n_series, reps, steps) if mc_samples else out
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import Iterator, Optional, Sequence, Tuple, Union
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+Target = Union[int, Sequence[int]]
+
+
+def _as_2d(arr: np.ndarray) -> np.ndarray:
+    arr = np.asarray(arr)  # a memmap stays mapped; this is a view
+    return arr.reshape(-1, 1) if arr.ndim == 1 else arr
+
+
+def n_windows(n_obs: int, lookback: int, horizon: int = 1) -> int:
+    return max(n_obs - lookback - horizon + 1, 0)
+
+
+def make_windows(arr: np.ndarray, lookback: int, horizon: int = 1,
+                 target: Target = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Supervised (X, y) windows as strided, read-only views.
+
+    arr: (T,) or (T, F). X[i] = arr[i:i+lookback] with shape (n, lookback, F);
+    y[i] = arr[i+lookback:i+lookback+horizon, target] with shape (n, horizon)
+    for an int target, (n, horizon, k) for a list of k target columns.
+    X never copies; y is a view of ``arr`` for an int target or a contiguous
+    ascending run of columns, otherwise a view of a (T - lookback, k) copy of
+    the target columns. Index or ``np.ascontiguousarray`` them to copy.
+    """
+    arr = _as_2d(arr)
+    n = n_windows(len(arr), lookback, horizon)
+    if n == 0:
+        tshape = (horizon,) if np.isscalar(target) else (horizon, len(target))
+        return np.empty((0, lookback, arr.shape[1]), arr.dtype), np.empty((0, *tshape), arr.dtype)
+    # sliding_window_view puts the window axis last: (T-L+1, F, L) -> (n, L, F)
+    X = sliding_window_view(arr, lookback, axis=0)[:n].swapaxes(1, 2)
+    if np.isscalar(target):
+        tgt = arr[lookback:, target]
+    else:
+        cols = list(target)
+        run = bool(cols) and cols[0] >= 0 and cols == list(range(cols[0], cols[0] + len(cols)))
+        tgt = arr[lookback:, cols[0]:cols[0] + len(cols)] if run else arr[lookback:, cols]
+    y = sliding_window_view(tgt, horizon, axis=0)[:n]
+    if tgt.ndim == 2:
+        y = y.swapaxes(1, 2)  # (n, k, H) -> (n, H, k)
+    return X, y
+
+
+class WindowBatches:
+    """Re-iterable minibatches of windows; each ``iter()`` is one epoch.
+
+    Windows are cut from strided views and only a batch at a time is copied,
+    so ``arr`` can be a ``np.memmap`` (e.g. ``SharedReturns.values``) larger
+    than RAM. ``start``/``stop`` select a range of window indices (e.g. a
+    trailing validation block); ``shuffle`` permutes windows each epoch.
+    """
+
+    def __init__(self, arr: np.ndarray, lookback: int, horizon: int = 1, batch_size: int = 32,
+                 target: Target = 0, start: int = 0, stop: Optional[int] = None,
+                 shuffle: bool = False, seed: Optional[int] = None, dtype=np.float32) -> None:
+        self.X, self.y = make_windows(arr, lookback, horizon, target)
+        stop = len(self.X) if stop is None else min(stop, len(self.X))
+        self.idx = np.arange(start, stop)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.dtype = dtype
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return -(-len(self.idx) // self.batch_size)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        idx = self._rng.permutation(self.idx) if self.shuffle else self.idx
+        for a in range(0, len(idx), self.batch_size):
+            b = idx[a:a + self.batch_size]
+            if not self.shuffle:
+                b = slice(b[0], b[-1] + 1)  # contiguous block: one slice copy
+            yield self.X[b].astype(self.dtype), self.y[b].astype(self.dtype)
@@ -0,0 +1,379 @@
+"""End-to-end pipeline as a DAG of memoized stages.
+
+    python -m src.pipeline                          # run everything, reuse cached stages
+    python -m src.pipeline --target optimize        # only what optimize needs
+    python -m src.pipeline --refresh --workers 4    # pull new prices first
+    python -m src.pipeline --force covariance       # recompute one stage
+
+Stages wrap the existing classes: load (DataLoader) -> features
+(FeatureEngineer) -> forecast:<ticker> (BatchForecaster, one stage per
+ticker) -> expected_returns; covariance (PortfolioOptimizer) runs alongside
+the forecasts; optimize -> backtest (Backtester) -> plot (Plotter).
+
+Each stage's cache key hashes its name, ``version``, JSON-encoded params and
+the content hashes (sha256 of the pickled output) of its dependencies. The
+source stage's params carry a content hash of the raw cache files, so only
+stages downstream of an actual change re-execute; a stage that re-runs and
+reproduces the same output leaves its dependents cached. Stages whose real
+output is files on disk (plots) list them in ``files``: their content hashes
+are stored with the cached entry, and the stage re-runs when any of them is
+missing or was modified. Outputs live under
+``Settings.cache_dir`` as ``<stage>/<key>.pkl`` and are only unpickled when a
+running stage or the caller needs them.
+"""
+from __future__ import annotations
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from .backtest.backtester import BacktestConfig, Backtester
+from .batch_forecast import BatchForecaster
+from .config import Settings
+from .data_loader import DataLoader
+from .features import FeatureEngineer
+from .forecast import ForecastRequest
+from .portfolio.optimizer import PortfolioInputs, PortfolioOptimizer
+from .utils import instrument
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    fn: Callable[..., object]          # fn(*dependency outputs); must be picklable for processes
+    deps: Tuple[str, ...] = ()
+    params: Dict[str, object] = field(default_factory=dict)  # JSON-encodable, part of the key
+    version: str = "1"                 # bump when the stage's code changes its output
+    files: Tuple[str, ...] = ()        # files the stage writes; a cache hit needs them unchanged
+
+
+class StageCache:
+    """Pickled stage outputs keyed by content hash: ``root/<stage>/<key>.pkl`` + ``.json`` meta."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def _path(self, stage: str, key: str, ext: str) -> Path:
+        return self.root / stage.replace(":", "__") / f"{key}{ext}"
+
+    def meta(self, stage: str, key: str) -> Optional[Dict[str, object]]:
+        path = self._path(stage, key, ".json")
+        if not path.exists() or not self._path(stage, key, ".pkl").exists():
+            return None
+        return json.loads(path.read_text())
+
+    def load(self, stage: str, key: str) -> object:
+        return pickle.loads(self._path(stage, key, ".pkl").read_bytes())
+
+    def save(self, stage: str, key: str, blob: bytes, meta: Dict[str, object]) -> None:
+        path = self._path(stage, key, ".pkl")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for target, data in ((path, blob), (self._path(stage, key, ".json"), json.dumps(meta).encode())):
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, target)  # payload first, so a meta file always has its payload
+
+
+def _digest(obj: object) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _execute(stage: Stage, args: tuple) -> Tuple[bytes, str, float]:
+    """Run one stage; returns (pickled output, its sha256, seconds). Module level for process pools."""
+    t0 = time.perf_counter()
+    with instrument.stage(f"pipeline.{stage.name}"):
+        out = stage.fn(*args)
+    blob = pickle.dumps(out, protocol=pickle.HIGHEST_PROTOCOL)
+    return blob, hashlib.sha256(blob).hexdigest(), time.perf_counter() - t0
+
+
+@dataclass
+class PipelineRun:
+    """Per-stage status ("ran" | "cached"), seconds and cache key; ``run[name]`` loads an output."""
+    status: Dict[str, str]
+    seconds: Dict[str, float]
+    keys: Dict[str, str]
+    cache: StageCache
+    _values: Dict[str, object] = field(default_factory=dict, repr=False)
+
+    def __getitem__(self, name: str) -> object:
+        if name not in self._values:
+            self._values[name] = self.cache.load(name, self.keys[name])
+        return self._values[name]
+
+    def table(self) -> pd.DataFrame:
+        return pd.DataFrame({"status": self.status, "seconds": self.seconds,
+                             "key": {k: v[:12] for k, v in self.keys.items()}})
+
+
+class Pipeline:
+    """Runs a DAG of ``Stage``s, skipping any stage whose key is already cached.
+
+    Ready stages are submitted together to a thread (default) or process pool,
+    so independent branches run concurrently.
+    """
+
+    def __init__(self, stages: Sequence[Stage], cache: StageCache, max_workers: int = 4,
+                 executor: str = "thread") -> None:
+        self.stages: Dict[str, Stage] = {}
+        for s in stages:
+            missing = [d for d in s.deps if d not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {s.name!r} depends on unknown or later stages {missing}.")
+            self.stages[s.name] = s
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+        self.cache = cache
+        self.max_workers = max_workers
+        self.executor = executor
+
+    def _needed(self, targets: Optional[Iterable[str]]) -> List[str]:
+        if targets is None:
+            return list(self.stages)
+        need: Set[str] = set()
+        todo = list(targets)
+        while todo:
+            name = todo.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage {name!r}; have {list(self.stages)}")
+            if name not in need:
+                need.add(name)
+                todo.extend(self.stages[name].deps)
+        return [n for n in self.stages if n in need]  # keep definition (topological) order
+
+    def _pool(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def run(self, targets: Optional[Iterable[str]] = None, force: Iterable[str] = ()) -> PipelineRun:
+        order = self._needed(targets)
+        force = set(force)
+        run = PipelineRun({}, {}, {}, self.cache)
+        out_hash: Dict[str, str] = {}
+        pending = list(order)
+        running = {}
+        with self._pool() as pool:
+            while pending or running:
+                for name in [n for n in pending if all(d in out_hash for d in self.stages[n].deps)]:
+                    pending.remove(name)
+                    s = self.stages[name]
+                    key = _digest({"stage": s.name, "version": s.version, "params": s.params,
+                                   "deps": [out_hash[d] for d in s.deps]})
+                    run.keys[name] = key
+                    meta = None if name in force else self.cache.meta(name, key)
+                    if meta is not None and s.files and meta.get("files") != _file_hashes(s.files):
+                        meta = None  # side-effect outputs deleted or changed on disk
+                    if meta is not None:
+                        out_hash[name] = meta["output"]
+                        run.status[name], run.seconds[name] = "cached", 0.0
+                        instrument.count("pipeline.cached")
+                        continue
+                    args = tuple(run[d] for d in s.deps)
+                    running[pool.submit(_execute, s, args)] = name
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    blob, digest, seconds = fut.result()
+                    meta = {"output": digest, "seconds": seconds, "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+                    if self.stages[name].files:
+                        meta["files"] = _file_hashes(self.stages[name].files)
+                    self.cache.save(name, run.keys[name], blob, meta)
+                    out_hash[name] = digest
+                    run.status[name], run.seconds[name] = "ran", seconds
+                    instrument.count("pipeline.ran")
+                    rec = instrument.recorder()
+                    if rec is not None and self.executor == "process":
+                        # the worker's own recorder is lost with the process
+                        rec.record(instrument.StageRecord(f"pipeline.{name}", seconds))
+        return run
+
+
+# ---- project DAG -----------------------------------------------------------
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    forecast: ForecastRequest = ForecastRequest(steps=252)  # 12-month ARIMA forecast per ticker
+    forecast_tickers: Optional[Tuple[str, ...]] = None      # None = every ticker
+    cov_method: str = "sample"
+    n_points: int = 60                                      # efficient frontier grid
+    backtest: Optional[BacktestConfig] = None               # None = defaults with Settings.risk_free_rate
+    benchmark: Optional[Tuple[Tuple[str, float], ...]] = None  # None = Backtester's 60/40 SPY/BND
+
+
+def _fingerprint(paths: Dict[str, Path]) -> Dict[str, Optional[str]]:
+    out = {}
+    for t, p in paths.items():
+        out[t] = hashlib.sha256(p.read_bytes()).hexdigest() if p.exists() else None
+    return out
+
+
+def _file_hashes(files: Iterable[str]) -> Dict[str, Optional[str]]:
+    return _fingerprint({f: Path(f) for f in files})
+
+
+def _train_end(bt: BacktestConfig) -> pd.Timestamp:
+    # forecasts, means and covariance only see data before the backtest window
+    return pd.Timestamp(bt.start) - pd.Timedelta(days=1)
+
+
+def _load(cfg: Settings):
+    return DataLoader(cfg).load_all_list()
+
+
+def _features(cfg: Settings, frames):
+    return FeatureEngineer(cfg).pipeline(frames)
+
+
+def _forecast(req: ForecastRequest, ticker: str, train_end: pd.Timestamp, features) -> pd.DataFrame:
+    res = BatchForecaster(req).run(features.loc[:train_end], [ticker])
+    row = res.summary.loc[ticker]
+    if row["status"] != "ok":
+        # BatchForecaster never raises; fail the stage so a missing forecast is not cached
+        raise RuntimeError(f"ARIMA forecast for {ticker} failed: {row['error']}")
+    if not (res.forecasts["ticker"] == ticker).any():
+        raise RuntimeError(f"ARIMA forecast for {ticker} returned no rows")
+    # only the forecast rows: the summary's wall-clock timings would change the
+    # output hash on every re-run and invalidate the dependents
+    return res.forecasts
+
+
+def _expected_returns(cfg: Settings, tickers: List[str], train_end: pd.Timestamp, features, *forecasts):
+    exp = PortfolioOptimizer(cfg.risk_free_rate).build_expected_returns(
+        features.loc[:train_end], tickers, tsla_mode="historical")
+    for fc in forecasts:
+        # mean daily log-return forecast, annualized as in build_expected_returns
+        for t, g in fc.groupby("ticker"):
+            exp[t] = float(g["ret_mean"].mean() * 252)
+    return exp
+
+
+def _covariance(cfg: Settings, tickers: List[str], train_end: pd.Timestamp, method: str, features):
+    return PortfolioOptimizer(cfg.risk_free_rate).build_covariance(
+        features, tickers, end=str(train_end.date()), method=method)
+
+
+def _optimize(cfg: Settings, n_points: int, exp: pd.Series, cov: pd.DataFrame) -> Dict[str, object]:
+    opt = PortfolioOptimizer(cfg.risk_free_rate)
+    inputs = PortfolioInputs(list(exp.index), exp, cov, cfg.risk_free_rate)
+    out: Dict[str, object] = {"frontier": opt.efficient_frontier(inputs, n_points=n_points),
+                              "min_vol": opt.min_volatility(inputs)}
+    try:
+        out["max_sharpe"] = opt.max_sharpe(inputs)
+        out["choice"] = "max_sharpe"
+    except Exception:  # e.g. no asset beats the risk-free rate
+        out["max_sharpe"] = None
+        out["choice"] = "min_vol"
+    out["weights"] = dict(out[out["choice"]][0])
+    return out
+
+
+def _backtest(bt: BacktestConfig, tickers: List[str], benchmark, features, optimized):
+    rets = features[[f"{t}_ret" for t in tickers]].dropna()
+    rets.columns = tickers
+    return Backtester(rets, bt).run(optimized["weights"], dict(benchmark) if benchmark else None)
+
+
+_PLOT_FILES = ("efficient_frontier.png", "backtest_cumreturns.png")
+
+
+def _plot(cfg: Settings, optimized, result) -> List[str]:
+    from .utils.plotting import Plotter
+    pl = Plotter(cfg.reports_figures_dir)
+    ms = optimized["max_sharpe"] or optimized["min_vol"]
+    mv = optimized["min_vol"]
+    paths = [pl.efficient_frontier(optimized["frontier"], (ms[1][1], ms[1][0]), (mv[1][1], mv[1][0]),
+                                   "Efficient Frontier", _PLOT_FILES[0]),
+             pl.cumulative_returns(result.cumrets, "Backtest: Strategy vs Benchmark", _PLOT_FILES[1])]
+    return [str(p) for p in paths]
+
+
+def build_pipeline(cfg: Settings, opts: Optional[PipelineConfig] = None) -> List[Stage]:
+    """The project's stages for ``cfg``; raw cache files must already exist (see ``--refresh``)."""
+    opts = opts or PipelineConfig()
+    bt = opts.backtest or BacktestConfig(rf_annual=cfg.risk_free_rate)
+    tickers = list(cfg.tickers)
+    train_end = _train_end(bt)
+    dl = DataLoader(cfg)
+    raw = _fingerprint({t: dl.cache_path(t) for t in tickers})
+    window = {"train_end": str(train_end.date())}
+    req = dataclasses.asdict(opts.forecast)
+
+    stages = [
+        Stage("load", partial(_load, cfg), params={"raw": raw, "format": cfg.data_format}),
+        Stage("features", partial(_features, cfg), ("load",)),
+    ]
+    fc = [f"forecast:{t}" for t in (opts.forecast_tickers or tickers)]
+    for name in fc:
+        t = name.split(":", 1)[1]
+        stages.append(Stage(name, partial(_forecast, opts.forecast, t, train_end), ("features",),
+                            {"request": req, **window}))
+    stages += [
+        Stage("expected_returns", partial(_expected_returns, cfg, tickers, train_end), ("features", *fc),
+              {"rf": cfg.risk_free_rate, "tickers": tickers, **window}),
+        Stage("covariance", partial(_covariance, cfg, tickers, train_end, opts.cov_method), ("features",),
+              {"method": opts.cov_method, "tickers": tickers, **window}),
+        Stage("optimize", partial(_optimize, cfg, opts.n_points), ("expected_returns", "covariance"),
+              {"rf": cfg.risk_free_rate, "n_points": opts.n_points}),
+        Stage("backtest", partial(_backtest, bt, tickers, opts.benchmark), ("features", "optimize"),
+              {"config": dataclasses.asdict(bt), "benchmark": opts.benchmark, "tickers": tickers}),
+        Stage("plot", partial(_plot, cfg), ("optimize", "backtest"),
+              {"figures_dir": str(cfg.reports_figures_dir)},
+              files=tuple(str(cfg.reports_figures_dir / f) for f in _PLOT_FILES)),
+    ]
+    return stages
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    d = Settings()
+    ap = argparse.ArgumentParser(prog="python -m src.pipeline", description=__doc__.split("\n\n")[0])
+    ap.add_argument("--tickers", nargs="+", default=d.tickers)
+    ap.add_argument("--start", default=d.start)
+    ap.add_argument("--end", default=d.end)
+    ap.add_argument("--risk-free-rate", type=float, default=d.risk_free_rate)
+    ap.add_argument("--data-format", choices=["csv", "parquet"], default=d.data_format)
+    ap.add_argument("--raw-dir", type=Path, default=d.data_raw_dir)
+    ap.add_argument("--processed-dir", type=Path, default=d.data_processed_dir)
+    ap.add_argument("--figures-dir", type=Path, default=d.reports_figures_dir)
+    ap.add_argument("--cache-dir", type=Path, default=d.cache_dir)
+    ap.add_argument("--refresh", action="store_true", help="incrementally download new prices first")
+    ap.add_argument("--target", nargs="+", help="stages to produce (default: all)")
+    ap.add_argument("--force", nargs="+", default=[], help="stages to recompute even if cached")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--executor", choices=["thread", "process"], default="thread")
+    ap.add_argument("--instrument", type=Path, help="write stage timings/counters JSON here")
+    args = ap.parse_args(argv)
+
+    cfg = Settings(start=args.start, end=args.end, tickers=list(args.tickers),
+                   risk_free_rate=args.risk_free_rate, seed=d.seed, data_format=args.data_format,
+                   data_raw_dir=args.raw_dir, data_processed_dir=args.processed_dir,
+                   reports_figures_dir=args.figures_dir, cache_dir=args.cache_dir)
+    if args.instrument:
+        instrument.enable(instrument.JSONSink(args.instrument))
+    try:
+        if args.refresh:
+            DataLoader(cfg).refresh()
+        pipe = Pipeline(build_pipeline(cfg), StageCache(cfg.cache_dir), args.workers, args.executor)
+        run = pipe.run(args.target, args.force)
+    finally:
+        instrument.disable()
+    print(run.table().to_string())
+    if "backtest" in run.keys:
+        print(run["backtest"].stats.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+import pandas as pd
+
+@dataclass(frozen=True)
+class FactorCovariance:
+    """Low-rank-plus-diagonal covariance B B' + diag(d), stored as (N x k) loadings.
+
+    Memory is O(N k) instead of O(N^2); ``to_frame`` densifies when a full matrix
+    is needed (e.g. for PortfolioInputs).
+    """
+    tickers: List[str]
+    loadings: np.ndarray   # B, (N x k)
+    specific: np.ndarray   # d, (N,)
+
+    def quad(self, w: np.ndarray) -> float:
+        """w' Σ w without forming Σ."""
+        w = np.asarray(w, dtype=float)
+        return float(np.sum((self.loadings.T @ w) ** 2) + np.sum(self.specific * w ** 2))
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        return self.loadings @ (self.loadings.T @ x) + self.specific * x
+
+    def scaled(self, factor: float) -> "FactorCovariance":
+        return FactorCovariance(self.tickers, self.loadings * np.sqrt(factor), self.specific * factor)
+
+    def to_frame(self) -> pd.DataFrame:
+        S = self.loadings @ self.loadings.T + np.diag(self.specific)
+        return pd.DataFrame(S, index=self.tickers, columns=self.tickers)
+
+
+class CovarianceEstimator:
+    """Daily covariance estimators that tolerate pairwise-missing data.
+
+    Missing values are handled pairwise: each column is demeaned on its own
+    observations, missing entries then contribute zero, and cross-products are
+    normalized by the number of rows both columns observe.
+    """
+
+    @staticmethod
+    def _centered(r: pd.DataFrame):
+        X = r.to_numpy(dtype=float)
+        M = np.isfinite(X)
+        mean = np.nanmean(np.where(M, X, np.nan), axis=0)
+        Z = np.where(M, X - mean, 0.0)
+        return Z, M.astype(float)
+
+    @staticmethod
+    def sample(r: pd.DataFrame, min_periods: int = 2) -> pd.DataFrame:
+        """Pairwise-complete sample covariance."""
+        return r.astype(float).cov(min_periods=min_periods)
+
+    @staticmethod
+    def ledoit_wolf(r: pd.DataFrame) -> pd.DataFrame:
+        """Ledoit-Wolf (2004) shrinkage toward a scaled identity.
+
+        With complete data this equals ``sklearn.covariance.ledoit_wolf``.
+        """
+        Z, M = CovarianceEstimator._centered(r)
+        counts = np.maximum(M.T @ M, 1.0)
+        n, p = Z.shape
+        S = (Z.T @ Z) / counts
+        n_eff = float(np.mean(np.diag(counts)))
+
+        # shrinkage intensity on the zero-filled data (sklearn's estimator)
+        Z2 = Z ** 2
+        trace = np.sum(Z2, axis=0) / n_eff
+        mu = trace.sum() / p
+        delta_ = np.sum((Z.T @ Z) ** 2) / n_eff ** 2
+        beta_ = np.sum(Z2.T @ Z2)
+        beta = (beta_ / n_eff - delta_) / (p * n_eff)
+        delta = (delta_ - 2.0 * mu * trace.sum() + p * mu ** 2) / p
+        beta = min(beta, delta)
+        shrink = 0.0 if delta <= 0 else beta / delta
+
+        target = np.trace(S) / p
+        C = (1.0 - shrink) * S + shrink * target * np.eye(p)
+        return pd.DataFrame(C, index=r.columns, columns=r.columns)
+
+    @staticmethod
+    def ewma(r: pd.DataFrame, halflife: float = 63.0) -> pd.DataFrame:
+        """Exponentially weighted covariance (most recent row weighs most)."""
+        X = r.to_numpy(dtype=float)
+        M = np.isfinite(X)
+        n = len(X)
+        wt = 0.5 ** (np.arange(n)[::-1] / halflife)
+        Wm = M * wt[:, None]
+        mean = np.where(M, X, 0.0).T @ wt / np.maximum(Wm.sum(axis=0), 1e-300)
+        Z = np.where(M, X - mean, 0.0) * np.sqrt(wt)[:, None]
+        Ms = M * np.sqrt(wt)[:, None]
+        C = (Z.T @ Z) / np.maximum(Ms.T @ Ms, 1e-300)
+        return pd.DataFrame(C, index=r.columns, columns=r.columns)
+
+    @staticmethod
+    def factor(r: pd.DataFrame, k: int = 5) -> FactorCovariance:
+        """Statistical (PCA) factor model from a truncated SVD of the returns panel.
+
+        Never forms the N x N matrix: loadings are the top-k right singular
+        vectors scaled by their singular values, and the specific variances are
+        what each asset's variance leaves after the factors.
+        """
+        Z, M = CovarianceEstimator._centered(r)
+        obs = np.maximum(M.sum(axis=0), 2.0)
+        k = int(max(1, min(k, min(Z.shape) - 1)))
+        _, s, Vt = np.linalg.svd(Z, full_matrices=False)
+        n_eff = float(np.mean(obs))
+        B = Vt[:k].T * (s[:k] / np.sqrt(n_eff - 1.0))
+        var = np.sum(Z ** 2, axis=0) / (obs - 1.0)
+        d = np.maximum(var - np.sum(B ** 2, axis=1), 1e-4 * var + 1e-16)
+        return FactorCovariance(list(r.columns), B, d)
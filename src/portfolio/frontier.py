@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple
+import numpy as np
+
+from ..utils import instrument
+
+class ParametricFrontier:
+    """Box-bounded efficient frontier from one warm-started parametric QP.
+
+    min w'Σw  s.t.  sum(w) = 1,  μ'w >= target,  lo <= w <= hi.
+
+    For a fixed active set (which weights sit on a bound) the KKT solution is
+    affine in the target, so one factorization serves every target until a free
+    weight hits a bound or a bound multiplier changes sign; only then is the
+    active set updated and the KKT system refactored. Targets are swept in
+    ascending order and each starts from the previous target's active set. A
+    target the active-set loop cannot settle falls back to a cvxpy solve.
+    """
+
+    def __init__(self, mu, cov, weight_bounds: Tuple[float, float] = (0.0, 1.0),
+                 tol: float = 1e-10, max_iter: Optional[int] = None) -> None:
+        self.mu = np.asarray(mu, dtype=float)
+        S = np.asarray(cov, dtype=float)
+        self.S = 0.5 * (S + S.T)
+        self.n = len(self.mu)
+        self.lo, self.hi = (float(b) for b in weight_bounds)
+        if self.n * self.lo > 1.0 + tol or self.n * self.hi < 1.0 - tol:
+            raise ValueError(f"weight_bounds {weight_bounds} cannot sum to 1 over {self.n} assets.")
+        self.tol = tol
+        self.max_iter = max_iter or 4 * self.n + 10
+        self.n_factorizations = 0
+        self.n_fallbacks = 0
+        # -1 = at lower bound, 0 = free, +1 = at upper bound
+        self._state = np.zeros(self.n, dtype=np.int8)
+        self._key: Optional[Tuple[bytes, bool]] = None
+        self._affine_cache = None
+
+    def _affine(self, with_target: bool):
+        """(w0, w1, lam0, lam1) with w(t) = w0 + t*w1 and multipliers lam(t) = lam0 + t*lam1."""
+        key = (self._state.tobytes(), with_target)
+        if key == self._key:
+            return self._affine_cache
+        F = self._state == 0
+        k = int(F.sum())
+        wB = np.where(self._state < 0, self.lo, self.hi) * (~F)
+        m = 2 if with_target else 1
+        K = np.zeros((k + m, k + m))
+        K[:k, :k] = self.S[np.ix_(F, F)]
+        K[:k, k] = -1.0
+        K[k, :k] = 1.0
+        rhs = np.zeros((k + m, 2))
+        rhs[:k, 0] = -self.S[F] @ wB
+        rhs[k, 0] = 1.0 - wB.sum()
+        if with_target:
+            K[:k, k + 1] = -self.mu[F]
+            K[k + 1, :k] = self.mu[F]
+            rhs[k + 1, 0] = -self.mu @ wB
+            rhs[k + 1, 1] = 1.0
+        x = np.linalg.solve(K, rhs)  # raises LinAlgError on a singular active set
+        self.n_factorizations += 1
+        w0, w1 = wB.copy(), np.zeros(self.n)
+        w0[F], w1[F] = x[:k, 0], x[:k, 1]
+        lam0 = np.r_[x[k:, 0], 0.0][:2]
+        lam1 = np.r_[x[k:, 1], 0.0][:2]
+        self._key, self._affine_cache = key, (w0, w1, lam0, lam1)
+        return self._affine_cache
+
+    def _active_set(self, t: Optional[float]) -> Optional[np.ndarray]:
+        """Active-set iterations at one target (None = min variance); None if unsettled."""
+        with_target = t is not None
+        tv = 0.0 if t is None else t
+        for _ in range(self.max_iter):
+            try:
+                w0, w1, lam0, lam1 = self._affine(with_target)
+            except np.linalg.LinAlgError:
+                return None
+            w = w0 + tv * w1
+            lam = lam0 + tv * lam1
+            free = self._state == 0
+            below = np.where(free, self.lo - w, 0.0)
+            above = np.where(free, w - self.hi, 0.0)
+            worst = np.maximum(below, above)
+            i = int(np.argmax(worst))
+            if worst[i] > self.tol:
+                self._state[i] = -1 if below[i] >= above[i] else 1
+                continue
+            g = self.S @ w - lam[0] - lam[1] * self.mu
+            viol = np.where(self._state < 0, -g, np.where(self._state > 0, g, 0.0))
+            j = int(np.argmax(viol))
+            if viol[j] > self.tol * max(1.0, float(np.abs(g).max())):
+                self._state[j] = 0
+                continue
+            return np.clip(w, self.lo, self.hi)
+        return None
+
+    def _fallback(self, t: Optional[float]) -> Optional[np.ndarray]:
+        import cvxpy as cp  # only needed when the active-set loop gives up
+
+        self.n_fallbacks += 1
+        instrument.count("frontier.qp.fallback")
+        w = cp.Variable(self.n)
+        cons = [cp.sum(w) == 1, w >= self.lo, w <= self.hi]
+        if t is not None:
+            cons.append(self.mu @ w >= t)
+        prob = cp.Problem(cp.Minimize(cp.quad_form(w, cp.psd_wrap(self.S))), cons)
+        try:
+            prob.solve(solver=cp.CLARABEL)
+        except cp.error.SolverError:
+            return None
+        if prob.status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE) or w.value is None:
+            return None
+        wv = np.clip(np.asarray(w.value, dtype=float), self.lo, self.hi)
+        # resume the parametric sweep from the fallback's active set
+        self._state = np.where(wv <= self.lo + 1e-7, -1, np.where(wv >= self.hi - 1e-7, 1, 0)).astype(np.int8)
+        return wv
+
+    def _max_return_portfolio(self) -> np.ndarray:
+        w = np.full(self.n, self.lo)
+        budget = 1.0 - w.sum()
+        for i in np.argsort(-self.mu, kind="stable"):
+            add = min(self.hi - self.lo, budget)
+            w[i] += add
+            budget -= add
+            if budget <= 0:
+                break
+        return w
+
+    def min_volatility(self) -> Optional[np.ndarray]:
+        self._state[:] = 0
+        w = self._active_set(None)
+        return w if w is not None else self._fallback(None)
+
+    def sweep(self, targets) -> Tuple[np.ndarray, List[str]]:
+        """Weights (len(targets) x n, NaN where unsolved) and a status per target."""
+        targets = np.asarray(targets, dtype=float)
+        W = np.full((len(targets), self.n), np.nan)
+        status = ["infeasible"] * len(targets)
+
+        w_mv = self.min_volatility()
+        if w_mv is None:
+            return W, ["solver_error"] * len(targets)
+        r_mv = float(self.mu @ w_mv)
+        mv_state = self._state.copy()
+        w_top = self._max_return_portfolio()
+        r_top = float(self.mu @ w_top)
+
+        for i in np.argsort(targets, kind="stable"):
+            t = float(targets[i])
+            if t <= r_mv:
+                W[i], status[i] = w_mv, "optimal"
+                self._state = mv_state.copy()
+                continue
+            if t > r_top + 1e-12:
+                continue
+            if t >= r_top - 1e-12:
+                W[i], status[i] = w_top, "optimal"
+                continue
+            w = self._active_set(t)
+            if w is None:
+                w = self._fallback(t)
+            if w is not None:
+                W[i], status[i] = w, "optimal"
+            else:
+                status[i] = "solver_error"
+        if instrument.enabled():
+            instrument.count("frontier.qp.solved", status.count("optimal"))
+            instrument.count("frontier.qp.infeasible", status.count("infeasible"))
+            instrument.count("frontier.qp.solver_error", status.count("solver_error"))
+        return W, status
@@ -1,9 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List, Union
 import numpy as np
 import pandas as pd
-from pypfopt import expected_returns, risk_models, EfficientFrontier
+
+from ..shared import SharedReturns
+from ..utils import instrument
+from .covariance import CovarianceEstimator
+from .frontier import ParametricFrontier
 
 @dataclass
 class PortfolioInputs:
@@ -30,7 +34,7 @@ class PortfolioOptimizer:
 
     def build_expected_returns(
         self,
-        returns_df: pd.DataFrame,
+        returns_df: Union[pd.DataFrame, SharedReturns],
         use_tickers: List[str],
         tsla_forecast_csv: Optional[str] = None,
         tsla_mode: str = "forecast_12m",  # "forecast_12m" | "historical"
@@ -60,12 +64,21 @@ class PortfolioOptimizer:
 
     def build_covariance(
         self,
-        returns_df: pd.DataFrame,
+        returns_df: Union[pd.DataFrame, SharedReturns],
         use_tickers: List[str],
         start: Optional[str] = None,
-        end: Optional[str] = None
+        end: Optional[str] = None,
+        method: str = "sample",
+        **kwargs,
     ) -> pd.DataFrame:
-       
+        """Annualized covariance of the ``*_ret`` columns.
+
+        method: "sample" (complete rows only, the original estimator), "pairwise"
+        (pairwise-complete sample), "ledoit_wolf", "ewma" (``halflife=``) or
+        "factor" (``k=``; densified here, use ``CovarianceEstimator.factor`` to
+        keep the N x k form). ``returns_df`` may be a ``SharedReturns`` store;
+        only the selected columns are read from it.
+        """
         cols = [f"{t}_ret" for t in use_tickers]
         r = returns_df[cols].copy()
         r.columns = use_tickers
@@ -73,33 +86,45 @@ class PortfolioOptimizer:
             r = r.loc[pd.to_datetime(start):]
         if end:
             r = r.loc[:pd.to_datetime(end)]
-        return self._annualize_cov_daily(r)
+        if method == "sample":
+            return self._annualize_cov_daily(r)
+        if method == "pairwise":
+            return CovarianceEstimator.sample(r, **kwargs) * 252.0
+        if method == "ledoit_wolf":
+            return CovarianceEstimator.ledoit_wolf(r) * 252.0
+        if method == "ewma":
+            return CovarianceEstimator.ewma(r, **kwargs) * 252.0
+        if method == "factor":
+            return CovarianceEstimator.factor(r, **kwargs).to_frame() * 252.0
+        raise ValueError(f"Unknown covariance method: {method!r}")
 
+    @instrument.timed("portfolio.efficient_frontier")
     def efficient_frontier(
-        self, inputs: PortfolioInputs, n_points: int = 50
+        self, inputs: PortfolioInputs, n_points: int = 50,
+        weight_bounds: Tuple[float, float] = (0.0, 1.0)
     ) -> pd.DataFrame:
-        
-        mu = inputs.exp_returns_ann
-        S  = inputs.cov_ann
-        ef = EfficientFrontier(mu, S)
-        r_min, r_max = float(mu.min()), float(mu.max())
-        grid = np.linspace(r_min, r_max, n_points)
-
-        vols, rets = [], []
-        for target in grid:
-            ef_tmp = EfficientFrontier(mu, S)
-            try:
-                ef_tmp.efficient_return(target_return=target)
-                perf = ef_tmp.portfolio_performance(risk_free_rate=inputs.rf_rate)
-                vols.append(perf[1])  # volatility
-                rets.append(perf[0])  # expected return
-            except Exception:
-                # some targets are infeasible
-                continue
+        """Frontier over n_points target returns in [min μ, max μ] from one parametric solve.
+
+        One row per target, sorted by vol: target, ret, vol, status and one weight
+        column per ticker. Infeasible targets are kept with NaNs and their status.
+        """
+        mu = inputs.exp_returns_ann.astype(float)
+        tickers = list(mu.index)
+        S = inputs.cov_ann.loc[tickers, tickers].to_numpy(dtype=float)
+        grid = np.linspace(float(mu.min()), float(mu.max()), n_points)
+
+        pf = ParametricFrontier(mu.to_numpy(), S, weight_bounds)
+        W, status = pf.sweep(grid)
+        ret = W @ mu.to_numpy()
+        vol = np.sqrt(np.maximum(np.einsum("ij,jk,ik->i", W, S, W), 0.0))
 
-        return pd.DataFrame({"vol": vols, "ret": rets}).sort_values("vol").reset_index(drop=True)
+        out = pd.DataFrame({"target": grid, "ret": ret, "vol": vol, "status": status})
+        out = pd.concat([out, pd.DataFrame(W, columns=tickers)], axis=1)
+        return out.sort_values("vol").reset_index(drop=True)
 
     def max_sharpe(self, inputs: PortfolioInputs) -> Tuple[Dict[str,float], Tuple[float,float,float]]:
+        from pypfopt import EfficientFrontier  # pulls in cvxpy; import on first use
+
         ef = EfficientFrontier(inputs.exp_returns_ann, inputs.cov_ann)
         w = ef.max_sharpe(risk_free_rate=inputs.rf_rate)
         cleaned = ef.clean_weights(cutoff=1e-4)
@@ -107,6 +132,8 @@ class PortfolioOptimizer:
         return cleaned, perf
 
     def min_volatility(self, inputs: PortfolioInputs) -> Tuple[Dict[str,float], Tuple[float,float,float]]:
+        from pypfopt import EfficientFrontier
+
         ef = EfficientFrontier(inputs.exp_returns_ann, inputs.cov_ann)
         w = ef.min_volatility()
         cleaned = ef.clean_weights(cutoff=1e-4)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from .optimizer import PortfolioInputs, PortfolioOptimizer
+
+class RollingMoments:
+    """Running sums and cross-products of daily returns for a sliding window.
+
+    ``add``/``remove`` are O(N^2) per row, against O(window x N^2) for a fresh
+    ``cov()``. Sums are kept around a fixed shift (the first row seen) to limit
+    cancellation; ``rebase`` recomputes them exactly from the current window.
+    """
+
+    def __init__(self, n_assets: int) -> None:
+        self.n_assets = n_assets
+        self.count = 0
+        self.shift: Optional[np.ndarray] = None
+        self.s1 = np.zeros(n_assets)
+        self.s2 = np.zeros((n_assets, n_assets))
+
+    def add(self, x: np.ndarray) -> None:
+        if self.shift is None:
+            self.shift = np.array(x, dtype=float)
+        z = x - self.shift
+        self.count += 1
+        self.s1 += z
+        self.s2 += np.outer(z, z)
+
+    def remove(self, x: np.ndarray) -> None:
+        z = x - self.shift
+        self.count -= 1
+        self.s1 -= z
+        self.s2 -= np.outer(z, z)
+
+    def rebase(self, rows: np.ndarray) -> None:
+        """Reset the sums from scratch for the given window rows (drops accumulated error)."""
+        self.count = len(rows)
+        self.shift = rows.mean(axis=0) if len(rows) else None
+        z = rows - (self.shift if self.shift is not None else 0.0)
+        self.s1 = z.sum(axis=0)
+        self.s2 = z.T @ z
+
+    def mean(self) -> np.ndarray:
+        return self.shift + self.s1 / self.count
+
+    def cov(self, ddof: int = 1) -> np.ndarray:
+        c = (self.s2 - np.outer(self.s1, self.s1) / self.count) / (self.count - ddof)
+        return 0.5 * (c + c.T)
+
+
+@dataclass(frozen=True)
+class RollingConfig:
+    window: int = 252               # trailing rows per estimate
+    freq: str = "M"                 # rebalance on the last trading day of each "W" | "M" | "Q"
+    objective: str = "max_sharpe"   # "max_sharpe" | "min_volatility"
+    min_obs: int = 60               # complete rows required before the first rebalance
+    rebase_every: int = 2520        # full recompute of the running sums after this many updates
+
+class RollingOptimizer:
+    """Walk-forward re-optimization on incrementally updated mean/covariance.
+
+    Rows with any missing return are skipped, as in ``build_covariance``.
+    ``run`` returns a weights time series (index = rebalance dates, columns =
+    tickers) for ``Backtester.run_schedule``; weights at date d use data up to
+    and including d. If max Sharpe is infeasible (no asset beats rf) the
+    rebalance falls back to min volatility.
+    """
+
+    def __init__(self, optimizer: Optional[PortfolioOptimizer] = None,
+                 cfg: Optional[RollingConfig] = None) -> None:
+        self.optimizer = optimizer or PortfolioOptimizer()
+        self.cfg = cfg or RollingConfig()
+        if self.cfg.objective not in ("max_sharpe", "min_volatility"):
+            raise ValueError(f"objective must be 'max_sharpe' or 'min_volatility', got {self.cfg.objective!r}")
+
+    @staticmethod
+    def rebalance_dates(index: pd.DatetimeIndex, freq: str) -> pd.DatetimeIndex:
+        key = np.asarray(pd.DatetimeIndex(index).to_period(freq).asi8)
+        last = np.r_[key[1:] != key[:-1], True]
+        return pd.DatetimeIndex(index)[last]
+
+    def _optimize(self, tickers: List[str], mu: np.ndarray, cov: np.ndarray) -> Dict[str, float]:
+        inputs = PortfolioInputs(
+            tickers=tickers,
+            exp_returns_ann=pd.Series(mu * 252, index=tickers),
+            cov_ann=pd.DataFrame(cov * 252.0, index=tickers, columns=tickers),
+            rf_rate=self.optimizer.rf_rate,
+        )
+        if self.cfg.objective == "max_sharpe":
+            try:
+                return self.optimizer.max_sharpe(inputs)[0]
+            except Exception:
+                pass
+        return self.optimizer.min_volatility(inputs)[0]
+
+    def run(self, returns_df: pd.DataFrame, use_tickers: List[str]) -> pd.DataFrame:
+        r = returns_df[[f"{t}_ret" for t in use_tickers]].sort_index().astype(float)
+        X = r.to_numpy()
+        ok = np.isfinite(X).all(axis=1)
+        dates = set(self.rebalance_dates(r.index, self.cfg.freq))
+
+        mom = RollingMoments(len(use_tickers))
+        out: Dict[pd.Timestamp, Dict[str, float]] = {}
+        updates = 0
+        for i, dt in enumerate(r.index):
+            if ok[i]:
+                mom.add(X[i])
+                updates += 1
+            j = i - self.cfg.window
+            if j >= 0 and ok[j]:
+                mom.remove(X[j])
+                updates += 1
+            if updates >= self.cfg.rebase_every:
+                rows = X[max(0, i - self.cfg.window + 1): i + 1]
+                mom.rebase(rows[np.isfinite(rows).all(axis=1)])
+                updates = 0
+            if dt in dates and mom.count >= max(self.cfg.min_obs, 2):
+                out[dt] = self._optimize(list(use_tickers), mom.mean(), mom.cov())
+
+        weights = pd.DataFrame.from_dict(out, orient="index", columns=list(use_tickers)).fillna(0.0)
+        weights.index.name = "Date"
+        return weights
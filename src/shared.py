@@ -0,0 +1,97 @@
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+import numpy as np
+import pandas as pd
+
+
+class SharedReturns:
+    """Read-only float64 (dates x columns) matrix shared between processes.
+
+    Layout of ``path`` (a directory): ``values.npy`` (C-order float64),
+    ``dates.npy`` (datetime64) and ``columns.json``. The values are opened with
+    ``np.load(mmap_mode="r")`` so every process maps the same page-cache pages,
+    and instances pickle as their path only, so handing one to a process pool
+    costs a few bytes instead of a copy of the frame per worker.
+
+    Indexing mirrors a DataFrame for the read paths the repo uses:
+    ``store["SPY_ret"]`` is a Series view, ``store[["A", "B"]]`` a DataFrame,
+    ``to_frame()`` the whole matrix without copying.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.values: np.ndarray = np.load(self.path / "values.npy", mmap_mode="r")
+        self.index = pd.DatetimeIndex(np.load(self.path / "dates.npy"), name="Date")
+        self.columns: List[str] = json.loads((self.path / "columns.json").read_text())
+        self._pos = {c: i for i, c in enumerate(self.columns)}
+
+    @classmethod
+    def create(cls, df: pd.DataFrame, path: Union[str, Path]) -> "SharedReturns":
+        """Write ``df`` (DatetimeIndex, numeric columns) to ``path`` and open it."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        df = df.sort_index()
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+        tmp = path / f"values.{os.getpid()}.tmp.npy"
+        np.save(tmp, values)
+        os.replace(tmp, path / "values.npy")
+        np.save(path / "dates.npy", pd.DatetimeIndex(df.index).to_numpy())
+        (path / "columns.json").write_text(json.dumps([str(c) for c in df.columns]))
+        return cls(path)
+
+    @classmethod
+    def allocate(cls, path: Union[str, Path], index: pd.DatetimeIndex, columns: List[str]) -> np.memmap:
+        """Create an empty store at ``path`` and return its writable values mapping.
+
+        For producers that fill the matrix incrementally (e.g. column chunks);
+        open the result with ``SharedReturns(path)`` once the writes are flushed.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "dates.npy", pd.DatetimeIndex(index).to_numpy())
+        (path / "columns.json").write_text(json.dumps([str(c) for c in columns]))
+        return np.lib.format.open_memmap(path / "values.npy", mode="w+", dtype=np.float64,
+                                         shape=(len(index), len(columns)))
+
+    def __reduce__(self):
+        return (self.__class__, (str(self.path),))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __contains__(self, col: str) -> bool:
+        return col in self._pos
+
+    def column(self, col: str) -> pd.Series:
+        """One column as a Series over the mapped memory (strided view, no copy)."""
+        return pd.Series(self.values[:, self._pos[col]], index=self.index, name=col, copy=False)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        return self.to_frame(columns=list(key))
+
+    def to_frame(self, columns: Optional[List[str]] = None,
+                 start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """DataFrame over the mapped values.
+
+        Row ranges are views; the full column set (or a contiguous run of
+        columns) is a view too, any other column subset is copied.
+        """
+        lo = 0 if start is None else int(self.index.searchsorted(pd.Timestamp(start), side="left"))
+        hi = len(self.index) if end is None else int(self.index.searchsorted(pd.Timestamp(end), side="right"))
+        if columns is None:
+            cols, block = self.columns, self.values[lo:hi]
+        else:
+            pos = [self._pos[c] for c in columns]
+            contiguous = pos and pos == list(range(pos[0], pos[0] + len(pos)))
+            block = self.values[lo:hi, pos[0]:pos[0] + len(pos)] if contiguous else self.values[lo:hi][:, pos]
+            cols = list(columns)
+        return pd.DataFrame(block, index=self.index[lo:hi], columns=cols, copy=False)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import pandas as pd
 from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
 @dataclass
 class TimeSeriesSplitter:
@@ -13,3 +14,37 @@ class TimeSeriesSplitter:
         train = s.loc[: self.train_end].dropna()
         test  = s.loc[self.test_start :].dropna()
         return train, test
+
+
+@dataclass
+class RollingOriginSplitter:
+    """Walk-forward splitter: many chronological folds with an advancing origin.
+
+    ``window="expanding"`` keeps every observation before the origin;
+    ``window="sliding"`` keeps only the last ``initial`` observations.
+    """
+    initial: int = 504          # training length of the first fold (obs)
+    horizon: int = 21           # test length per fold (obs)
+    step: int = 21              # origin advance between folds (obs)
+    window: str = "expanding"   # "expanding" | "sliding"
+    max_folds: Optional[int] = None  # keep only the most recent folds
+
+    def __post_init__(self) -> None:
+        if self.window not in ("expanding", "sliding"):
+            raise ValueError(f"window must be 'expanding' or 'sliding', got {self.window!r}")
+        if self.initial < 1 or self.horizon < 1 or self.step < 1:
+            raise ValueError("initial, horizon and step must be positive.")
+
+    def fold_bounds(self, n: int) -> List[Tuple[int, int, int]]:
+        """(train_start, origin, test_end) positional bounds for a series of length n."""
+        bounds = []
+        for origin in range(self.initial, n - self.horizon + 1, self.step):
+            start = 0 if self.window == "expanding" else origin - self.initial
+            bounds.append((start, origin, origin + self.horizon))
+        if self.max_folds is not None:
+            bounds = bounds[-self.max_folds:]
+        return bounds
+
+    def split(self, s: pd.Series) -> List[Tuple[pd.Series, pd.Series]]:
+        s = s.sort_index().dropna()
+        return [(s.iloc[a:o], s.iloc[o:b]) for a, o, b in self.fold_bounds(len(s))]
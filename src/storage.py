@@ -0,0 +1,104 @@
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except Exception:
+    PYARROW_AVAILABLE = False
+
+PRICE_COLS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+def normalize_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """Flatten yfinance output / legacy CSV rows into typed Date + price columns.
+
+    Drops the extra header rows that multi-level yfinance columns leave in CSVs
+    (their Date does not parse) and coerces prices to float64.
+    """
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    if "Date" not in df.columns:
+        df = df.reset_index()
+        df = df.rename(columns={df.columns[0]: "Date"})
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df = df.dropna(subset=["Date"])
+    for c in PRICE_COLS:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype("float64")
+    cols = ["Date"] + [c for c in PRICE_COLS if c in df.columns]
+    return df[cols].sort_values("Date").reset_index(drop=True)
+
+
+class ParquetStore:
+    """Columnar price cache partitioned by ticker: ``root/ticker=<T>/data.parquet``.
+
+    Row groups hold about a trading year each, so ``start``/``end`` filters skip
+    whole years on load, and ``columns`` reads only the requested columns.
+    """
+
+    def __init__(self, root: Path, row_group_size: int = 252) -> None:
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is not available. Install pyarrow to use the parquet data format.")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+
+    def path(self, ticker: str) -> Path:
+        return self.root / f"ticker={ticker}" / "data.parquet"
+
+    def tickers(self) -> List[str]:
+        return sorted(p.parent.name.split("=", 1)[1] for p in self.root.glob("ticker=*/data.parquet"))
+
+    def write(self, ticker: str, df: pd.DataFrame) -> Path:
+        path = self.path(ticker)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(normalize_prices(df), preserve_index=False)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        pq.write_table(table, tmp, row_group_size=self.row_group_size)
+        os.replace(tmp, path)  # readers never see a partial file
+        return path
+
+    @staticmethod
+    def _filters(start: Optional[str], end: Optional[str]):
+        flt = []
+        if start is not None:
+            flt.append(("Date", ">=", pd.Timestamp(start)))
+        if end is not None:
+            flt.append(("Date", "<=", pd.Timestamp(end)))
+        return flt or None
+
+    def read(self, ticker: str, columns: Optional[List[str]] = None,
+             start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        if columns is not None and "Date" not in columns:
+            columns = ["Date", *columns]
+        table = pq.read_table(self.path(ticker), columns=columns, filters=self._filters(start, end))
+        return table.to_pandas()
+
+    def read_many(self, tickers: Optional[List[str]] = None, columns: Optional[List[str]] = None,
+                  start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """Long frame with a Ticker column, read through one partitioned dataset scan."""
+        dataset = pds.dataset(self.root, format="parquet", partitioning="hive")
+        expr = None
+        if tickers is not None:
+            expr = pds.field("ticker").isin(list(tickers))
+        if start is not None:
+            e = pds.field("Date") >= pa.scalar(pd.Timestamp(start), type=pa.timestamp("ns"))
+            expr = e if expr is None else expr & e
+        if end is not None:
+            e = pds.field("Date") <= pa.scalar(pd.Timestamp(end), type=pa.timestamp("ns"))
+            expr = e if expr is None else expr & e
+        cols = None if columns is None else list(dict.fromkeys(["Date", *columns, "ticker"]))
+        df = dataset.to_table(columns=cols, filter=expr).to_pandas()
+        return df.rename(columns={"ticker": "Ticker"})
+
+    def migrate_csv(self, csv_dir: Path, tickers: Optional[List[str]] = None) -> Dict[str, Path]:
+        """One-shot conversion of a per-ticker CSV cache (``<csv_dir>/<T>.csv``)."""
+        csv_dir = Path(csv_dir)
+        tickers = tickers or sorted(p.stem for p in csv_dir.glob("*.csv"))
+        return {t: self.write(t, pd.read_csv(csv_dir / f"{t}.csv")) for t in tickers}
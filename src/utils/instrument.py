@@ -0,0 +1,296 @@
+"""Stage timers and counters for pipeline runs; off (and near free) by default.
+
+    from src.utils import instrument
+    with instrument.session(instrument.JSONSink("run.json"), profile=["features.merge_clean"]) as rec:
+        ...                                   # run the pipeline
+    rec.summary()                             # {"stages": {...}, "counters": {...}}
+
+Library code marks work with ``with instrument.stage("name"):`` or the
+``@instrument.timed("name")`` decorator and bumps counters with
+``instrument.count("name")``. While disabled, ``stage`` returns a shared
+no-op context and ``count`` returns after one flag check, so the hooks can
+stay on hot paths. Nested stages are recorded as ``outer/inner``.
+
+Stages listed in ``profile`` (or entered with ``profile=True``) run under
+cProfile and keep the top functions by cumulative time. Only one stage is
+profiled at a time; a profiled stage entered while another is being profiled
+runs unprofiled and bumps ``instrument.profile_skipped``. ``memory`` stages
+run under tracemalloc and record the peak traced allocation above what was
+already allocated when the stage started (nested memory stages each get their
+own correct peak).
+
+Counters and stages recorded in worker processes (e.g. ``ARIMAModel`` with
+``n_jobs > 1``) stay in those processes and are not aggregated.
+"""
+from __future__ import annotations
+import contextlib
+import functools
+import io
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+
+@dataclass
+class StageRecord:
+    name: str
+    seconds: float
+    peak_kib: Optional[float] = None   # tracemalloc peak above the stage's starting usage
+    profile: Optional[str] = None      # pstats report, top functions by cumulative time
+
+
+class MemorySink:
+    """Keeps every record in ``records`` (tests, notebooks)."""
+
+    def __init__(self) -> None:
+        self.records: List[StageRecord] = []
+        self.summary: Optional[Dict[str, object]] = None
+
+    def emit(self, rec: StageRecord) -> None:
+        self.records.append(rec)
+
+    def close(self, summary: Dict[str, object]) -> None:
+        self.summary = summary
+
+
+class LogSink:
+    """One log line per stage and the summary on close."""
+
+    def __init__(self, logger: Union[str, logging.Logger] = "src.instrument", level: int = logging.INFO) -> None:
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def emit(self, rec: StageRecord) -> None:
+        extra = f" peak={rec.peak_kib:.0f}KiB" if rec.peak_kib is not None else ""
+        self.logger.log(self.level, "stage %s %.4fs%s", rec.name, rec.seconds, extra)
+        if rec.profile:
+            self.logger.log(self.level, "profile %s\n%s", rec.name, rec.profile)
+
+    def close(self, summary: Dict[str, object]) -> None:
+        self.logger.log(self.level, "instrumentation summary %s", json.dumps(summary, sort_keys=True))
+
+
+class JSONSink:
+    """Writes ``{"summary": ..., "records": [...]}`` to ``path`` on close (atomic replace)."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.records: List[Dict[str, object]] = []
+
+    def emit(self, rec: StageRecord) -> None:
+        self.records.append(asdict(rec))
+
+    def close(self, summary: Dict[str, object]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"summary": summary, "records": self.records}, indent=2))
+        os.replace(tmp, self.path)
+
+
+class Recorder:
+    """Aggregates stage timings and counters and forwards each record to the sinks."""
+
+    def __init__(self, sinks: Iterable = (), profile: Iterable[str] = (), memory: Iterable[str] = (),
+                 profile_top: int = 20) -> None:
+        self.sinks = list(sinks)
+        self.profile = set(profile)
+        self.memory = set(memory)
+        self.profile_top = profile_top
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def record(self, rec: StageRecord) -> None:
+        with self._lock:
+            s = self.stages.get(rec.name)
+            if s is None:
+                s = self.stages[rec.name] = {"calls": 0, "total_s": 0.0, "max_s": 0.0}
+            s["calls"] += 1
+            s["total_s"] += rec.seconds
+            s["max_s"] = max(s["max_s"], rec.seconds)
+            if rec.peak_kib is not None:
+                s["peak_kib"] = max(s.get("peak_kib", 0.0), rec.peak_kib)
+        for sink in self.sinks:
+            sink.emit(rec)
+
+    def summary(self) -> Dict[str, object]:
+        with self._lock:
+            return {"stages": {k: dict(v) for k, v in self.stages.items()}, "counters": dict(self.counters)}
+
+    def close(self) -> None:
+        summary = self.summary()
+        for sink in self.sinks:
+            sink.close(summary)
+
+
+# memory stages currently open (any thread); tracemalloc has one process-wide peak,
+# so before a stage resets it the peak so far is folded into every open stage
+_mem_lock = threading.Lock()
+_mem_open: List["_Stage"] = []
+
+# one cProfile at a time: before 3.12 a second enable() silently replaces the
+# active profiler, so nested or concurrent profiled stages are not profiled
+_prof_lock = threading.Lock()
+_prof_active = False
+
+
+class _Stage:
+    __slots__ = ("rec", "name", "profile", "memory", "path", "t0", "_prof", "_traced", "_base", "_seen")
+
+    def __init__(self, rec: Recorder, name: str, profile: bool, memory: bool) -> None:
+        self.rec, self.name = rec, name
+        self.profile = profile or name in rec.profile
+        self.memory = memory or name in rec.memory
+
+    def __enter__(self) -> "_Stage":
+        stack = self.rec._stack()
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self._prof = None
+        self._traced = False
+        if self.memory:
+            import tracemalloc
+            with _mem_lock:
+                self._traced = not tracemalloc.is_tracing()
+                if self._traced:
+                    tracemalloc.start()
+                cur, peak = tracemalloc.get_traced_memory()
+                for other in _mem_open:
+                    other._seen = max(other._seen, peak)
+                tracemalloc.reset_peak()
+                self._base = self._seen = cur
+                _mem_open.append(self)
+        if self.profile:
+            self._prof = _start_profile()
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        dt = time.perf_counter() - self.t0
+        self.rec._stack().pop()
+        peak = report = None
+        if self._prof is not None:
+            import pstats
+            _stop_profile(self._prof)
+            buf = io.StringIO()
+            pstats.Stats(self._prof, stream=buf).sort_stats("cumulative").print_stats(self.rec.profile_top)
+            report = buf.getvalue()
+        if self.memory:
+            import tracemalloc
+            with _mem_lock:
+                _mem_open.remove(self)
+                top = max(self._seen, tracemalloc.get_traced_memory()[1])
+                peak = (top - self._base) / 1024
+                if self._traced and _mem_open:
+                    _mem_open[-1]._traced = True  # another thread's stage still needs tracing
+                elif self._traced:
+                    tracemalloc.stop()
+        self.rec.record(StageRecord(self.path, dt, peak, report))
+        return False
+
+
+def _start_profile():
+    global _prof_active
+    import cProfile
+    with _prof_lock:
+        if _prof_active:
+            count("instrument.profile_skipped")
+            return None
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:  # a profiler outside this module is active (3.12+)
+            count("instrument.profile_skipped")
+            return None
+        _prof_active = True
+        return prof
+
+
+def _stop_profile(prof) -> None:
+    global _prof_active
+    with _prof_lock:
+        prof.disable()
+        _prof_active = False
+
+
+_NULL = contextlib.nullcontext()
+_recorder: Optional[Recorder] = None
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def recorder() -> Optional[Recorder]:
+    return _recorder
+
+
+def enable(*sinks, profile: Iterable[str] = (), memory: Iterable[str] = (), profile_top: int = 20) -> Recorder:
+    """Start recording to ``sinks``; ``profile``/``memory`` name stages to capture."""
+    global _recorder
+    _recorder = Recorder(sinks, profile, memory, profile_top)
+    return _recorder
+
+
+def disable() -> Optional[Recorder]:
+    """Stop recording, close the sinks and return the finished recorder."""
+    global _recorder
+    rec, _recorder = _recorder, None
+    if rec is not None:
+        rec.close()
+    return rec
+
+
+@contextlib.contextmanager
+def session(*sinks, profile: Iterable[str] = (), memory: Iterable[str] = (), profile_top: int = 20):
+    rec = enable(*sinks, profile=profile, memory=memory, profile_top=profile_top)
+    try:
+        yield rec
+    finally:
+        if _recorder is rec:
+            disable()
+
+
+def stage(name: str, profile: bool = False, memory: bool = False):
+    """Context manager timing ``name``; a shared no-op while disabled."""
+    rec = _recorder
+    if rec is None:
+        return _NULL
+    return _Stage(rec, name, profile, memory)
+
+
+def count(name: str, n: int = 1) -> None:
+    rec = _recorder
+    if rec is not None:
+        rec.count(name, n)
+
+
+def timed(name: str) -> Callable:
+    """Decorator form of ``stage``."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            rec = _recorder
+            if rec is None:
+                return fn(*args, **kwargs)
+            with _Stage(rec, name, False, False):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
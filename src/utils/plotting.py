@@ -1,15 +1,24 @@
 from __future__ import annotations
 from pathlib import Path
-import matplotlib.pyplot as plt
 import pandas as pd
 
+from . import instrument
+
+
+def _plt():
+    import matplotlib.pyplot as plt  # slow to import; only loaded when plotting
+    return plt
+
+
 class Plotter:
     
     def __init__(self, out_dir: Path) -> None:
         self.out_dir = out_dir
         self.out_dir.mkdir(parents=True, exist_ok=True)
 
+    @instrument.timed("plot.line")
     def line(self, df: pd.DataFrame, cols: list[str], title: str, fname: str) -> Path:
+        plt = _plt()
         ax = df[cols].plot(figsize=(10, 5))
         ax.set_title(title)
         ax.set_xlabel("Date")
@@ -20,7 +29,9 @@ class Plotter:
         plt.close()
         return path
 
+    @instrument.timed("plot.series")
     def series(self, s: pd.Series, title: str, fname: str) -> Path:
+        plt = _plt()
         ax = s.plot(figsize=(10, 4))
         ax.set_title(title)
         ax.set_xlabel("Date")
@@ -29,8 +40,10 @@ class Plotter:
         plt.savefig(path)
         plt.close()
         return path
+    @instrument.timed("plot.line_with_ci")
     def line_with_ci(self, mean: pd.Series, lower: pd.Series, upper: pd.Series,
                      title: str, fname: str, ylabel: str = "Value") -> Path:
+        plt = _plt()
         
         self.out_dir.mkdir(parents=True, exist_ok=True)
         fig, ax = plt.subplots(figsize=(10,5))
@@ -41,7 +54,9 @@ class Plotter:
         path = self.out_dir / fname
         plt.tight_layout(); plt.savefig(path); plt.close()
         return path
+    @instrument.timed("plot.efficient_frontier")
     def efficient_frontier(self, frontier_df, maxpt, minvolpt, title, fname):
+        plt = _plt()
         
         
         self.out_dir.mkdir(parents=True, exist_ok=True)
@@ -56,6 +71,7 @@ class Plotter:
         path = self.out_dir / fname
         plt.tight_layout(); plt.savefig(path); plt.close()
         return path
+    @instrument.timed("plot.cumulative_returns")
     def cumulative_returns(self, cum_df, title, fname, ylabel="Cumulative Growth ($1 start)"):
         
         import matplotlib.pyplot as plt
@@ -29,3 +29,66 @@ def test_backtester_monthly_rebal():
     res = bt.run(strategy_weights={"TSLA":0.3,"BND":0.2,"SPY":0.5})
     # shapes consistent
     assert len(res.daily) == len(R.loc[cfg.start:cfg.end])
+
+def _loop_pv(R, w, monthly):
+    # reference daily sleeve loop
+    alloc, out, last = w.copy(), [], R.index[0].month
+    for dt, row in R.iterrows():
+        alloc = alloc * (1.0 + row.values)
+        out.append(alloc.sum())
+        if monthly and dt.month != last:
+            alloc = out[-1] * w
+        last = dt.month
+    return np.array(out)
+
+def test_vectorized_path_matches_loop():
+    np.random.seed(1)
+    R = _synth_returns(300)
+    w = np.array([0.3, 0.2, 0.5])
+    for reb in ("none", "monthly"):
+        mask = Backtester._rebalance_mask(R.index, reb)
+        pv = Backtester._pv_path(R.to_numpy(), w, mask)
+        np.testing.assert_allclose(pv, _loop_pv(R, w, reb == "monthly"), rtol=1e-12)
+
+def test_run_batch_matches_run():
+    np.random.seed(2)
+    R = _synth_returns()
+    cfg = BacktestConfig(start="2024-08-01", end=str(R.index[-1].date()), rebalance="monthly", rf_annual=0.02)
+    bt = Backtester(R, cfg)
+    W = pd.DataFrame([[0.3, 0.2, 0.5], [0.0, 0.4, 0.6], [1.0, 1.0, 2.0]],
+                     columns=["TSLA","BND","SPY"], index=["a","b","c"])
+    stats = bt.run_batch(W)
+    assert list(stats.index) == ["a","b","c"]
+    single = bt.run(strategy_weights={"TSLA":0.3,"BND":0.2,"SPY":0.5}).stats.loc["strategy"]
+    np.testing.assert_allclose(stats.loc["a"].to_numpy(), single.to_numpy(), rtol=1e-9)
+
+def _loop_band(R, w, band, cost):
+    # reference daily loop with drift-band rebalancing and proportional costs
+    alloc, out = w.copy(), []
+    for row in R.to_numpy():
+        alloc = alloc * (1.0 + row)
+        pv = alloc.sum()
+        if np.abs(alloc / pv - w).max() > band:
+            pv -= cost * np.abs(pv * w - alloc).sum()
+            alloc = pv * w
+        out.append(pv)
+    return np.array(out)
+
+def test_band_rebalance_with_costs_matches_loop():
+    np.random.seed(3)
+    R = _synth_returns(300)
+    w = np.array([0.3, 0.2, 0.5])
+    pv, turnover, paid = Backtester._run_events(R.to_numpy(), w, np.zeros(len(R), bool),
+                                                costs=np.full(3, 0.001), band=0.03, chunk=7)
+    np.testing.assert_allclose(pv, _loop_band(R, w, 0.03, 0.001), rtol=1e-12)
+    assert (turnover > 0).sum() == (paid > 0).sum() > 0
+
+def test_calendar_schedules_and_costs():
+    np.random.seed(4)
+    R = _synth_returns()
+    assert Backtester._rebalance_mask(R.index, "weekly").sum() > Backtester._rebalance_mask(R.index, "quarterly").sum()
+    cfg = BacktestConfig(start="2024-08-01", end=str(R.index[-1].date()), rebalance="quarterly",
+                         rf_annual=0.02, costs={"TSLA": 0.002, "SPY": 0.0005})
+    res = Backtester(R, cfg).run(strategy_weights={"TSLA":0.3,"BND":0.2,"SPY":0.5})
+    assert res.stats.loc["strategy", "cost_drag"] > 0
+    assert (res.turnover["strategy"] > 0).sum() == 4
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+from src.batch_forecast import BatchForecaster
+from src.forecast import ForecastRequest
+
+def _features(n=300):
+    np.random.seed(0)
+    idx = pd.date_range("2020-01-01", periods=n, freq="B")
+    out = {}
+    for t in ["AAA", "BBB"]:
+        r = np.random.normal(0, 0.01, n)
+        out[t] = 100 * np.exp(np.cumsum(r))
+        out[f"{t}_logret"] = r
+    out["BAD"] = np.full(n, 10.0)
+    out["BAD_logret"] = np.nan  # no usable history
+    return pd.DataFrame(out, index=idx)
+
+def test_batch_forecast_isolates_failures():
+    req = ForecastRequest(steps=10, grid_p=range(0,2), grid_d=range(0,1), grid_q=range(0,2))
+    res = BatchForecaster(req, n_jobs=2).run(_features())
+    assert res.summary.loc["AAA", "status"] == "ok"
+    assert res.summary.loc["BAD", "status"] == "failed"
+    assert set(res.forecasts["ticker"]) == {"AAA", "BBB"}
+    assert len(res.forecasts) == 20
+    assert res.wide("px_mean").shape == (10, 2)
+    assert (res.summary.loc[["AAA","BBB"], "fit_seconds"] > 0).all()
@@ -0,0 +1,30 @@
+from benchmarks import suite
+
+
+def _res(**medians):
+    return {"results": {k: {"median": v, "min": v, "repeat": 1} for k, v in medians.items()}}
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    base = _res(a=1.0, b=1.0, c=1.0)
+    base["results"]["skipped"] = {"skipped": "tensorflow not installed"}
+    rows = {r["key"]: r["status"] for r in suite.compare(base, _res(a=1.1, b=1.5, c=0.5, skipped=1.0), 0.2)}
+    assert rows == {"a": "ok", "b": "REGRESSION", "c": "faster"}
+    assert suite.report(suite.compare(base, _res(a=1.1), 0.2), 0.2) == 0
+    assert suite.report(suite.compare(base, _res(b=1.5), 0.2), 0.2) == 1
+
+
+def test_quick_run_records_timings():
+    res = suite.run(["backtest.simulate_path"], quick=True, log=lambda *_: None)
+    (key, r), = res["results"].items()
+    assert key == "backtest.simulate_path[days=504,tickers=3]"
+    assert 0 < r["min"] <= r["median"] and res["meta"]["numpy"]
+
+
+def test_setup_cleanup_runs_after_timing(monkeypatch):
+    calls = []
+    monkeypatch.setitem(suite.REGISTRY, "x.cleanup",
+                        suite.Case("x.cleanup", lambda n: (lambda: calls.append(n), lambda: calls.append("done")),
+                                   [{"n": 1}], [{"n": 1}], repeat=2))
+    suite.run(["x.cleanup"], quick=True, log=lambda *_: None)
+    assert calls == [1, 1, 1, "done"]
@@ -24,3 +24,53 @@ def test_load_all_list_with_existing_csvs(tmp_path, monkeypatch):
     frames = dl.load_all_list()
     assert len(frames) == 3
     assert all("Ticker" in f.columns for f in frames)
+
+
+class _FakeYahoo:
+    """Offline stand-in for yf.download over a fixed price history."""
+
+    def __init__(self, n=300, fail_first=0):
+        idx = pd.bdate_range("2024-01-01", periods=n)
+        px = pd.Series(range(100, 100 + n), index=idx, dtype=float)
+        self.truth = pd.DataFrame({"Date": idx, "Open": px.values, "High": px.values, "Low": px.values,
+                                   "Close": px.values, "Adj Close": px.values, "Volume": 1000.0})
+        self.calls = []
+        self.fail_first = fail_first
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        if self.fail_first:
+            self.fail_first -= 1
+            raise ConnectionError("rate limited")
+        d = self.truth["Date"]
+        return self.truth[(d >= pd.Timestamp(start)) & (d < pd.Timestamp(end))].copy()
+
+
+def test_refresh_appends_tail_and_backfills_on_restatement(tmp_path):
+    cfg = Settings(start="2024-01-01", end="2024-06-01", tickers=["SPY", "BND"],
+                   data_raw_dir=tmp_path / "raw", data_processed_dir=tmp_path / "processed",
+                   reports_figures_dir=tmp_path / "figs")
+    fake = _FakeYahoo(fail_first=1)
+    dl = DataLoader(cfg, downloader=fake, max_workers=2, backoff=0.0)
+    res = dl.refresh()
+    assert {r.mode for r in res.values()} == {"full"}
+    assert all(r.path == dl.cache_path(t) == cfg.data_raw_dir / f"{t}.csv" for t, r in res.items())
+
+    cfg2 = Settings(start=cfg.start, end="2024-07-01", tickers=cfg.tickers, data_raw_dir=cfg.data_raw_dir,
+                    data_processed_dir=cfg.data_processed_dir, reports_figures_dir=cfg.reports_figures_dir)
+    fake.calls.clear()
+    res = DataLoader(cfg2, downloader=fake).refresh(overlap=3)
+    assert all(r.mode == "append" and r.new_rows == 20 for r in res.values())
+    assert all(pd.Timestamp(s) > pd.Timestamp("2024-05-20") for _, s, _ in fake.calls)
+    spy = DataLoader(cfg2).load_csv("SPY")
+    expected = fake.truth[fake.truth["Date"] < "2024-07-01"]
+    assert spy["Date"].is_monotonic_increasing and len(spy) == len(expected)
+
+    # a 2:1 split restates all earlier Adj Close values
+    fake.truth["Adj Close"] /= 2
+    cfg3 = Settings(start=cfg.start, end="2024-08-01", tickers=["SPY"], data_raw_dir=cfg.data_raw_dir,
+                    data_processed_dir=cfg.data_processed_dir, reports_figures_dir=cfg.reports_figures_dir)
+    res = DataLoader(cfg3, downloader=fake).refresh()
+    assert res["SPY"].mode == "backfill"
+    spy = DataLoader(cfg3).load_csv("SPY")
+    assert spy["Adj Close"].iloc[0] == fake.truth["Adj Close"].iloc[0]
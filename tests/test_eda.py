@@ -14,3 +14,23 @@ def test_var_sharpe():
     r = pd.Series(np.random.normal(0.0005, 0.01, 252))
     assert isinstance(EDAAnalyzer.var_95(r), float)
     assert isinstance(EDAAnalyzer.sharpe(r), float)
+
+def test_panel_methods_match_per_series():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(0.0005, 0.01, (300, 4)), columns=["A", "B", "C", "D"])
+    df.iloc[50:55, 1] = np.nan
+    df.iloc[:40, 2] = np.nan
+
+    roll = EDAAnalyzer.rolling_stats_panel(df, windows=(1, 5, 21))
+    for t in df.columns:
+        pd.testing.assert_frame_equal(roll[t], EDAAnalyzer.rolling_stats(df[t], windows=(1, 5, 21)),
+                                      check_names=False, rtol=1e-9, atol=1e-12)
+
+    risk = EDAAnalyzer.risk_panel(df)
+    for t in df.columns:
+        assert np.isclose(risk.loc[t, "sharpe"], EDAAnalyzer.sharpe(df[t]))
+        assert np.isclose(risk.loc[t, "var_95"], EDAAnalyzer.var_95(df[t]))
+
+    adf = EDAAnalyzer.adf_panel(df, n_jobs=2)
+    assert list(adf.index) == list(df.columns)
+    assert np.isclose(adf.loc["C", "p_value"], EDAAnalyzer.adf_test(df["C"])["p_value"])
@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+from src.evaluation import WalkForwardEvaluator
+from src.splits import RollingOriginSplitter
+
+def test_walk_forward_arima_parallel():
+    np.random.seed(0)
+    idx = pd.date_range("2020-01-01", periods=300, freq="B")
+    s = pd.Series(np.random.normal(0, 0.01, 300), index=idx)
+    sp = RollingOriginSplitter(initial=200, horizon=5, step=20)
+    ev = WalkForwardEvaluator(sp, model="arima", n_jobs=2,
+                              model_kwargs=dict(grid_p=range(0,2), grid_d=range(0,1), grid_q=range(0,2)))
+    res = ev.run(s)
+    assert len(res.folds) == len(sp.fold_bounds(300))
+    assert (res.folds["status"] == "ok").all()
+    assert list(res.by_horizon.index) == [1, 2, 3, 4, 5]
+    assert np.isfinite(res.folds["rmse"]).all()
@@ -30,3 +30,31 @@ def test_pipeline_generates_returns(tmp_path):
     out = fe.pipeline([a,b,c])
     assert "TSLA" in out.columns and "TSLA_ret" in out.columns and "TSLA_logret" in out.columns
     assert (cfg.data_processed_dir / "merged_features.csv").exists()
+
+
+def test_pipeline_chunked_matches_pipeline(tmp_path):
+    import numpy as np
+    cfg = Settings(
+        data_raw_dir=tmp_path / "raw",
+        data_processed_dir=tmp_path / "processed",
+        reports_figures_dir=tmp_path / "figs",
+    )
+    fe = FeatureEngineer(cfg)
+    rng = np.random.default_rng(3)
+    raw = {}
+    for i, t in enumerate(["SPY", "AAA", "TSLA", "BND", "ZZZ"]):
+        # ragged histories with gaps and junk values
+        idx = pd.bdate_range("2024-01-01", periods=80)[i * 3: 80 - i]
+        px = 50 * np.cumprod(1 + rng.normal(0, 0.01, len(idx)))
+        df = pd.DataFrame({"Date": idx.astype(str), "Adj Close": px.astype(object), "Ticker": t})
+        df.loc[5 + i, "Adj Close"] = "n/a"
+        df = df.drop(index=[10 + i])
+        df["Open"] = df["High"] = df["Low"] = df["Close"] = df["Adj Close"]
+        df["Volume"] = 100
+        raw[t] = df
+
+    expected = fe.pipeline(list(raw.values()))
+    store = fe.pipeline_chunked(lambda t: raw[t], list(raw), chunk_size=2)
+    pd.testing.assert_frame_equal(store.to_frame(), expected, check_freq=False, check_index_type=False,
+                                  check_names=False, check_exact=True)
+    assert not (cfg.data_processed_dir / "merged_features.partial").exists()
@@ -27,3 +27,27 @@ def test_arima_forecast_shapes():
     assert out.ret_mean.shape == (63,)
     assert out.px_mean.shape == (63,)
     assert np.all(np.isfinite(out.px_mean.values))
+
+
+def test_arima_simulate_matches_analytic_forecast():
+    rng = np.random.default_rng(0)
+    eps = rng.normal(0, 0.01, 600)
+    r = np.zeros(600)
+    for t in range(1, 600):
+        r[t] = 0.4 * r[t - 1] + eps[t]
+    s = pd.Series(r, index=pd.bdate_range("2020-01-01", periods=600))
+    req = ForecastRequest(steps=21, grid_p=range(0, 2), grid_d=range(0, 1), grid_q=range(0, 1))
+    fore = ARIMAForecaster(req).fit(s)
+
+    sims = fore.model.simulate(21, n_paths=20000, seed=1)
+    mean, conf = fore.model.forecast_with_ci(21)
+    sd = (conf[:, 1] - conf[:, 0]) / (2 * 1.959963984540054)
+    np.testing.assert_allclose(sims.mean(axis=0), mean, atol=4 * sd.max() / np.sqrt(20000))
+    np.testing.assert_allclose(sims.std(axis=0), sd, rtol=0.03)
+
+    out = fore.simulate(s, price_train_last=100.0, last_train_date=s.index[-1], n_paths=5000, seed=2,
+                        dtype=np.float32, chunk=1024)
+    assert list(out.px_bands.columns) == ["q05", "q25", "q50", "q75", "q95"]
+    assert (out.px_bands.diff(axis=1).iloc[:, 1:] >= 0).all().all()
+    assert out.terminal.shape == (5000,) and out.cvar >= out.var > 0
+    assert out.var_path.index.equals(out.index)
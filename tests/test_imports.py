@@ -0,0 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ["tensorflow", "cvxpy", "pypfopt", "statsmodels", "matplotlib", "yfinance"]
+
+
+def test_public_modules_do_not_import_heavy_dependencies():
+    code = (
+        "import sys\n"
+        "import src.data_loader, src.features, src.eda, src.forecast, src.batch_forecast, src.evaluation\n"
+        "import src.models.lstm_model, src.portfolio.optimizer, src.portfolio.rolling\n"
+        "import src.backtest.backtester, src.utils.plotting, src.utils.instrument, src.utils.online\n"
+        "import src.pipeline\n"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
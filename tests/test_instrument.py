@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+
+from src.models.arima_model import ARIMAModel
+from src.portfolio.frontier import ParametricFrontier
+from src.utils import instrument
+
+
+def test_disabled_hooks_are_noops():
+    assert not instrument.enabled()
+    assert instrument.stage("x") is instrument.stage("y")  # shared null context
+    instrument.count("x")
+    assert instrument.timed("x")(lambda a: a + 1)(1) == 2
+
+
+def test_session_records_stages_counters_and_sinks(tmp_path):
+    mem = instrument.MemorySink()
+    mu = np.array([0.05, 0.08, 0.12])
+    cov = np.diag([0.01, 0.03, 0.06])
+    y = np.random.default_rng(0).normal(0, 0.01, 200)
+    with instrument.session(mem, instrument.JSONSink(tmp_path / "run.json"),
+                            profile=["inner"], memory=["outer"]) as rec:
+        with instrument.stage("outer"):
+            with instrument.stage("inner"):
+                ParametricFrontier(mu, cov).sweep([0.0, 0.1, 0.5])
+        ARIMAModel(grid_p=[0, 1], grid_d=[0], grid_q=[0]).select_order(y)
+    assert not instrument.enabled()
+
+    s = rec.summary()
+    assert s["counters"]["frontier.qp.solved"] == 2 and s["counters"]["frontier.qp.infeasible"] == 1
+    assert s["counters"]["arima.fit.attempted"] == 2
+    assert {"outer", "outer/inner", "arima.select_order"} <= set(s["stages"])
+    assert s["stages"]["outer"]["peak_kib"] > 0
+
+    inner = next(r for r in mem.records if r.name == "outer/inner")
+    assert "sweep" in inner.profile
+    out = json.loads((tmp_path / "run.json").read_text())
+    assert out["summary"] == mem.summary and len(out["records"]) == 3
+
+
+def test_nested_memory_stages_report_their_own_peaks():
+    with instrument.session(memory=["outer", "inner"]) as rec:
+        with instrument.stage("outer"):
+            big = bytearray(40 * 2 ** 20)
+            del big
+            with instrument.stage("inner"):
+                small = bytearray(2 ** 20)
+                del small
+    peaks = {k: v["peak_kib"] for k, v in rec.summary()["stages"].items()}
+    assert peaks["outer"] >= 40 * 1024  # survives the inner stage's reset of the peak
+    assert 1000 <= peaks["outer/inner"] < 4 * 1024  # relative to the inner stage's start
+
+
+def test_nested_profiled_stage_keeps_the_outer_profile():
+    def work():
+        return sum(i * i for i in range(20000))
+
+    mem = instrument.MemorySink()
+    with instrument.session(mem, profile=["outer", "inner"]) as rec:
+        with instrument.stage("outer"):
+            with instrument.stage("inner"):
+                work()
+            work()
+    by_name = {r.name: r for r in mem.records}
+    assert by_name["outer/inner"].profile is None
+    assert "work" in by_name["outer"].profile  # calls after the inner stage are still profiled
+    assert rec.summary()["counters"]["instrument.profile_skipped"] == 1
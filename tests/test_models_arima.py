@@ -22,3 +22,43 @@ def test_arima_on_ar1():
     assert len(preds) == len(test)
     # just sanity: metric is finite
     assert np.isfinite(Metrics.rmse(test.values, preds))
+
+def test_select_order_parallel_matches_serial():
+    np.random.seed(1)
+    s = pd.Series(np.random.normal(0, 1, 200))
+    grid = dict(grid_p=range(0,2), grid_d=range(0,1), grid_q=range(0,2))
+    serial = ARIMAModel(n_jobs=1, **grid).select_order(s)
+    parallel = ARIMAModel(n_jobs=2, **grid).select_order(s)
+    assert serial == parallel
+
+def test_stepwise_search_avoids_fits():
+    np.random.seed(2)
+    s = pd.Series(np.random.normal(0, 1, 300))
+    m = ARIMAModel(search="stepwise", grid_p=range(0,4), grid_d=range(0,2), grid_q=range(0,4))
+    order = m.select_order(s)
+    assert order[1] == 0  # white noise is stationary, d=1 ruled out by ADF
+    assert m.search_stats["grid_size"] == 32
+    assert m.search_stats["fits_avoided"] > 0
+
+def test_update_extends_without_refit():
+    np.random.seed(3)
+    s = pd.Series(np.random.normal(0, 1, 300))
+    m = ARIMAModel(order=(1,0,0), drift_threshold=None).fit(s.iloc[:295])
+    params = np.asarray(m._fit_res.params).copy()
+    for v in s.iloc[295:]:
+        m.update([v])
+        assert not m.last_update_refit
+    np.testing.assert_allclose(m._fit_res.params, params)
+
+    full = ARIMAModel(order=(1,0,0))._from_params(pd.Series(s.to_numpy()), (1,0,0), params)
+    np.testing.assert_allclose(m.forecast(5), np.asarray(full.get_forecast(5).predicted_mean))
+
+def test_update_refits_on_schedule():
+    np.random.seed(4)
+    s = pd.Series(np.random.normal(0, 1, 260))
+    m = ARIMAModel(order=(1,0,0), refit_every=5, drift_threshold=None).fit(s.iloc[:250])
+    flags = []
+    for v in s.iloc[250:]:
+        m.update([v])
+        flags.append(m.last_update_refit)
+    assert flags == [False]*4 + [True] + [False]*4 + [True]
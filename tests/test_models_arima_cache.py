@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+from src.models.arima_cache import ARIMACache
+from src.models.arima_model import ARIMAModel
+
+def test_cache_hit_skips_fit(tmp_path):
+    np.random.seed(0)
+    s = pd.Series(np.random.normal(0, 1, 200))
+    cache = ARIMACache(tmp_path / "arima")
+    grid = dict(grid_p=range(0,2), grid_d=range(0,1), grid_q=range(0,2))
+
+    m1 = ARIMAModel(cache=cache, **grid).fit(s)
+    m2 = ARIMAModel(cache=cache, **grid).fit(s)
+    assert cache.hits == 1 and cache.misses == 1
+    assert m1.order == m2.order
+    np.testing.assert_allclose(m1.forecast(5), m2.forecast(5))
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ARIMACache(tmp_path, max_entries=2)
+    for i in range(3):
+        cache.put(f"k{i}", (1,0,0), np.array([0.1, 1.0]))
+    assert len(cache) == 2
+    assert cache.get("k0") is None
+
+def test_unusable_entry_counts_as_miss(tmp_path, monkeypatch):
+    s = pd.Series(np.random.default_rng(0).normal(0, 1, 200))
+    cache = ARIMACache(tmp_path / "arima")
+    grid = dict(grid_p=range(0,2), grid_d=range(0,1), grid_q=range(0,1))
+    ARIMAModel(cache=cache, **grid).fit(s)
+    monkeypatch.setattr(ARIMAModel, "_from_params", lambda *a: None)
+    ARIMAModel(cache=cache, **grid).fit(s)
+    assert cache.stats()["hits"] == 0 and cache.stats()["misses"] == 2
+
+def test_reject_only_undoes_the_last_hit(tmp_path):
+    import pytest
+    cache = ARIMACache(tmp_path)
+    cache.put("k", (1,0,0), np.array([0.1, 1.0]))
+    with pytest.raises(ValueError):
+        cache.reject("k")  # no hit yet
+    cache.get("k")
+    cache.reject("k")
+    with pytest.raises(ValueError):
+        cache.reject("k")  # already rejected
+    assert cache.stats()["hits"] == 0 and cache.stats()["misses"] == 1
+
+def test_put_scans_the_folder_only_when_full(tmp_path, monkeypatch):
+    cache = ARIMACache(tmp_path, max_entries=3)
+    scans = []
+    real = ARIMACache._evict
+    monkeypatch.setattr(ARIMACache, "_evict", lambda self: scans.append(1) or real(self))
+    for i in range(3):
+        cache.put(f"k{i}", (1,0,0), np.array([0.1, 1.0]))
+    cache.put("k0", (1,0,0), np.array([0.2, 1.0]))  # overwrite, not a new entry
+    assert scans == []
+    cache.put("k3", (1,0,0), np.array([0.1, 1.0]))
+    assert scans == [1] and len(cache) == 3
@@ -16,3 +16,33 @@ def test_lstm_shapes():
     m.fit(train, epochs=5, batch_size=16, verbose=0)
     preds = m.forecast(train, steps=len(test))
     assert len(preds) == len(test)
+
+
+@pytest.mark.skipif(not TENSORFLOW_AVAILABLE, reason="TensorFlow not available")
+def test_lstm_forecast_batch_matches_predict_loop():
+    s = pd.Series(np.sin(np.linspace(0, 40, 300)) / 100.0)
+    m = LSTMModel(lookback=20, units=8, dropout=0.1)
+    m.fit(s, epochs=2, batch_size=16, verbose=0)
+
+    window = s.to_numpy()[-20:].reshape(1, 20, 1)
+    loop = []
+    for _ in range(10):
+        yhat = float(m.model.predict(window, verbose=0)[0, 0])
+        loop.append(yhat)
+        window = np.concatenate([window[:, 1:], [[[yhat]]]], axis=1)
+
+    batch = m.forecast_batch([s, s.iloc[:-5]], steps=10)
+    assert batch.shape == (2, 10)
+    np.testing.assert_allclose(batch[0], loop, rtol=1e-5, atol=1e-7)
+    assert m.forecast_batch([s], steps=10, mc_samples=4).shape == (1, 4, 10)
+
+
+@pytest.mark.skipif(not TENSORFLOW_AVAILABLE, reason="TensorFlow not available")
+def test_lstm_stream_shuffles_training_windows_only():
+    m = LSTMModel(lookback=5, units=4)
+    tr = np.arange(200, dtype=np.float32).reshape(-1, 1)
+    train_ds, val_ds = m._streams(tr, batch_size=16, validation_split=0.2)
+    starts = np.concatenate([x[:, 0, 0].numpy() for x, _ in train_ds])
+    val_starts = np.concatenate([x[:, 0, 0].numpy() for x, _ in val_ds])
+    assert sorted(starts) == list(range(len(starts))) and not np.all(np.diff(starts) > 0)
+    assert np.all(np.diff(val_starts) == 1)
@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.models.windows import WindowBatches, make_windows
+
+
+def _loop_windows(arr, lookback, horizon):
+    X, y = [], []
+    for i in range(len(arr) - lookback - horizon + 1):
+        X.append(arr[i:i + lookback])
+        y.append(arr[i + lookback:i + lookback + horizon, 0])
+    return np.array(X), np.array(y)
+
+
+def test_make_windows_matches_loop_and_is_a_view():
+    arr = np.random.default_rng(0).normal(size=(50, 3))
+    X, y = make_windows(arr, lookback=7, horizon=3, target=0)
+    Xl, yl = _loop_windows(arr, 7, 3)
+    np.testing.assert_array_equal(X, Xl)
+    np.testing.assert_array_equal(y, yl)
+    assert np.shares_memory(X, arr) and np.shares_memory(y, arr)
+
+    _, y2 = make_windows(arr, lookback=7, horizon=3, target=[0, 2])
+    assert y2.shape == (len(X), 3, 2)
+    np.testing.assert_array_equal(y2[:, :, 1], make_windows(arr, 7, 3, target=2)[1])
+    assert not np.shares_memory(y2, arr)  # non-contiguous columns: copied
+    _, y3 = make_windows(arr, lookback=7, horizon=3, target=[1, 2])
+    assert np.shares_memory(y3, arr)
+    np.testing.assert_array_equal(y3, make_windows(arr, 7, 3, target=[-2, -1])[1])
+
+    X0, y0 = make_windows(arr[:5], lookback=7)
+    assert X0.shape == (0, 7, 3) and y0.shape == (0, 1)
+
+
+def test_window_batches_cover_all_windows():
+    arr = np.arange(100, dtype=float)
+    X, y = make_windows(arr, lookback=10, horizon=2)
+    batches = WindowBatches(arr, lookback=10, horizon=2, batch_size=16, dtype=np.float64)
+    Xs, ys = zip(*batches)
+    assert len(batches) == len(Xs)
+    np.testing.assert_array_equal(np.concatenate(Xs), X)
+    np.testing.assert_array_equal(np.concatenate(ys), y)
+
+    shuffled = WindowBatches(arr, lookback=10, horizon=2, batch_size=16, shuffle=True, seed=1, dtype=np.float64)
+    ys = np.concatenate([b[1] for b in shuffled])
+    np.testing.assert_array_equal(np.sort(ys[:, 0]), y[:, 0])
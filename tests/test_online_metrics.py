@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+
+from src.utils.metrics import Metrics
+from src.utils.online import OnlineRiskMetrics, P2Quantile
+
+
+def test_expanding_metrics_within_documented_tolerance():
+    rng = np.random.default_rng(0)
+    r = rng.normal(0.0005, 0.01, 3000)
+    om = OnlineRiskMetrics(alpha=0.95, rf_annual=0.02).update_many(r)
+    assert np.isclose(om.sharpe(), Metrics.sharpe_ratio(r, 0.02), rtol=1e-9)
+    v = Metrics.historical_var(r, 0.95)
+    assert abs(om.var() - v) < 0.1 * r.std()
+    assert np.isclose(om.cvar(), r[r <= v].mean(), rtol=0.1)
+
+    wealth = np.cumprod(1 + r)
+    dd = 1 - wealth / np.maximum.accumulate(np.maximum(wealth, 1.0))
+    assert np.isclose(om.max_drawdown, dd.max()) and np.isclose(om.drawdown, dd[-1])
+
+    p2 = P2Quantile(0.5)
+    for x in r[:4]:
+        p2.add(x)
+    assert np.isclose(p2.value(), np.median(r[:4]))
+
+
+def test_rolling_metrics_exact_and_snapshot_restore():
+    rng = np.random.default_rng(1)
+    r = rng.standard_t(4, 1000) * 0.01
+    om = OnlineRiskMetrics(window=100).update_many(r[:600])
+    state = json.loads(json.dumps(om.snapshot()))
+    restored = OnlineRiskMetrics.restore(state).update_many(r[600:])
+    om.update_many(r[600:])
+
+    tail = r[-100:]
+    v = Metrics.historical_var(tail, 0.95)
+    assert np.isclose(om.sharpe(), Metrics.sharpe_ratio(tail), rtol=1e-9)
+    assert om.var() == v and np.isclose(om.cvar(), tail[tail <= v].mean())
+    assert restored.summary() == om.summary()
+
+    ex = OnlineRiskMetrics().update_many(r[:500])
+    ex2 = OnlineRiskMetrics.restore(ex.snapshot()).update_many(r[500:])
+    assert ex2.summary() == ex.update_many(r[500:]).summary()
+
+    sk = OnlineRiskMetrics(exact_n=200).update_many(r[:500])  # past exact_n: sketch state
+    sk2 = OnlineRiskMetrics.restore(json.loads(json.dumps(sk.snapshot()))).update_many(r[500:])
+    assert sk2.summary() == sk.update_many(r[500:]).summary()
+
+
+def test_expanding_var_cvar_bound_holds_for_fat_tails():
+    # the documented bound: VaR within 0.15 x std, CVaR within 10%, across seeds
+    for df in (3, 4):
+        for seed in range(25):
+            r = np.random.default_rng(seed).standard_t(df, 3000) * 0.01
+            om = OnlineRiskMetrics().update_many(r)
+            v = Metrics.historical_var(r, 0.95)
+            assert abs(om.var() - v) < 0.15 * r.std(), (df, seed)
+            assert np.isclose(om.cvar(), r[r <= v].mean(), rtol=0.1), (df, seed)
+        exact = OnlineRiskMetrics().update_many(r[:1000])
+        v = Metrics.historical_var(r[:1000], 0.95)
+        assert exact.var() == v and np.isclose(exact.cvar(), r[:1000][r[:1000] <= v].mean())
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from src.config import Settings
+from src.data_loader import DataLoader
+from src.forecast import ForecastRequest
+from src.pipeline import Pipeline, PipelineConfig, StageCache, build_pipeline
+
+
+def _write_raw(cfg, seed=0):
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2022-01-03", "2024-10-31")
+    dl = DataLoader(cfg)
+    for i, t in enumerate(cfg.tickers):
+        px = 100 * np.cumprod(1 + rng.normal(0.0004 * (i + 1), 0.01 * (i + 1), len(idx)))
+        dl._write_cache(t, pd.DataFrame({"Date": idx, "Open": px, "High": px, "Low": px, "Close": px,
+                                         "Adj Close": px, "Volume": 1e6}))
+
+
+def test_pipeline_memoizes_and_reruns_only_changed_stages(tmp_path):
+    cfg = Settings(tickers=["TSLA", "BND", "SPY"], risk_free_rate=0.0, data_raw_dir=tmp_path / "raw",
+                   data_processed_dir=tmp_path / "processed", reports_figures_dir=tmp_path / "figs",
+                   cache_dir=tmp_path / "cache")
+    _write_raw(cfg)
+    opts = PipelineConfig(forecast=ForecastRequest(steps=21, grid_p=range(0, 2), grid_d=range(0, 1),
+                                                   grid_q=range(0, 1)))
+    cache = StageCache(cfg.cache_dir)
+
+    first = Pipeline(build_pipeline(cfg, opts), cache).run()
+    assert set(first.status.values()) == {"ran"}
+    assert list(first["backtest"].stats.index) == ["strategy", "benchmark"]
+    assert abs(sum(first["optimize"]["weights"].values()) - 1) < 1e-6
+    assert (cfg.reports_figures_dir / "efficient_frontier.png").exists()
+
+    again = Pipeline(build_pipeline(cfg, opts), cache).run(force=["covariance", "forecast:TSLA"])
+    assert again.status["covariance"] == again.status["forecast:TSLA"] == "ran"
+    # same outputs, so dependents stay cached
+    assert {s for n, s in again.status.items() if n not in ("covariance", "forecast:TSLA")} == {"cached"}
+
+    shrunk = PipelineConfig(forecast=opts.forecast, cov_method="ledoit_wolf")
+    changed = Pipeline(build_pipeline(cfg, shrunk), cache).run(targets=["optimize"])
+    assert changed.status == {"load": "cached", "features": "cached", "forecast:TSLA": "cached",
+                              "forecast:BND": "cached", "forecast:SPY": "cached",
+                              "expected_returns": "cached", "covariance": "ran", "optimize": "ran"}
+
+    (cfg.reports_figures_dir / "efficient_frontier.png").unlink()
+    redraw = Pipeline(build_pipeline(cfg, opts), cache).run()
+    assert redraw.status["plot"] == "ran" and redraw.status["backtest"] == "cached"
+    assert (cfg.reports_figures_dir / "efficient_frontier.png").exists()
+
+    _write_raw(cfg, seed=1)
+    assert Pipeline(build_pipeline(cfg, opts), cache).run(targets=["features"]).status == \
+        {"load": "ran", "features": "ran"}
+
+
+def test_failed_forecast_fails_the_stage_and_is_not_cached(tmp_path, monkeypatch):
+    import pytest
+    from src import batch_forecast
+
+    cfg = Settings(tickers=["TSLA", "BND", "SPY"], data_raw_dir=tmp_path / "raw",
+                   data_processed_dir=tmp_path / "processed", reports_figures_dir=tmp_path / "figs",
+                   cache_dir=tmp_path / "cache")
+    _write_raw(cfg)
+
+    def boom(self, *a, **k):
+        raise ValueError("no convergence")
+
+    monkeypatch.setattr(batch_forecast.ARIMAForecaster, "fit", boom)
+    with pytest.raises(RuntimeError, match="TSLA failed"):
+        Pipeline(build_pipeline(cfg), StageCache(cfg.cache_dir), max_workers=1).run(targets=["forecast:TSLA"])
+    assert not (cfg.cache_dir / "forecast__TSLA").exists()
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+from sklearn.covariance import ledoit_wolf
+from src.portfolio.covariance import CovarianceEstimator
+from src.portfolio.optimizer import PortfolioOptimizer
+
+def _rets(n=300, p=8, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, p)) * rng.uniform(0.005, 0.03, p)
+    return pd.DataFrame(X, columns=[f"A{i}" for i in range(p)])
+
+def test_ledoit_wolf_matches_sklearn():
+    r = _rets()
+    np.testing.assert_allclose(CovarianceEstimator.ledoit_wolf(r).to_numpy(),
+                               ledoit_wolf(r.to_numpy())[0], rtol=1e-10)
+
+def test_factor_model_quad_and_missing_data():
+    r = _rets()
+    r.iloc[:100, 2] = np.nan  # late listing
+    fc = CovarianceEstimator.factor(r, k=3)
+    assert fc.loadings.shape == (8, 3)
+    w = np.full(8, 1 / 8)
+    assert abs(fc.quad(w) - w @ fc.to_frame().to_numpy() @ w) < 1e-12
+
+    rets = r.add_suffix("_ret")
+    tickers = list(r.columns)
+    opt = PortfolioOptimizer()
+    for method in ("pairwise", "ledoit_wolf", "ewma", "factor"):
+        cov = opt.build_covariance(rets, tickers, method=method)
+        assert cov.shape == (8, 8) and np.isfinite(cov.to_numpy()).all()
+        assert np.linalg.eigvalsh(cov.to_numpy()).min() > 0
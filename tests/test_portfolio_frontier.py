@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+from pypfopt import EfficientFrontier
+from src.portfolio.frontier import ParametricFrontier
+
+def test_parametric_frontier_matches_pypfopt():
+    rng = np.random.default_rng(0)
+    n = 12
+    X = rng.normal(size=(600, n)) * rng.uniform(0.005, 0.03, n) + rng.uniform(0, 0.001, n)
+    mu = pd.Series(X.mean(0) * 252)
+    S = pd.DataFrame(np.cov(X.T) * 252)
+    targets = np.linspace(mu.min(), mu.max(), 40)
+
+    W, status = ParametricFrontier(mu.values, S.values).sweep(targets)
+    assert status.count("optimal") == len(targets)
+    np.testing.assert_allclose(W.sum(axis=1), 1.0, atol=1e-9)
+
+    t = targets[25]
+    ef = EfficientFrontier(mu, S)
+    ef.efficient_return(target_return=t)
+    _, vol, _ = ef.portfolio_performance()
+    assert abs(np.sqrt(W[25] @ S.values @ W[25]) - vol) < 1e-5
+
+def test_parametric_frontier_reports_infeasible():
+    mu = np.array([0.05, 0.10, 0.20])
+    S = np.diag([0.01, 0.04, 0.09])
+    W, status = ParametricFrontier(mu, S, weight_bounds=(0.0, 0.5)).sweep([0.05, 0.15, 0.2])
+    assert status == ["optimal", "optimal", "infeasible"]
+    assert np.isnan(W[2]).all()
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from src.backtest.backtester import Backtester, BacktestConfig
+from src.portfolio.rolling import RollingConfig, RollingMoments, RollingOptimizer
+
+def _rets(n=400):
+    np.random.seed(0)
+    idx = pd.date_range("2022-01-03", periods=n, freq="B")
+    return pd.DataFrame({
+        "TSLA_ret": np.random.normal(0.001, 0.03, n),
+        "BND_ret":  np.random.normal(0.0002, 0.003, n),
+        "SPY_ret":  np.random.normal(0.0006, 0.01, n),
+    }, index=idx)
+
+def test_rolling_moments_match_pandas():
+    X = _rets().to_numpy()
+    mom = RollingMoments(3)
+    for i, x in enumerate(X):
+        mom.add(x)
+        if i >= 100:
+            mom.remove(X[i - 100])
+    ref = pd.DataFrame(X[-100:])
+    np.testing.assert_allclose(mom.cov(), ref.cov().to_numpy(), rtol=1e-9)
+    np.testing.assert_allclose(mom.mean(), ref.mean().to_numpy(), rtol=1e-9)
+
+def test_rolling_weights_feed_backtester():
+    rets = _rets()
+    cfg = RollingConfig(window=126, freq="M", objective="min_volatility")
+    W = RollingOptimizer(cfg=cfg).run(rets, ["TSLA","BND","SPY"])
+    assert len(W) > 5
+    np.testing.assert_allclose(W.sum(axis=1), 1.0, atol=1e-4)  # clean_weights rounds
+
+    R = rets.rename(columns=lambda c: c.replace("_ret", ""))
+    bt = Backtester(R, BacktestConfig(start=str(R.index[0].date()), end=str(R.index[-1].date())))
+    res = bt.run_schedule(W)
+    assert res.daily.index[0] > W.index[0]
+    assert (res.turnover["strategy"] > 0).sum() >= 1
@@ -0,0 +1,43 @@
+import pickle
+import numpy as np
+import pandas as pd
+
+from src.backtest.backtester import Backtester, BacktestConfig
+from src.portfolio.optimizer import PortfolioOptimizer
+from src.shared import SharedReturns
+
+
+def _returns(n=300):
+    rng = np.random.default_rng(1)
+    idx = pd.bdate_range("2024-01-01", periods=n)
+    return pd.DataFrame(rng.normal(0.0005, 0.01, (n, 3)), index=idx, columns=["TSLA", "BND", "SPY"])
+
+
+def test_shared_returns_zero_copy_and_pickles_by_path(tmp_path):
+    df = _returns()
+    store = SharedReturns.create(df, tmp_path / "rets")
+    frame = store.to_frame()
+    pd.testing.assert_frame_equal(frame, df, check_names=False, check_freq=False)
+    assert np.shares_memory(frame.to_numpy(), store.values)
+    assert np.shares_memory(store["SPY"].to_numpy(), store.values)
+
+    blob = pickle.dumps(store)
+    assert len(blob) < 500
+    again = pickle.loads(blob)
+    np.testing.assert_array_equal(again.values, store.values)
+
+
+def test_consumers_accept_shared_store(tmp_path):
+    df = _returns()
+    store = SharedReturns.create(df, tmp_path / "rets")
+    cfg = BacktestConfig(start="2024-01-01", end="2025-01-01", rebalance="monthly")
+    w = {"TSLA": 0.2, "BND": 0.3, "SPY": 0.5}
+    a = Backtester(df, cfg).run(w).stats
+    b = Backtester(store, cfg).run(w).stats
+    pd.testing.assert_frame_equal(a, b)
+
+    feats = df.add_suffix("_ret")
+    fstore = SharedReturns.create(feats, tmp_path / "feats")
+    opt = PortfolioOptimizer()
+    pd.testing.assert_frame_equal(opt.build_covariance(feats, list(df.columns)),
+                                  opt.build_covariance(fstore, list(df.columns)), check_names=False)
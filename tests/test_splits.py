@@ -1,5 +1,5 @@
 import pandas as pd
-from src.splits import TimeSeriesSplitter
+from src.splits import TimeSeriesSplitter, RollingOriginSplitter
 
 def test_splitter_basic():
     idx = pd.date_range("2023-12-20", periods=30, freq="D")
@@ -8,3 +8,12 @@ def test_splitter_basic():
     train, test = sp.split(s)
     assert train.index.max() <= pd.Timestamp("2023-12-31")
     assert test.index.min() >= pd.Timestamp("2024-01-01")
+
+def test_rolling_origin_folds():
+    idx = pd.date_range("2024-01-01", periods=100, freq="D")
+    s = pd.Series(range(100), index=idx, dtype=float)
+    exp = RollingOriginSplitter(initial=50, horizon=10, step=10).split(s)
+    assert len(exp) == 5
+    assert all(len(tr) == 50 + 10*i for i, (tr, _) in enumerate(exp))
+    slide = RollingOriginSplitter(initial=50, horizon=10, step=10, window="sliding").split(s)
+    assert all(len(tr) == 50 and tr.index.max() < te.index.min() for tr, te in slide)
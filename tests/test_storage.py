@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.config import Settings
+from src.data_loader import DataLoader
+from src.storage import ParquetStore
+
+
+def _prices(n=600):
+    rng = np.random.default_rng(0)
+    px = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    return pd.DataFrame({
+        "Date": pd.bdate_range("2020-01-01", periods=n),
+        "Open": px, "High": px, "Low": px, "Close": px, "Adj Close": px * 0.99,
+        "Volume": rng.integers(100, 1000, n),
+    })
+
+
+def test_parquet_store_roundtrip_projection_and_range(tmp_path):
+    store = ParquetStore(tmp_path)
+    df = _prices()
+    store.write("SPY", df)
+    full = store.read("SPY")
+    assert full["Adj Close"].dtype == np.float64
+    np.testing.assert_allclose(full["Adj Close"], df["Adj Close"])
+
+    part = store.read("SPY", columns=["Adj Close"], start="2021-01-01", end="2021-06-30")
+    assert list(part.columns) == ["Date", "Adj Close"]
+    assert part["Date"].min() >= pd.Timestamp("2021-01-01")
+    assert part["Date"].max() <= pd.Timestamp("2021-06-30")
+
+    store.write("BND", df)
+    many = store.read_many(["BND"], columns=["Close"], start="2021-01-01")
+    assert set(many["Ticker"]) == {"BND"} and len(many) == (df["Date"] >= "2021-01-01").sum()
+
+
+def test_migrate_csv_cache_matches_csv_loader(tmp_path):
+    cfg = Settings(data_raw_dir=tmp_path / "raw", data_processed_dir=tmp_path / "processed",
+                   reports_figures_dir=tmp_path / "figs")
+    cfg.data_raw_dir.mkdir(parents=True)
+    for t in cfg.tickers:
+        _prices().to_csv(cfg.data_raw_dir / f"{t}.csv", index=False)
+    csv_frames = DataLoader(cfg).load_all()
+
+    pq_cfg = Settings(data_raw_dir=cfg.data_raw_dir, data_processed_dir=cfg.data_processed_dir,
+                      reports_figures_dir=cfg.reports_figures_dir, data_format="parquet")
+    dl = DataLoader(pq_cfg)
+    dl.migrate_to_parquet()
+    for t, frame in dl.load_all().items():
+        pd.testing.assert_frame_equal(frame, csv_frames[t], check_dtype=False)